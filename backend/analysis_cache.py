@@ -0,0 +1,252 @@
+"""
+Resume Analysis Cache
+
+This module provides a content-addressed cache for resume analysis results.
+Entries are keyed by the SHA-256 of the uploaded file plus a version stamp,
+and stored in a bounded in-memory LRU tier backed by an on-disk tier that
+every worker process on the host shares. Results hold personal data, so both
+tiers can expire entries after a TTL, and the disk tier is pruned to a byte
+budget, least recently used first.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from skill_keywords import ALL_KEYWORDS
+
+
+# The disk tier is pruned after this many writes by a process
+DISK_PRUNE_INTERVAL = 64
+
+
+def get_vocabulary_fingerprint() -> str:
+    """
+    Get a short hash of the skill vocabulary.
+
+    Any change to skill_keywords produces a new fingerprint, so results
+    computed with an older vocabulary are never served from the cache.
+
+    Returns:
+        str: Hex fingerprint of the keyword sets
+    """
+    digest = hashlib.sha256()
+    for name in sorted(ALL_KEYWORDS):
+        digest.update(name.encode('utf-8'))
+        for keyword in sorted(ALL_KEYWORDS[name]):
+            digest.update(b'\0' + keyword.encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+class AnalysisCache:
+    """Two-tier (memory LRU + shared disk) cache of analysis results."""
+
+    def __init__(self, version: str, cache_dir: Optional[str] = None, max_entries: int = 256,
+                 disk_max_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            version (str): Analyzer/vocabulary stamp included in every key
+            cache_dir (str, optional): Directory of the disk tier, disabled if None
+            max_entries (int): Maximum number of results kept in memory
+            disk_max_bytes (int, optional): Size the disk tier is pruned to, unbounded if None
+            ttl_seconds (float, optional): Age after which entries expire from both tiers,
+                never if None
+        """
+        self.version = version
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        # Key -> (monotonic time stored, result)
+        self._memory: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'memory_hits': 0, 'disk_hits': 0, 'disk_pruned': 0}
+        self._writes_since_prune = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.prune()
+
+    def make_key(self, content: bytes) -> str:
+        """
+        Build the cache key for an uploaded file.
+
+        Args:
+            content (bytes): Raw file content
+
+        Returns:
+            str: Content hash combined with the version stamp
+        """
+        return f"{hashlib.sha256(content).hexdigest()}-{self.version}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a result, checking memory first and then disk.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached result or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                stored_at, data = self._memory[key]
+                if self._expired(time.monotonic() - stored_at):
+                    del self._memory[key]
+                else:
+                    self._memory.move_to_end(key)
+                    self._stats['hits'] += 1
+                    self._stats['memory_hits'] += 1
+                    return data
+
+        data = self._read_disk(key)
+
+        with self._lock:
+            if data is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            self._stats['disk_hits'] += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Store a result in both tiers.
+
+        Args:
+            key (str): Cache key from make_key
+            data (Dict[str, Any]): JSON-serializable analysis result
+        """
+        with self._lock:
+            self._remember(key, data)
+            self._writes_since_prune += 1
+            prune = self._writes_since_prune >= DISK_PRUNE_INTERVAL
+            if prune:
+                self._writes_since_prune = 0
+        self._write_disk(key, data)
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Remove expired disk entries, then the least recently used ones until
+        the disk tier fits in disk_max_bytes.
+
+        Recency is the file modification time, which disk hits refresh, so
+        pruning sees the reads of every process sharing the directory.
+
+        Returns:
+            int: Number of entries removed
+        """
+        if not self.cache_dir or (self.ttl_seconds is None and self.disk_max_bytes is None):
+            return 0
+
+        now = time.time()
+        removed = 0
+        entries = []
+        # Only the two-character shard directories; other files may share the directory
+        for path in self.cache_dir.glob('??/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if self._expired(now - stat.st_mtime):
+                removed += self._remove_disk(path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        if self.disk_max_bytes is not None:
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.disk_max_bytes:
+                    break
+                removed += self._remove_disk(path)
+                total_bytes -= size
+
+        with self._lock:
+            self._stats['disk_pruned'] += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the hit/miss counters of this process.
+
+        Returns:
+            Dict[str, int]: Counters and current memory tier size
+        """
+        with self._lock:
+            return {**self._stats, 'memory_entries': len(self._memory)}
+
+    def _expired(self, age_seconds: float) -> bool:
+        """Check whether an entry of this age is past the TTL."""
+        return self.ttl_seconds is not None and age_seconds > self.ttl_seconds
+
+    def _remember(self, key: str, data: Dict[str, Any]) -> None:
+        """Insert into the memory tier, evicting the least recently used entries."""
+        self._memory[key] = (time.monotonic(), data)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        """Get the file holding a key, sharded by the first hash characters."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read an entry from the disk tier, treating unreadable and expired files as misses."""
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                if self._expired(time.time() - os.fstat(cache_file.fileno()).st_mtime):
+                    self._remove_disk(path)
+                    return None
+                data = json.load(cache_file)
+            # Mark the entry as recently used for pruning
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def _remove_disk(self, path: Path) -> int:
+        """Delete a disk entry, returning 1 if this call removed it."""
+        try:
+            path.unlink()
+            return 1
+        except OSError:
+            return 0
+
+    def _write_disk(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Write an entry to the disk tier.
+
+        The entry is written to a temporary file and renamed into place, so
+        other processes never read a partially written file.
+        """
+        if not self.cache_dir:
+            return
+
+        path = self._disk_path(key)
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent, suffix='.tmp', delete=False) as temp_file:
+                temp_path = temp_file.name
+                json.dump(data, temp_file)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            # The disk tier is best effort; the memory tier still holds the entry
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
@@ -0,0 +1,298 @@
+"""
+Asynchronous Resume Analysis Jobs
+
+This module runs resume analyses in a local thread pool so the HTTP request
+that submits a file can return at once with a job id. Job state records the
+current pipeline stage, is kept for a limited time after the job finishes,
+and the number of jobs waiting to run is capped.
+
+Job state lives in files under a state directory, so with several worker
+processes sharing the directory any process can answer a status poll and
+the queue cap counts the jobs of every process. A job runs in the process
+that accepted it, which keeps the job's files fresh while it waits or runs.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+
+logger = logging.getLogger(__name__)
+
+_JOB_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+
+class JobQueueFull(Exception):
+    """Raised when the maximum number of queued jobs is reached."""
+
+
+@dataclass
+class AnalysisJob:
+    """State of one resume analysis job."""
+    job_id: str
+    filename: str
+    stages: Sequence[str]
+    status: str = 'queued'
+    stage: Optional[str] = None
+    completed_stages: List[str] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the job to a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Job status, progress and, once finished, its result or error
+        """
+        return {
+            'job_id': self.job_id,
+            'filename': self.filename,
+            'status': self.status,
+            'progress': {
+                'stage': self.stage,
+                'completed_stages': list(self.completed_stages),
+                'total_stages': len(self.stages),
+                'percent': round(100 * len(self.completed_stages) / len(self.stages)) if self.stages else 100
+            },
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at
+        }
+
+
+class AnalysisJobManager:
+    """Queue of resume analysis jobs run by a thread pool, with state shared through files."""
+
+    def __init__(self, run: Callable[[bytes, str, Callable[[str], None]], Dict[str, Any]],
+                 stages: Sequence[str], workers: int = 2, max_queued: int = 32, ttl_seconds: float = 900,
+                 state_dir: Optional[str] = None):
+        """
+        Initialize the job manager.
+
+        Args:
+            run (Callable): Analysis function called as run(content, filename, progress). It
+                returns the result dict, or a dict with 'error': True and a 'message'
+            stages (Sequence[str]): Stage names reported by run, in order
+            workers (int): Number of analysis threads
+            max_queued (int): Maximum number of jobs waiting to start, across every
+                process sharing state_dir
+            ttl_seconds (float): How long finished jobs are kept before eviction; also how
+                long a waiting or running job's files may go without a refresh before its
+                process is presumed dead
+            state_dir (str, optional): Directory of job state shared by all worker processes,
+                a private temporary directory (single process only) if None
+        """
+        self.run = run
+        self.stages = tuple(stages)
+        self.max_queued = max_queued
+        self.ttl_seconds = ttl_seconds
+        self.state_dir = Path(state_dir or tempfile.mkdtemp(prefix='resume-jobs-'))
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='resume-job')
+
+        # Ids of this process's queued and running jobs, whose files the
+        # heartbeat thread refreshes so other processes do not evict them
+        self._active: Set[str] = set()
+        self._active_lock = threading.Lock()
+        threading.Thread(target=self._heartbeat, name='resume-job-heartbeat', daemon=True).start()
+
+    def submit(self, content: bytes, filename: str) -> AnalysisJob:
+        """
+        Enqueue an analysis job.
+
+        Args:
+            content (bytes): Raw file content
+            filename (str): Original file name
+
+        Returns:
+            AnalysisJob: The queued job
+
+        Raises:
+            JobQueueFull: If max_queued jobs are already waiting
+        """
+        self._evict_expired()
+        job = AnalysisJob(job_id=uuid.uuid4().hex, filename=filename, stages=self.stages)
+
+        # One marker file per waiting job, so counting them needs no job file reads.
+        # The marker is created before counting, so concurrent submits in any
+        # process count each other and the cap is never exceeded.
+        marker = self._marker(job.job_id)
+        os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        queued = sum(1 for _ in self.state_dir.glob('*.queued'))
+        if queued > self.max_queued:
+            self._remove(marker)
+            raise JobQueueFull(f"{queued - 1} jobs are already queued")
+
+        with self._active_lock:
+            self._active.add(job.job_id)
+        try:
+            self._save(job)
+            self._executor.submit(self._run_job, job, content)
+        except BaseException:
+            self._finish(job.job_id)
+            raise
+        return job
+
+    def add_completed(self, filename: str, result: Dict[str, Any]) -> AnalysisJob:
+        """
+        Record a job whose result is already known, e.g. from a cache.
+
+        Args:
+            filename (str): Original file name
+            result (Dict[str, Any]): Analysis result
+
+        Returns:
+            AnalysisJob: The completed job
+        """
+        self._evict_expired()
+        job = AnalysisJob(job_id=uuid.uuid4().hex, filename=filename, stages=self.stages,
+                          status='completed', completed_stages=list(self.stages),
+                          result=result, finished_at=time.time())
+        self._save(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a snapshot of a job, whichever process runs it.
+
+        Args:
+            job_id (str): Job id returned by submit
+
+        Returns:
+            Optional[Dict[str, Any]]: Job dictionary, or None if unknown or evicted
+        """
+        if not _JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+
+        try:
+            with open(self._path(job_id), 'r', encoding='utf-8') as job_file:
+                if self._expired(os.fstat(job_file.fileno()).st_mtime):
+                    return None
+                return AnalysisJob(**json.load(job_file)).to_dict()
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _run_job(self, job: AnalysisJob, content: bytes) -> None:
+        """Run a job on a pool thread, logging any failure to record its state."""
+        try:
+            self._execute(job, content)
+        except Exception:
+            logger.exception(f"Could not record the state of analysis job {job.job_id}")
+        finally:
+            self._finish(job.job_id)
+
+    def _execute(self, job: AnalysisJob, content: bytes) -> None:
+        """Run a job, recording its progress and outcome."""
+        def progress(stage: str) -> None:
+            if job.stage and job.stage not in job.completed_stages:
+                job.completed_stages.append(job.stage)
+            job.stage = stage
+            self._save(job)
+
+        job.status = 'running'
+        self._save(job)
+        self._remove(self._marker(job.job_id))
+
+        try:
+            result = self.run(content, job.filename, progress)
+        except Exception as e:
+            result = {'error': True, 'message': str(e)}
+
+        if result.get('error', False):
+            job.status = 'failed'
+            job.error = result.get('message')
+        else:
+            job.status = 'completed'
+            job.result = result
+            job.completed_stages = list(self.stages)
+        job.stage = None
+        job.finished_at = time.time()
+        self._save(job)
+
+    def _finish(self, job_id: str) -> None:
+        """Stop refreshing a job's files and drop its marker if it never started."""
+        with self._active_lock:
+            self._active.discard(job_id)
+        self._remove(self._marker(job_id))
+
+    def _heartbeat(self) -> None:
+        """Refresh the files of this process's unfinished jobs well within the TTL."""
+        interval = max(self.ttl_seconds / 4, 0.1)
+        while True:
+            time.sleep(interval)
+            with self._active_lock:
+                job_ids = list(self._active)
+            for job_id in job_ids:
+                for path in (self._path(job_id), self._marker(job_id)):
+                    try:
+                        os.utime(path)
+                    except OSError:
+                        pass
+
+    def _path(self, job_id: str) -> Path:
+        """Get the state file of a job."""
+        return self.state_dir / f"{job_id}.json"
+
+    def _marker(self, job_id: str) -> Path:
+        """Get the marker file that exists while a job waits to start."""
+        return self.state_dir / f"{job_id}.queued"
+
+    def _save(self, job: AnalysisJob) -> None:
+        """
+        Write a job's state file.
+
+        The state is written to a temporary file and renamed into place, so
+        other processes never read a partially written file. Only the
+        process running a job writes its state.
+        """
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.state_dir, suffix='.tmp', delete=False) as temp_file:
+                temp_path = temp_file.name
+                json.dump(asdict(job), temp_file)
+            os.replace(temp_path, self._path(job.job_id))
+        except BaseException:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _expired(self, mtime: float) -> bool:
+        """Check whether a state file last written at mtime is past the TTL."""
+        return mtime < time.time() - self.ttl_seconds
+
+    def _evict_expired(self) -> None:
+        """
+        Delete state files and markers not written for longer than the TTL.
+
+        A finished job's file was last written when it finished. The files of
+        a queued or running job are refreshed by its process's heartbeat, so
+        ones this old belong to a process that died.
+        """
+        for path in self.state_dir.iterdir():
+            try:
+                if self._expired(path.stat().st_mtime):
+                    self._remove(path)
+            except OSError:
+                continue
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        """Delete a file another process may already have deleted."""
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -25,6 +25,7 @@ from werkzeug.utils import secure_filename
 
 # Import the resume analyzer, skill gap analysis, and job roles
 from resume_analyzer import create_analyze_resume_endpoint, get_sample_resume_data
+from batch_analysis import create_batch_analysis_endpoint
 from skill_gap_analysis import create_skill_gap_analysis_endpoint, get_sample_skill_gap_analysis
 from job_roles import create_job_roles_endpoint, get_sample_job_roles
 from skill_library import get_skill_library, search_skills, validate_skills, get_all_skills
@@ -53,6 +54,62 @@ def create_app() -> Flask:
     # Allowed resume file extensions
     app.config["ALLOWED_RESUME_EXTENSIONS"] = {"pdf", "doc", "docx"}
 
+    # Resume analysis cache: results are keyed by file content, kept in a
+    # per-process LRU and in backend/cache/ shared by all worker processes.
+    app.config["RESUME_CACHE_DIR"] = os.getenv("RESUME_CACHE_DIR", str(base_dir / "cache"))
+    app.config["RESUME_CACHE_MAX_ENTRIES"] = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "256"))
+    # Results contain personal data: entries expire after RESUME_CACHE_TTL_SECONDS
+    # (default 7 days) and the disk tier is pruned, least recently used first,
+    # to RESUME_CACHE_DISK_MAX_BYTES (default 512 MB). 0 disables either bound.
+    app.config["RESUME_CACHE_TTL_SECONDS"] = float(os.getenv("RESUME_CACHE_TTL_SECONDS", str(7 * 24 * 3600))) or None
+    app.config["RESUME_CACHE_DISK_MAX_BYTES"] = int(os.getenv("RESUME_CACHE_DISK_MAX_BYTES", str(512 * 1024 * 1024))) or None
+
+    # Uploads up to this many bytes are parsed in memory; larger ones are
+    # spooled to a temporary file while they are parsed.
+    app.config["RESUME_SPOOL_MAX_SIZE"] = int(os.getenv("RESUME_SPOOL_MAX_SIZE", str(2 * 1024 * 1024)))
+
+    # Parallel PDF extraction is off unless RESUME_PDF_WORKERS is above 1;
+    # shorter PDFs than the page threshold are always extracted serially.
+    app.config["RESUME_PDF_WORKERS"] = int(os.getenv("RESUME_PDF_WORKERS", "0"))
+    app.config["RESUME_PDF_PARALLEL_MIN_PAGES"] = int(os.getenv("RESUME_PDF_PARALLEL_MIN_PAGES", "6"))
+
+    # Streaming PDF extraction reads one page at a time and releases it before
+    # the next; the optional budgets cap how many pages and characters are read.
+    app.config["RESUME_PDF_STREAMING"] = os.getenv("RESUME_PDF_STREAMING", "0") == "1"
+    app.config["RESUME_PDF_MAX_PAGES"] = int(os.getenv("RESUME_PDF_MAX_PAGES", "0")) or None
+    app.config["RESUME_PDF_MAX_CHARS"] = int(os.getenv("RESUME_PDF_MAX_CHARS", "0")) or None
+
+    # Total seconds allowed per analysis; once spent, optional stages (skill
+    # levels, context, distribution, NER name) are skipped and flagged in
+    # processing_metadata.degraded_stages. 0 disables the budget.
+    app.config["RESUME_TIME_BUDGET_SECONDS"] = float(os.getenv("RESUME_TIME_BUDGET_SECONDS", "15")) or None
+
+    # Include the cleaned text and per-skill sentence offsets (text and
+    # skill_context_spans) in /analyze-resume results so the UI can highlight
+    # skills. Off by default since it adds the whole resume text to every
+    # result; set RESUME_CONTEXT_SPANS=1 to opt in.
+    app.config["RESUME_CONTEXT_SPANS"] = os.getenv("RESUME_CONTEXT_SPANS", "0") == "1"
+
+    # Asynchronous analysis jobs (/analyze-resume/jobs): analysis threads,
+    # maximum jobs waiting to start, and how long finished jobs are kept.
+    app.config["RESUME_JOB_WORKERS"] = int(os.getenv("RESUME_JOB_WORKERS", "2"))
+    app.config["RESUME_JOB_MAX_QUEUED"] = int(os.getenv("RESUME_JOB_MAX_QUEUED", "32"))
+    app.config["RESUME_JOB_TTL_SECONDS"] = float(os.getenv("RESUME_JOB_TTL_SECONDS", "900"))
+    # Job state is kept in files here so every worker process can answer polls
+    # for any job; all processes must share this directory.
+    app.config["RESUME_JOB_DIR"] = os.getenv("RESUME_JOB_DIR", str(base_dir / "cache" / "jobs"))
+
+    # Batch analysis (/analyze-resumes/batch): worker processes, files analyzed
+    # at once, and per-batch limits on the number and size of files.
+    app.config["RESUME_BATCH_WORKERS"] = int(os.getenv("RESUME_BATCH_WORKERS", str(os.cpu_count() or 2)))
+    app.config["RESUME_BATCH_MAX_IN_FLIGHT"] = int(os.getenv("RESUME_BATCH_MAX_IN_FLIGHT", str(2 * app.config["RESUME_BATCH_WORKERS"])))
+    app.config["RESUME_BATCH_MAX_FILES"] = int(os.getenv("RESUME_BATCH_MAX_FILES", "1000"))
+    app.config["RESUME_BATCH_MAX_FILE_BYTES"] = int(os.getenv("RESUME_BATCH_MAX_FILE_BYTES", str(10 * 1024 * 1024)))
+
+    # Skill gap weighted scores: credit of a resume skill with no stated
+    # proficiency level (expert 1.0, intermediate 0.75, beginner 0.5).
+    app.config["SKILL_GAP_DEFAULT_CREDIT"] = float(os.getenv("SKILL_GAP_DEFAULT_CREDIT", "0.75"))
+
     # Optional hard limits (adjust later as needed)
     # app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024  # 10 MB
 
@@ -68,6 +125,8 @@ def create_app() -> Flask:
             version="1.0.0",
             endpoints={
                 "analyze_resume": "/analyze-resume (POST)",
+                "analyze_resumes_batch": "/analyze-resumes/batch (POST)",
+                "analyze_resume_jobs": "/analyze-resume/jobs (POST), /analyze-resume/jobs/<id> (GET)",
                 "sample_data": "/sample-data (GET)"
             },
             supported_formats=["PDF (.pdf)", "Word (.doc, .docx)"],
@@ -156,6 +215,10 @@ def create_app() -> Flask:
     # --- Resume Analysis Endpoint ---
     # This is the main endpoint for resume analysis
     create_analyze_resume_endpoint(app)
+
+    # --- Batch Resume Analysis Endpoint ---
+    # Analyzes a zip archive or several files and streams NDJSON results
+    create_batch_analysis_endpoint(app)
     
     # --- Skill Gap Analysis Endpoints ---
     # These endpoints provide skill gap analysis functionality
@@ -0,0 +1,255 @@
+"""
+Batch Resume Analysis
+
+This module provides the bulk ingestion endpoint. Uploaded resumes, either
+as a zip archive or as several multipart files, are analyzed in a pool of
+worker processes. One NDJSON line is streamed back per resume as soon as it
+completes. Only a bounded number of files is read and in flight at any time,
+so memory stays flat regardless of batch size.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from resume_analyzer import ResumeAnalyzer, create_analysis_cache, get_analyzer_options, is_cacheable
+
+
+SUPPORTED_EXTENSIONS = {'pdf', 'doc', 'docx'}
+
+# A batch file is a name plus a function returning its content, or an error
+# message when the file is rejected before analysis
+BatchFile = Tuple[str, Optional[Callable[[], bytes]], Optional[str]]
+
+_worker_analyzer: Optional[ResumeAnalyzer] = None
+
+
+def _init_worker(analyzer_options: Dict[str, Any]) -> None:
+    """Create the analyzer used by a batch worker process."""
+    global _worker_analyzer
+    _worker_analyzer = ResumeAnalyzer(**analyzer_options)
+
+
+def _analyze_in_worker(content: bytes, filename: str) -> Dict[str, Any]:
+    """Analyze one resume in a batch worker process."""
+    return _worker_analyzer.analyze_resume_bytes(content, filename)
+
+
+def _extension(filename: str) -> str:
+    """Get the lowercase extension of a file name, without the dot."""
+    return filename.rsplit('.', 1)[1].lower() if '.' in filename else ''
+
+
+def iter_zip_files(archive_file, max_file_bytes: int) -> Iterator[BatchFile]:
+    """
+    List the resumes in a zip archive without reading their content.
+
+    Directories and macOS metadata entries are skipped. Files of another type
+    or larger than max_file_bytes once uncompressed are returned with an error.
+
+    Args:
+        archive_file: Seekable binary stream of the zip archive
+        max_file_bytes (int): Largest uncompressed resume accepted
+
+    Yields:
+        BatchFile: (name, content reader or None, error message or None)
+    """
+    archive = zipfile.ZipFile(archive_file)
+    for info in archive.infolist():
+        name = info.filename
+        if info.is_dir() or name.startswith('__MACOSX/') or PurePosixPath(name).name.startswith('.'):
+            continue
+        if _extension(name) not in SUPPORTED_EXTENSIONS:
+            yield name, None, 'File type not supported. Please upload a PDF, DOC, or DOCX file.'
+        elif info.file_size > max_file_bytes:
+            yield name, None, f'File is larger than the {max_file_bytes} byte limit'
+        else:
+            yield name, (lambda info=info: archive.read(info)), None
+
+
+def _stream_size(stream) -> int:
+    """Get the size of a seekable stream, leaving its position at the start."""
+    size = stream.seek(0, 2)
+    stream.seek(0)
+    return size
+
+
+def iter_batch_results(files: Iterable[BatchFile], analyze: Callable[[bytes, str], Any],
+                       max_in_flight: int, cache=None) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze files concurrently and yield one result line per file as each completes.
+
+    A file's content is only read when it is submitted, and at most
+    max_in_flight files are submitted but not yet reported.
+
+    Args:
+        files (Iterable[BatchFile]): Files to analyze, in order
+        analyze (Callable[[bytes, str], Any]): Submits (content, filename) and returns a future
+        max_in_flight (int): Maximum number of files being analyzed at once
+        cache (AnalysisCache, optional): Result cache checked before and filled after analysis
+
+    Yields:
+        Dict[str, Any]: Result line for each file, in completion order
+    """
+    in_flight = {}
+    files = iter(enumerate(files))
+    exhausted = False
+
+    while in_flight or not exhausted:
+        while not exhausted and len(in_flight) < max_in_flight:
+            try:
+                index, (filename, read, error) = next(files)
+            except StopIteration:
+                exhausted = True
+                break
+
+            if error:
+                yield _error_line(index, filename, 'Invalid file', error)
+                continue
+
+            try:
+                content = read()
+            except Exception as e:
+                yield _error_line(index, filename, 'Invalid file', str(e))
+                continue
+
+            cache_key = cache.make_key(content) if cache else None
+            cached_result = cache.get(cache_key) if cache else None
+            if cached_result is not None:
+                yield {'index': index, 'filename': filename, 'success': True, 'data': cached_result, 'cached': True}
+                continue
+
+            in_flight[analyze(content, PurePosixPath(filename).name)] = (index, filename, cache_key)
+
+        if not in_flight:
+            continue
+
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, filename, cache_key = in_flight.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                yield _error_line(index, filename, 'Server error', str(e))
+                continue
+
+            if result.get('error', False):
+                yield _error_line(index, filename, 'Analysis failed', result['message'])
+                continue
+
+            if cache and is_cacheable(result):
+                cache.put(cache_key, result)
+            yield {'index': index, 'filename': filename, 'success': True, 'data': result, 'cached': False}
+
+
+def _error_line(index: int, filename: str, error: str, message: str) -> Dict[str, Any]:
+    """Build the result line of a file that could not be analyzed."""
+    return {'index': index, 'filename': filename, 'success': False, 'error': error, 'message': message}
+
+
+def create_batch_analysis_endpoint(app):
+    """
+    Create the /analyze-resumes/batch API endpoint.
+
+    Args:
+        app: Flask application instance
+    """
+    from flask import Response, request
+
+    # Batch workers already run in parallel, so each extracts PDFs serially
+    analyzer_options = {**get_analyzer_options(app.config), 'pdf_workers': 0}
+    cache = create_analysis_cache(app.config)
+    workers = app.config.get('RESUME_BATCH_WORKERS', 2)
+    max_in_flight = app.config.get('RESUME_BATCH_MAX_IN_FLIGHT', 2 * workers)
+    max_files = app.config.get('RESUME_BATCH_MAX_FILES', 1000)
+    max_file_bytes = app.config.get('RESUME_BATCH_MAX_FILE_BYTES', 10 * 1024 * 1024)
+
+    pool = None
+    pool_lock = threading.Lock()
+
+    def get_pool() -> ProcessPoolExecutor:
+        """Start the worker processes on the first batch."""
+        nonlocal pool
+        with pool_lock:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(analyzer_options,))
+            return pool
+
+    def iter_uploaded_files(uploads) -> Iterator[BatchFile]:
+        """Expand zip archives and pass other uploads through, up to max_files."""
+        count = 0
+        for filename, buffer in uploads:
+            if _extension(filename) == 'zip':
+                try:
+                    entries = list(iter_zip_files(buffer, max_file_bytes))
+                except zipfile.BadZipFile as e:
+                    entries = [(filename, None, f'Invalid zip archive: {str(e)}')]
+            elif _extension(filename) not in SUPPORTED_EXTENSIONS:
+                entries = [(filename, None, 'File type not supported. Please upload a PDF, DOC, or DOCX file.')]
+            elif _stream_size(buffer) > max_file_bytes:
+                entries = [(filename, None, f'File is larger than the {max_file_bytes} byte limit')]
+            else:
+                entries = [(filename, buffer.read, None)]
+
+            for entry in entries:
+                count += 1
+                if count > max_files:
+                    yield entry[0], None, f'Batch is limited to {max_files} files'
+                    continue
+                yield entry
+
+    @app.route('/analyze-resumes/batch', methods=['POST'])
+    def analyze_resume_batch():
+        """
+        API endpoint to analyze many resumes in one request.
+
+        Expects a multipart/form-data request with one or more files in the
+        field 'resumes'. Each file is a PDF, DOC or DOCX resume, or a zip
+        archive of them.
+
+        Returns:
+            NDJSON stream with one line per resume in completion order, each
+            holding the index, filename and either the data or an error,
+            followed by a summary line
+        """
+        uploads = [upload for upload in request.files.getlist('resumes') if upload and upload.filename]
+        if not uploads:
+            return {
+                'success': False,
+                'error': 'No file provided',
+                'message': 'Please upload resumes or a zip archive with the field name "resumes"'
+            }, 400
+
+        # Flask closes the request's files once this view returns, before the
+        # response is streamed, so each upload is moved to a buffer owned by
+        # the stream; it stays in memory up to the spool size like single uploads
+        buffers = []
+        for upload in uploads:
+            buffer = tempfile.SpooledTemporaryFile(max_size=analyzer_options['spool_max_size'])
+            shutil.copyfileobj(upload.stream, buffer)
+            buffer.seek(0)
+            buffers.append((upload.filename, buffer))
+
+        def generate():
+            summary = {'total': 0, 'succeeded': 0, 'failed': 0, 'cached': 0}
+            analyze = lambda content, filename: get_pool().submit(_analyze_in_worker, content, filename)
+
+            try:
+                for line in iter_batch_results(iter_uploaded_files(buffers), analyze, max_in_flight, cache):
+                    summary['total'] += 1
+                    summary['succeeded' if line['success'] else 'failed'] += 1
+                    summary['cached'] += 1 if line.get('cached') else 0
+                    yield json.dumps(line) + '\n'
+
+                yield json.dumps({'summary': summary}) + '\n'
+            finally:
+                for _, buffer in buffers:
+                    buffer.close()
+
+        return Response(generate(), mimetype='application/x-ndjson')
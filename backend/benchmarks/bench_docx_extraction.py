@@ -0,0 +1,86 @@
+"""
+DOCX Extraction Benchmark
+
+Compares the zipfile + iterparse extractor with python-docx on a corpus of
+synthetic resumes laid out like common templates (plain paragraphs, a
+two-column table, contact details in the page header, skills in a text
+box). For each template it reports the time per file and the share of the
+resume's lines each extractor recovers, and it reports the import cost of
+each extractor in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_docx_extraction.py [--pages 2] [--count 10] [--runs 3]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from resume_fixtures import DOCX_TEMPLATES, generate_resume, write_resume_docx
+
+from docx_extraction import extract_docx_text
+from resume_analyzer import ResumeAnalyzer
+
+
+def import_time_ms(module: str) -> float:
+    """Return the time to import a module in a fresh interpreter, in milliseconds."""
+    code = f'import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)'
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', code], cwd=backend_dir,
+                            check=True, capture_output=True, text=True).stdout
+    return float(output) * 1000
+
+
+def coverage(text: str, expected_lines) -> float:
+    """Return the share of expected lines that appear in the extracted text."""
+    found = sum(1 for line in expected_lines if line in text)
+    return found / len(expected_lines)
+
+
+def timed(func, paths, runs: int):
+    """Return (outputs, mean seconds per file) of func over every path."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        outputs = [func(path) for path in paths]
+    return outputs, (time.perf_counter() - start) / (runs * len(paths))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2, help='resume length in pages')
+    parser.add_argument('--count', type=int, default=10, help='resumes per template')
+    parser.add_argument('--runs', type=int, default=3, help='passes over the corpus to average over')
+    args = parser.parse_args()
+
+    analyzer = ResumeAnalyzer()
+
+    print(f'import: docx_extraction {import_time_ms("docx_extraction"):.1f} ms, '
+          f'python-docx {import_time_ms("docx"):.1f} ms')
+    print(f'{"template":<10}{"iterparse (ms)":>16}{"python-docx (ms)":>18}{"speedup":>9}'
+          f'{"coverage":>10}{"python-docx":>13}')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for template in DOCX_TEMPLATES:
+            paths = [
+                write_resume_docx(os.path.join(temp_dir, f'{template}_{seed}.docx'), args.pages, seed, template)
+                for seed in range(args.count)
+            ]
+            expected = [
+                [line for line in generate_resume(args.pages, seed).split('\n') if line]
+                for seed in range(args.count)
+            ]
+
+            fast, fast_time = timed(extract_docx_text, paths, args.runs)
+            model, model_time = timed(analyzer._extract_text_from_docx_model, paths, args.runs)
+
+            fast_coverage = sum(map(coverage, fast, expected)) / args.count
+            model_coverage = sum(map(coverage, model, expected)) / args.count
+            print(f'{template:<10}{fast_time * 1000:>16.2f}{model_time * 1000:>18.2f}'
+                  f'{model_time / fast_time:>8.1f}x{fast_coverage:>10.0%}{model_coverage:>13.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Line-Based Entity Extraction Benchmark
+
+Times education, experience, project and certification extraction on
+synthetic 5-page resumes. With --baseline, the same extractors are loaded
+from another git revision of nlp_extraction.py, checked for identical output
+and timed side by side.
+
+Usage:
+    python benchmarks/bench_line_classifier.py [--pages 5] [--count 50] [--baseline <git-rev>]
+"""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import tempfile
+import time
+
+from resume_fixtures import generate_corpus
+
+import nlp_extraction
+from resume_document import ResumeDocument
+
+
+EXTRACTORS = ['extract_education', 'extract_work_experience', 'extract_projects', 'extract_certifications']
+
+
+def load_baseline(revision: str):
+    """Import nlp_extraction.py as it was at a git revision."""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:./nlp_extraction.py'],
+        cwd=backend_dir, check=True, capture_output=True, text=True
+    ).stdout
+
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as module_file:
+        module_file.write(source)
+
+    try:
+        spec = importlib.util.spec_from_file_location('nlp_extraction_baseline', module_file.name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.unlink(module_file.name)
+    return module
+
+
+def run_extractors(module, documents):
+    """Run the four line-based extractors of a module over every document's text."""
+    return [[getattr(module, name)(document.text) for name in EXTRACTORS] for document in documents]
+
+
+def run_fused(documents):
+    """Classify each document's lines once and share the tags between extractors."""
+    results = []
+    for document in documents:
+        line_tags = nlp_extraction.classify_lines(document)
+        results.append([getattr(nlp_extraction, name)(document, line_tags) for name in EXTRACTORS])
+    return results
+
+
+def timed(func, *args):
+    """Return (result, seconds) for func(*args)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=5, help='resume length in pages')
+    parser.add_argument('--count', type=int, default=50, help='number of resumes')
+    parser.add_argument('--baseline', help='git revision to compare against, e.g. HEAD~1')
+    args = parser.parse_args()
+
+    documents = [ResumeDocument.from_text(text) for text in generate_corpus(args.count, args.pages)]
+    total_lines = sum(len(document.lines) for document in documents)
+    print(f'{args.count} resumes x {args.pages} pages, {total_lines} lines')
+
+    fused, fused_time = timed(run_fused, documents)
+    print(f'{"fused classifier":<28}{fused_time * 1000 / args.count:>10.2f} ms/resume')
+
+    if args.baseline:
+        baseline_module = load_baseline(args.baseline)
+        baseline, baseline_time = timed(run_extractors, baseline_module, documents)
+        print(f'{"baseline " + args.baseline:<28}{baseline_time * 1000 / args.count:>10.2f} ms/resume')
+        print(f'speedup: {baseline_time / fused_time:.2f}x, identical output: {baseline == fused}')
+
+
+if __name__ == '__main__':
+    main()
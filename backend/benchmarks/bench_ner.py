@@ -0,0 +1,57 @@
+"""
+NER Latency Benchmark
+
+Compares the previous spaCy setup (full pipeline loaded at import time, NER
+over the whole resume) with the lazy, NER-only pipeline limited to the header
+window.
+
+Usage:
+    python benchmarks/bench_ner.py [--pages 3] [--runs 20]
+"""
+
+import argparse
+import time
+
+from resume_fixtures import generate_resume
+
+import spacy
+
+import nlp_extraction
+from resume_document import ResumeDocument
+
+
+def _time_calls(func, runs: int) -> float:
+    """Return the mean duration of func() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=3, help="resume length in pages")
+    parser.add_argument("--runs", type=int, default=20, help="NER calls to average over")
+    args = parser.parse_args()
+
+    document = ResumeDocument.from_text(generate_resume(args.pages))
+
+    start = time.perf_counter()
+    full_nlp = spacy.load(nlp_extraction.SPACY_MODEL)
+    full_load_ms = (time.perf_counter() - start) * 1000
+    full_call_ms = _time_calls(lambda: full_nlp(document.text), args.runs)
+
+    start = time.perf_counter()
+    nlp_extraction.warmup()
+    trimmed_load_ms = (time.perf_counter() - start) * 1000
+    trimmed_call_ms = _time_calls(lambda: nlp_extraction.extract_name(document), args.runs)
+
+    print(f"resume: {len(document.text)} chars, header window: "
+          f"{len(nlp_extraction.get_header_window(document))} chars")
+    print(f"{'':<28}{'cold start (ms)':>16}{'per call (ms)':>16}")
+    print(f"{'full pipeline, full text':<28}{full_load_ms:>16.1f}{full_call_ms:>16.2f}")
+    print(f"{'NER only, header window':<28}{trimmed_load_ms:>16.1f}{trimmed_call_ms:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
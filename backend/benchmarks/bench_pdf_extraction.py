@@ -0,0 +1,60 @@
+"""
+PDF Extraction Benchmark
+
+Times ResumeAnalyzer.extract_text_from_pdf serially and with page-parallel
+extraction on synthetic PDFs of increasing length, and checks that both
+modes return identical text. The worker pool is warmed up before timing, as
+it is started once per analyzer and reused across requests.
+
+Usage:
+    python benchmarks/bench_pdf_extraction.py [--pages 1 4 8 15] [--workers 4] [--runs 3]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from resume_fixtures import write_resume_pdf
+
+from resume_analyzer import ResumeAnalyzer
+
+
+def timed(func, runs: int):
+    """Return (last result, mean seconds) of func() over several runs."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = func()
+    return result, (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 4, 8, 15], help='PDF lengths to test')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='parallel worker processes')
+    parser.add_argument('--runs', type=int, default=3, help='extractions to average over')
+    args = parser.parse_args()
+
+    serial = ResumeAnalyzer()
+    # Threshold of 1 so every length is also timed in parallel
+    parallel = ResumeAnalyzer(pdf_workers=args.workers, pdf_parallel_min_pages=1)
+
+    print(f'{args.workers} workers, {os.cpu_count()} CPUs')
+    print(f'{"pages":>6}{"serial (ms)":>14}{"parallel (ms)":>16}{"speedup":>10}  identical')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Start the worker processes before timing anything
+        parallel.extract_text_from_pdf(write_resume_pdf(os.path.join(temp_dir, 'warmup.pdf'), 1))
+
+        for pages in args.pages:
+            path = write_resume_pdf(os.path.join(temp_dir, f'resume_{pages}.pdf'), pages)
+            serial_text, serial_time = timed(lambda: serial.extract_text_from_pdf(path), args.runs)
+            parallel_text, parallel_time = timed(lambda: parallel.extract_text_from_pdf(path), args.runs)
+            print(f'{pages:>6}{serial_time * 1000:>14.1f}{parallel_time * 1000:>16.1f}'
+                  f'{serial_time / parallel_time:>9.2f}x  {serial_text == parallel_text}')
+
+    parallel.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Skill Context Benchmark
+
+Times extract_skill_context, which reads sentences through the scan's
+skill-to-sentence index, against a reference that matches every sentence
+separately, on synthetic resumes. The contexts are checked for identical
+output, including on a copy of the corpus with non-ASCII text whose
+lowercase form is longer than the original (e.g. 'İ'), where index offsets
+and sentence offsets must stay aligned.
+
+Skills containing a sentence terminator (e.g. 'node.js') are left out of the
+check, since the reference cannot see them inside a single sentence.
+
+Usage:
+    python benchmarks/bench_skill_context.py [--pages 5] [--count 50]
+"""
+
+import argparse
+import re
+import time
+
+from resume_fixtures import generate_corpus
+
+from resume_document import ResumeDocument
+from skill_extraction import extract_skill_context, scan_skills
+from skill_matcher import get_default_matcher
+
+
+def make_non_ascii(text: str) -> str:
+    """Add names and places with characters that change length when lowercased."""
+    return ('İlkay Çelik Öztürk\n' + text).replace('Acme Corporation', 'ACME İSTANBUL Şirketi')
+
+
+def reference_context(document: ResumeDocument, skills):
+    """Match each sentence on its own and keep the first three sentences per skill."""
+    matcher = get_default_matcher()
+    sentence_skills = [
+        {match.skill for match in matcher.find_all(sentence.lower())}
+        for sentence in document.sentences
+    ]
+
+    context = {}
+    for skill in skills:
+        snippets = [
+            re.sub(r'\s+', ' ', sentence)
+            for sentence, found in zip(document.sentences, sentence_skills)
+            if skill in found and len(re.sub(r'\s+', ' ', sentence)) > 10
+        ][:3]
+        if snippets:
+            context[skill] = ' '.join(snippets)
+    return context
+
+
+def run(documents):
+    """Time both paths over the documents, returning both times and whether they agree."""
+    skill_lists = []
+    for document in documents:
+        skills = scan_skills(document).counts
+        skill_lists.append(sorted(skill for skill in skills if not re.search(r'[.!?]', skill)))
+
+    start = time.perf_counter()
+    indexed = [extract_skill_context(document, skills) for document, skills in zip(documents, skill_lists)]
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [reference_context(document, skills) for document, skills in zip(documents, skill_lists)]
+    reference_time = time.perf_counter() - start
+
+    return indexed_time, reference_time, indexed == reference
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=5, help='pages per synthetic resume')
+    parser.add_argument('--count', type=int, default=50, help='number of resumes')
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, args.pages)
+    print(f'{args.count} resumes x {args.pages} pages')
+
+    for label, texts in (('ascii', corpus), ('non-ascii', [make_non_ascii(text) for text in corpus])):
+        documents = [ResumeDocument.from_text(text) for text in texts]
+        indexed_time, reference_time, identical = run(documents)
+        print(f'{label:<10} indexed {indexed_time * 1000:>9.1f} ms   per-sentence {reference_time * 1000:>9.1f} ms   identical: {identical}')
+
+
+if __name__ == '__main__':
+    main()
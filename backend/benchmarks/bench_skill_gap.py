@@ -0,0 +1,188 @@
+"""
+Skill Gap Analysis Benchmark
+
+Measures SkillGapAnalyzer.analyze_skill_gap throughput in analyses per
+second over random resume skill lists and every available role. With
+--baseline, skill_gap_analysis.py is also loaded from another git revision
+and both are timed side by side on the roles the two revisions share. Their
+results are checked for the same match percentage, recommendation level and
+matched and missing skills; skill order and fields added since the baseline
+are not compared.
+
+SkillGapAnalyzer.rank_roles is then timed per call after adding synthetic
+roles up to --roles, and its scores are checked against analyze_skill_gap.
+
+With --cohort, SkillGapAnalyzer.analyze_cohort is timed for --cohort users
+against --cohort-roles roles and compared with looping analyze_skill_gap
+over every pair.
+
+Usage:
+    python benchmarks/bench_skill_gap.py [--resumes 200] [--skills 25] [--rounds 5] [--roles 500] [--baseline <git-rev>]
+    python benchmarks/bench_skill_gap.py --cohort 2000 [--cohort-roles 130]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import subprocess
+import tempfile
+import time
+
+import skill_gap_analysis
+
+
+# Resume skills are drawn from role requirements plus spelling variants and unrelated skills
+EXTRA_SKILLS = [
+    'JS', 'ReactJS', 'node', 'Python3', 'k8s', 'GitHub', 'ML', 'AWS Cloud', '  sql  ', 'Excel',
+    'Photoshop', 'Go', 'Rust', 'Spark', 'Tableau', 'Salesforce', 'Jira', 'Terraform', 'C++', 'Ruby'
+]
+
+
+def load_baseline(revision: str):
+    """Import skill_gap_analysis.py as it was at a git revision."""
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:./skill_gap_analysis.py'],
+        cwd=backend_dir, check=True, capture_output=True, text=True
+    ).stdout
+
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as module_file:
+        module_file.write(source)
+
+    try:
+        spec = importlib.util.spec_from_file_location('skill_gap_analysis_baseline', module_file.name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.unlink(module_file.name)
+    return module
+
+
+def generate_skill_lists(count: int, size: int, seed: int = 0):
+    """Build random resume skill lists from the known role skills and EXTRA_SKILLS."""
+    rng = random.Random(seed)
+    analyzer = skill_gap_analysis.SkillGapAnalyzer()
+    pool = sorted({skill for role in analyzer.get_available_roles()
+                   for skill in analyzer.get_required_skills(role)}) + EXTRA_SKILLS
+    return [rng.sample(pool, min(size, len(pool))) for _ in range(count)]
+
+
+def run_analyses(module, skill_lists, rounds: int, roles=None):
+    """Analyze every skill list against every role, or the given roles, returning the results and analyses per second."""
+    analyzer = module.SkillGapAnalyzer()
+    roles = roles or analyzer.get_available_roles()
+
+    results = []
+    start = time.perf_counter()
+    for _ in range(rounds):
+        results = [analyzer.to_dict(analyzer.analyze_skill_gap(skills, role))
+                   for skills in skill_lists for role in roles]
+    elapsed = time.perf_counter() - start
+    return results, len(results) * rounds / elapsed
+
+
+def comparable(result):
+    """Reduce a result dict to the fields every revision computes the same way."""
+    return (
+        result['target_role'],
+        result['match_percentage'],
+        result['recommendation_level'],
+        sorted(result['matched_skills']),
+        sorted(result['missing_skills'])
+    )
+
+
+def run_ranking(skill_lists, role_count: int, top_k: int = 5, seed: int = 1):
+    """Rank every skill list against role_count roles, returning ms per call and whether scores agree."""
+    rng = random.Random(seed)
+    analyzer = skill_gap_analysis.SkillGapAnalyzer()
+    pool = sorted({skill for skills in skill_lists for skill in skills})
+    for index in range(len(analyzer.get_available_roles()), role_count):
+        analyzer.add_role_skills(f'Synthetic Role {index}', rng.sample(pool, rng.randint(8, 20)))
+
+    start = time.perf_counter()
+    rankings = [analyzer.rank_roles(skills, top_k) for skills in skill_lists]
+    elapsed = time.perf_counter() - start
+
+    roles = analyzer.get_available_roles()
+    consistent = True
+    for skills, ranking in zip(skill_lists[:20], rankings):
+        expected = sorted((analyzer.analyze_skill_gap(skills, role) for role in roles),
+                          key=lambda result: result.match_percentage, reverse=True)[:top_k]
+        consistent &= [analyzer.to_dict(result) for result in expected] == [analyzer.to_dict(result) for result in ranking]
+    return elapsed * 1000 / len(skill_lists), consistent
+
+
+def run_cohort(user_count: int, role_count: int, skills: int, seed: int = 2):
+    """Time analyze_cohort against a loop over analyze_skill_gap, returning both times and whether they agree."""
+    rng = random.Random(seed)
+    skill_lists = generate_skill_lists(user_count, skills, seed)
+    analyzer = skill_gap_analysis.SkillGapAnalyzer()
+    pool = sorted({skill for skills in skill_lists for skill in skills})
+    for index in range(len(analyzer.get_available_roles()), role_count):
+        analyzer.add_role_skills(f'Synthetic Role {index}', rng.sample(pool, rng.randint(8, 20)))
+    user_ids = [f'user-{index}' for index in range(user_count)]
+    roles = analyzer.get_available_roles()
+
+    start = time.perf_counter()
+    cohort = analyzer.analyze_cohort(user_ids, skill_lists)
+    records = list(cohort.iter_records())
+    cohort_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    looped = [analyzer.to_dict(analyzer.analyze_skill_gap(skills, role)) for skills in skill_lists for role in roles]
+    loop_time = time.perf_counter() - start
+
+    columns = ('match_percentage', 'weighted_score', 'skill_levels_available', 'recommendation_level')
+    identical = all(
+        [record[column] for column in columns] == [result[column] for column in columns]
+        for record, result in zip(records, looped)
+    ) and len(records) == len(looped)
+    return cohort_time, loop_time, identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resumes', type=int, default=200, help='number of resume skill lists')
+    parser.add_argument('--skills', type=int, default=25, help='skills per resume')
+    parser.add_argument('--rounds', type=int, default=5, help='passes over every resume and role')
+    parser.add_argument('--roles', type=int, default=500, help='roles to rank against, padded with synthetic roles')
+    parser.add_argument('--cohort', type=int, help='time cohort analysis for this many users instead')
+    parser.add_argument('--cohort-roles', type=int, default=130, help='roles in the cohort analysis')
+    parser.add_argument('--baseline', help='git revision to compare against, e.g. HEAD~1')
+    args = parser.parse_args()
+
+    if args.cohort:
+        cohort_time, loop_time, identical = run_cohort(args.cohort, args.cohort_roles, args.skills)
+        print(f'{args.cohort} users x {args.cohort_roles} roles, {args.skills} skills each')
+        print(f'{"analyze_cohort":<28}{cohort_time:>10.2f} s')
+        print(f'{"analyze_skill_gap loop":<28}{loop_time:>10.2f} s')
+        print(f'speedup: {loop_time / cohort_time:.2f}x, identical scores: {identical}')
+        return
+
+    skill_lists = generate_skill_lists(args.resumes, args.skills)
+    print(f'{args.resumes} resumes x {args.skills} skills, {args.rounds} rounds')
+
+    current, current_rate = run_analyses(skill_gap_analysis, skill_lists, args.rounds)
+    print(f'{"compiled roles":<28}{current_rate:>12,.0f} analyses/s')
+
+    if args.baseline:
+        baseline_module = load_baseline(args.baseline)
+        baseline_roles = set(baseline_module.SkillGapAnalyzer().get_available_roles())
+        shared_roles = [role for role in skill_gap_analysis.SkillGapAnalyzer().get_available_roles() if role in baseline_roles]
+
+        current, current_rate = run_analyses(skill_gap_analysis, skill_lists, args.rounds, shared_roles)
+        baseline, baseline_rate = run_analyses(baseline_module, skill_lists, args.rounds, shared_roles)
+        same = [comparable(result) for result in current] == [comparable(result) for result in baseline]
+        print(f'{len(shared_roles)} roles shared with {args.baseline}')
+        print(f'{"compiled roles, shared":<28}{current_rate:>12,.0f} analyses/s')
+        print(f'{"baseline " + args.baseline:<28}{baseline_rate:>12,.0f} analyses/s')
+        print(f'speedup: {current_rate / baseline_rate:.2f}x, same scores and skill sets: {same}')
+
+    rank_ms, consistent = run_ranking(skill_lists, args.roles)
+    print(f'{f"rank_roles, {args.roles} roles":<28}{rank_ms:>12.3f} ms/resume, matches analyze_skill_gap: {consistent}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""
+Synthetic Resume Fixtures for Benchmarks
+
+This module generates deterministic resume texts of a given length so
+benchmarks can be run without a corpus of real resumes.
+"""
+
+import os
+import random
+import sys
+from typing import List
+
+# Make the backend modules importable when running a benchmark script directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_keywords import TECHNICAL_SKILLS, SOFT_SKILLS  # noqa: E402
+
+
+# Roughly one printed page of resume text
+LINES_PER_PAGE = 55
+
+SECTION_TITLES = [
+    "SUMMARY", "WORK EXPERIENCE", "EDUCATION", "TECHNICAL SKILLS",
+    "PROJECTS", "CERTIFICATIONS", "ACHIEVEMENTS", "LANGUAGES"
+]
+
+LEVEL_PHRASES = [
+    "expert in", "proficient with", "advanced", "working knowledge of",
+    "familiar with", "basic", "beginner in", "intermediate", "novice at"
+]
+
+
+def generate_resume(pages: int = 1, seed: int = 0) -> str:
+    """
+    Generate a synthetic resume.
+
+    Args:
+        pages (int): Approximate number of printed pages
+        seed (int): Random seed, the same seed always gives the same text
+
+    Returns:
+        str: Raw resume text with line breaks
+    """
+    rng = random.Random(seed)
+    technical = sorted(TECHNICAL_SKILLS)
+    soft = sorted(SOFT_SKILLS)
+
+    lines = [
+        "Jane Alexandra Doe",
+        "Email: jane.doe@example.com | Phone: 555-123-4567",
+        "https://github.com/janedoe",
+    ]
+
+    while len(lines) < pages * LINES_PER_PAGE:
+        lines.append(rng.choice(SECTION_TITLES))
+        for _ in range(rng.randint(4, 9)):
+            skills = rng.sample(technical, 3)
+            level = rng.choice(LEVEL_PHRASES)
+            kind = rng.random()
+            if kind < 0.15:
+                lines.append(f"Bachelor of Science in Computer Science, State University, {rng.randint(2005, 2022)}")
+            elif kind < 0.35:
+                lines.append("Senior Software Engineer at Acme Corporation Jan 2019 - Present")
+                lines.append(f"Developed services with {skills[0]} and {skills[1]}; {level} {skills[2]}.")
+            elif kind < 0.5:
+                lines.append(f"Project: Inventory Tracker built using {skills[0]} and {skills[1]} (Mar 2020 - Jun 2021)")
+            elif kind < 0.6:
+                lines.append("AWS Certified Solutions Architect; Certification: Google Cloud Professional")
+            else:
+                lines.append(f"{level.capitalize()} {skills[0]}, {skills[1]} and {skills[2]}. Strong {rng.choice(soft)}!")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def generate_corpus(count: int, pages: int = 1) -> List[str]:
+    """
+    Generate a list of synthetic resumes.
+
+    Args:
+        count (int): Number of resumes
+        pages (int): Approximate number of printed pages per resume
+
+    Returns:
+        List[str]: Raw resume texts
+    """
+    return [generate_resume(pages, seed) for seed in range(count)]
+
+
+def write_resume_pdf(path: str, pages: int = 1, seed: int = 0) -> str:
+    """
+    Write a synthetic resume as a PDF with one text line per PDF line.
+
+    Args:
+        path (str): Output file path
+        pages (int): Approximate number of printed pages
+        seed (int): Random seed passed to generate_resume
+
+    Returns:
+        str: The output file path
+    """
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+    except ImportError:
+        raise ImportError("reportlab is required to generate PDF fixtures. Install it with: pip install reportlab")
+
+    pdf = canvas.Canvas(path, pagesize=letter)
+    width, height = letter
+    y = height - 40
+    for line in generate_resume(pages, seed).split("\n"):
+        if y < 40:
+            pdf.showPage()
+            y = height - 40
+        pdf.setFont("Helvetica", 9)
+        pdf.drawString(40, y, line)
+        y -= 13
+    pdf.save()
+    return path
+
+
+DOCX_TEMPLATES = ("plain", "table", "header", "textbox")
+
+_TEXTBOX_XML = (
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+    ' xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"'
+    ' xmlns:v="urn:schemas-microsoft-com:vml">'
+    '<mc:AlternateContent><mc:Choice Requires="wps"><w:drawing><wps:wsp><wps:txbx><w:txbxContent>{paragraphs}'
+    '</w:txbxContent></wps:txbx></wps:wsp></w:drawing></mc:Choice>'
+    '<mc:Fallback><w:pict><v:shape><v:textbox><w:txbxContent>{paragraphs}'
+    '</w:txbxContent></v:textbox></v:shape></w:pict></mc:Fallback></mc:AlternateContent></w:r>'
+)
+
+
+def write_resume_docx(path: str, pages: int = 1, seed: int = 0, template: str = "plain") -> str:
+    """
+    Write a synthetic resume as a .docx file laid out like a common template.
+
+    Templates:
+        plain: every line is a body paragraph
+        table: the body is a two-column table, section titles on the left
+        header: the name and contact lines are in the page header
+        textbox: skill lines are in a sidebar text box
+
+    Args:
+        path (str): Output file path
+        pages (int): Approximate number of printed pages
+        seed (int): Random seed passed to generate_resume
+        template (str): One of DOCX_TEMPLATES
+
+    Returns:
+        str: The output file path
+    """
+    try:
+        from docx import Document
+        from docx.oxml import parse_xml
+    except ImportError:
+        raise ImportError("python-docx is required to generate DOCX fixtures. Install it with: pip install python-docx")
+    from xml.sax.saxutils import escape
+
+    lines = generate_resume(pages, seed).split("\n")
+    document = Document()
+
+    if template == "header":
+        for line in lines[:3]:
+            document.sections[0].header.add_paragraph(line)
+        lines = lines[3:]
+
+    if template == "table":
+        table = document.add_table(rows=0, cols=2)
+        title = ""
+        for line in lines:
+            if line in SECTION_TITLES:
+                title = line
+            elif line:
+                row = table.add_row()
+                row.cells[0].text = title
+                row.cells[1].text = line
+                title = ""
+    elif template == "textbox":
+        sidebar = [line for line in lines if line.lower().startswith(tuple(LEVEL_PHRASES))]
+        paragraphs = "".join(f"<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>" for line in sidebar)
+        document.add_paragraph()._p.append(parse_xml(_TEXTBOX_XML.format(paragraphs=paragraphs)))
+        for line in lines:
+            if line not in sidebar:
+                document.add_paragraph(line)
+    else:
+        for line in lines:
+            document.add_paragraph(line)
+
+    document.save(path)
+    return path
@@ -0,0 +1,287 @@
+"""
+Offline Bulk Resume Analyzer
+
+This module re-analyzes a directory of stored resumes without going through
+HTTP, for example after the skill vocabulary changed. Files are analyzed by
+a pool of worker processes and written to a JSONL file. A checkpoint of the
+content hashes already written lets an interrupted run resume where it
+stopped. Only files analyzed successfully are checkpointed, so files that
+failed, including those lost when a worker process died, are retried by the
+next run. Throughput and a per-stage time breakdown are printed at the end.
+
+Usage:
+    python -m resume_analyzer <input_dir> [-o results.jsonl] [-w 4] [--checkpoint results.jsonl.checkpoint]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from analysis_cache import get_vocabulary_fingerprint
+from resume_analyzer import ANALYSIS_STAGES, ANALYZER_VERSION, ResumeAnalyzer
+
+
+SUPPORTED_EXTENSIONS = {'.pdf', '.doc', '.docx'}
+
+# Times in a row the worker pool may die before any file completes in it
+# before the run stops instead of starting another pool
+MAX_POOL_RESTARTS = 3
+
+_worker_analyzer: Optional[ResumeAnalyzer] = None
+
+
+def _init_worker() -> None:
+    """Create the analyzer used by a worker process."""
+    global _worker_analyzer
+    _worker_analyzer = ResumeAnalyzer()
+
+
+def _analyze_in_worker(content: bytes, filename: str) -> Dict[str, Any]:
+    """Analyze one resume in a worker process."""
+    return _worker_analyzer.analyze_resume_bytes(content, filename)
+
+
+def iter_resume_files(input_dir: str) -> Iterator[str]:
+    """
+    Walk a directory for resume files in a stable order.
+
+    Args:
+        input_dir (str): Directory to search recursively
+
+    Yields:
+        str: Path of each PDF, DOC or DOCX file
+    """
+    for root, dirs, files in os.walk(input_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                yield os.path.join(root, name)
+
+
+class Checkpoint:
+    """Append-only record of the content hashes already analyzed successfully."""
+
+    def __init__(self, path: str, stamp: str):
+        """
+        Open a checkpoint, discarding it if it was written by another analyzer version.
+
+        Args:
+            path (str): Checkpoint file path
+            stamp (str): Analyzer version and vocabulary fingerprint of this run
+        """
+        self.path = path
+        self.stamp = stamp
+        self.done: Set[str] = set()
+        self.stale = False
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as checkpoint_file:
+                header = checkpoint_file.readline().strip()
+                if header == f'# {stamp}':
+                    self.done = {line.strip() for line in checkpoint_file if line.strip()}
+                else:
+                    self.stale = True
+
+        resume = os.path.exists(path) and not self.stale
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        if not resume:
+            self._file.write(f'# {stamp}\n')
+            self._file.flush()
+
+    def add(self, content_hash: str) -> None:
+        """Record a hash once its successful output line has been written."""
+        self.done.add(content_hash)
+        self._file.write(content_hash + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        self._file.close()
+
+
+class RunStats:
+    """Counters and stage times aggregated over a run."""
+
+    def __init__(self):
+        self.analyzed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.pages = 0
+        self.stage_seconds = {stage: 0.0 for stage in ANALYSIS_STAGES}
+        self.started = time.perf_counter()
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """Add one analyzed file, reading its timings and page count from processing_metadata."""
+        self.analyzed += 1
+        if result.get('error', False):
+            self.failed += 1
+            return
+
+        metadata = result.get('processing_metadata', {})
+        self.pages += (metadata.get('input') or {}).get('pages') or 0
+        for stage, milliseconds in (metadata.get('timings_ms') or {}).items():
+            if stage != 'total':
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + milliseconds / 1000
+
+    def report(self, out=sys.stdout) -> None:
+        """Print throughput and the per-stage time breakdown."""
+        elapsed = time.perf_counter() - self.started
+        print(f'Analyzed {self.analyzed} files ({self.failed} failed, {self.skipped} already done) '
+              f'in {elapsed:.1f} s', file=out)
+        if not self.analyzed or not elapsed:
+            return
+
+        print(f'Throughput: {self.analyzed / elapsed:.2f} files/s, {self.pages / elapsed:.2f} pages/s', file=out)
+
+        total_stage = sum(self.stage_seconds.values()) or 1.0
+        print(f'{"stage":<14}{"total (s)":>12}{"mean (ms)":>12}{"share":>8}', file=out)
+        for stage, seconds in self.stage_seconds.items():
+            print(f'{stage:<14}{seconds:>12.2f}{seconds * 1000 / self.analyzed:>12.1f}'
+                  f'{seconds / total_stage:>8.0%}', file=out)
+
+
+def _write_line(output, relative_path: str, content_hash: Optional[str], result: Dict[str, Any]) -> None:
+    """Write the JSONL output line of one file and flush it."""
+    success = not result.get('error', False)
+    line = {'path': relative_path, 'sha256': content_hash, 'success': success}
+    if success:
+        line['data'] = result
+    else:
+        line['message'] = result.get('message')
+    output.write(json.dumps(line) + '\n')
+    output.flush()
+
+
+def run(input_dir: str, output_path: str, checkpoint_path: str, workers: int, max_in_flight: int) -> RunStats:
+    """
+    Analyze every resume under a directory, skipping those in the checkpoint.
+
+    Args:
+        input_dir (str): Directory of resumes
+        output_path (str): JSONL output file, appended to when resuming
+        checkpoint_path (str): Checkpoint file
+        workers (int): Number of worker processes
+        max_in_flight (int): Maximum files read and being analyzed at once
+
+    Returns:
+        RunStats: Statistics of the run
+    """
+    checkpoint = Checkpoint(checkpoint_path, f'{ANALYZER_VERSION}-{get_vocabulary_fingerprint()}')
+    if checkpoint.stale:
+        print(f'Checkpoint {checkpoint_path} is from another analyzer version, starting over', file=sys.stderr)
+    elif checkpoint.done:
+        print(f'Resuming: {len(checkpoint.done)} files already done', file=sys.stderr)
+
+    stats = RunStats()
+    output = open(output_path, 'a' if checkpoint.done else 'w', encoding='utf-8')
+    files = iter_resume_files(input_dir)
+    in_flight: Dict[Any, Tuple[str, str]] = {}
+    queued_hashes: Set[str] = set()
+
+    def record(relative_path: str, content_hash: Optional[str], result: Dict[str, Any]) -> None:
+        """Write a file's output line, checkpointing it only if the analysis succeeded."""
+        _write_line(output, relative_path, content_hash, result)
+        stats.add(result)
+        if content_hash and not result.get('error', False):
+            checkpoint.add(content_hash)
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    pool_broken = False
+    restarts = 0
+    try:
+        exhausted = False
+        while in_flight or not exhausted:
+            while not exhausted and not pool_broken and len(in_flight) < max_in_flight:
+                path = next(files, None)
+                if path is None:
+                    exhausted = True
+                    break
+
+                relative_path = os.path.relpath(path, input_dir)
+                try:
+                    with open(path, 'rb') as resume_file:
+                        content = resume_file.read()
+                except OSError as e:
+                    record(relative_path, None, {'error': True, 'message': f'Could not read file: {e}'})
+                    continue
+
+                content_hash = hashlib.sha256(content).hexdigest()
+                if content_hash in checkpoint.done or content_hash in queued_hashes:
+                    stats.skipped += 1
+                    continue
+
+                queued_hashes.add(content_hash)
+                try:
+                    future = pool.submit(_analyze_in_worker, content, os.path.basename(path))
+                except BrokenProcessPool as e:
+                    pool_broken = True
+                    record(relative_path, content_hash, {'error': True, 'message': f'Worker process died: {e}'})
+                    continue
+                in_flight[future] = (relative_path, content_hash)
+
+            if in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    relative_path, content_hash = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                        restarts = 0
+                    except BrokenProcessPool as e:
+                        pool_broken = True
+                        result = {'error': True, 'message': f'Worker process died: {e}'}
+                    except Exception as e:
+                        result = {'error': True, 'message': str(e)}
+                    record(relative_path, content_hash, result)
+
+            if pool_broken and not in_flight:
+                # A worker was killed (e.g. out of memory); every file it took down
+                # has been reported as failed and is retried by the next run
+                pool.shutdown(wait=False)
+                restarts += 1
+                if restarts > MAX_POOL_RESTARTS:
+                    print('Worker processes keep dying, stopping; rerun the same command to resume',
+                          file=sys.stderr)
+                    break
+                print('A worker process died, restarting the worker pool', file=sys.stderr)
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+                pool_broken = False
+    except KeyboardInterrupt:
+        print('Interrupted, rerun the same command to resume', file=sys.stderr)
+    finally:
+        pool.shutdown(cancel_futures=True)
+        output.close()
+        checkpoint.close()
+
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog='python -m resume_analyzer',
+        description='Analyze a directory of resumes into a JSONL file, resuming from a checkpoint.'
+    )
+    parser.add_argument('input_dir', help='directory searched recursively for .pdf, .doc and .docx files')
+    parser.add_argument('-o', '--output', default='resume_analysis.jsonl', help='JSONL output file')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help='worker processes')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: <output>.checkpoint)')
+    parser.add_argument('--max-in-flight', type=int, help='files read ahead at once (default: 2 x workers)')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f'{args.input_dir} is not a directory')
+
+    stats = run(
+        args.input_dir,
+        args.output,
+        args.checkpoint or f'{args.output}.checkpoint',
+        args.workers,
+        args.max_in_flight or 2 * args.workers
+    )
+    stats.report()
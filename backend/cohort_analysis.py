@@ -0,0 +1,262 @@
+"""
+Cohort Skill Gap Analysis
+
+This module runs skill gap analysis for many users against many roles at
+once. Users and roles are encoded as sparse user x skill and role x skill
+matrices over the analyzer's skill-id space. One sparse matrix product gives
+every user's matched skill count for every role, from which match
+percentages, recommendation levels and per-role missing-skill frequencies
+are derived without a Python loop per pair. Weighted scores are the product
+of a user x skill credit matrix with a dense role x skill weight matrix.
+Results are streamed as NDJSON or CSV.
+
+NumPy and SciPy are optional dependencies, only needed for cohort analysis.
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from compiled_roles import DEFAULT_SKILL_CREDIT, CompiledRole, RecommendationLevel, has_skill_levels, skill_credits
+
+
+# Index of each recommendation level in CohortAnalysis.levels
+LEVELS = (RecommendationLevel.BEGINNER, RecommendationLevel.INTERMEDIATE, RecommendationLevel.ADVANCED)
+
+CSV_COLUMNS = ['user_id', 'target_role', 'match_percentage', 'weighted_score', 'skill_levels_available',
+               'recommendation_level', 'matched_count', 'required_count']
+
+
+@dataclass
+class CohortAnalysis:
+    """Match matrices of a cohort against a set of roles."""
+    user_ids: List[str]
+    roles: List[CompiledRole]
+    matched_counts: Any
+    match_percentages: Any
+    weighted_scores: Any
+    levels: Any
+    missing_frequencies: List[List[Tuple[str, int]]]
+    skill_levels_available: List[bool]
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the result of every user and role pair.
+
+        Yields:
+            Dict[str, Any]: User id, role, match percentage, weighted score, whether
+                the user's proficiency levels were available for it, recommendation
+                level and skill counts, users in input order and roles in role order
+        """
+        role_names = [role.name for role in self.roles]
+        required_counts = [len(role.skills) for role in self.roles]
+        level_names = [level.value for level in LEVELS]
+
+        for user_index, user_id in enumerate(self.user_ids):
+            percentages = self.match_percentages[user_index].tolist()
+            weighted = self.weighted_scores[user_index].tolist()
+            counts = self.matched_counts[user_index].tolist()
+            levels = self.levels[user_index].tolist()
+            levels_available = self.skill_levels_available[user_index]
+            for role_index, role_name in enumerate(role_names):
+                yield {
+                    'user_id': user_id,
+                    'target_role': role_name,
+                    'match_percentage': round(percentages[role_index], 2),
+                    'weighted_score': round(weighted[role_index], 2),
+                    'skill_levels_available': levels_available,
+                    'recommendation_level': level_names[levels[role_index]],
+                    'matched_count': counts[role_index],
+                    'required_count': required_counts[role_index]
+                }
+
+    def iter_role_summaries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over per-role cohort statistics.
+
+        Yields:
+            Dict[str, Any]: Role name, mean match percentage and weighted score, users
+                per recommendation level, and how many users miss each required skill,
+                most missed first
+        """
+        user_count = len(self.user_ids)
+        for role_index, role in enumerate(self.roles):
+            column = self.levels[:, role_index]
+            yield {
+                'target_role': role.name,
+                'users': user_count,
+                'mean_match_percentage': round(float(self.match_percentages[:, role_index].mean()), 2) if user_count else 0.0,
+                'mean_weighted_score': round(float(self.weighted_scores[:, role_index].mean()), 2) if user_count else 0.0,
+                'recommendation_levels': {
+                    level.value: int((column == index).sum()) for index, level in enumerate(LEVELS)
+                },
+                'missing_skill_frequencies': dict(self.missing_frequencies[role_index])
+            }
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """
+        Serialize the analysis as NDJSON.
+
+        Yields:
+            str: One line per user and role pair, then one 'role_summary' line per role
+        """
+        for record in self.iter_records():
+            yield json.dumps(record) + '\n'
+        for summary in self.iter_role_summaries():
+            yield json.dumps({'role_summary': summary}) + '\n'
+
+    def iter_csv(self) -> Iterator[str]:
+        """
+        Serialize the user and role pairs as CSV, one chunk of rows per user.
+
+        Yields:
+            str: Header, then the rows of each user
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+
+        role_count = len(self.roles)
+        for index, record in enumerate(self.iter_records(), 1):
+            writer.writerow([record[column] for column in CSV_COLUMNS])
+            if role_count and index % role_count == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+
+def build_weight_matrix(roles: Sequence[CompiledRole], skill_ids: Dict[str, int]) -> Any:
+    """
+    Lay out the skill weights of roles as a dense matrix over the skill-id space.
+
+    Args:
+        roles (Sequence[CompiledRole]): Compiled roles, one row each in order
+        skill_ids (Dict[str, int]): Skill-id space the roles were compiled with
+
+    Returns:
+        numpy.ndarray: Roles x skills float64 weights; weights of repeated labels are summed
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required for cohort analysis. Install it with: pip install numpy")
+
+    weights = np.zeros((len(roles), len(skill_ids)), dtype=np.float64)
+    for role_index, role in enumerate(roles):
+        for key, weight in zip(role.keys, role.weights):
+            if key:
+                weights[role_index, skill_ids[key]] += weight
+    return weights
+
+
+def analyze_cohort(user_ids: Sequence[str], user_skills: Sequence[Sequence[str]],
+                   roles: Sequence[CompiledRole], skill_ids: Dict[str, int],
+                   weights: Optional[Any] = None,
+                   user_skill_levels: Optional[Sequence[Optional[Dict[str, List[str]]]]] = None,
+                   default_credit: float = DEFAULT_SKILL_CREDIT) -> CohortAnalysis:
+    """
+    Analyze every user against every role with sparse matrix products.
+
+    Scores equal those of SkillGapAnalyzer.analyze_skill_gap: a role's matrix
+    row counts each required label, so repeated labels weigh as they do
+    there, and resume skills unknown to every role are ignored.
+
+    Args:
+        user_ids (Sequence[str]): User identifiers, in output order
+        user_skills (Sequence[Sequence[str]]): Resume skills of each user
+        roles (Sequence[CompiledRole]): Compiled roles, in output order
+        skill_ids (Dict[str, int]): Skill-id space the roles were compiled with
+        weights (numpy.ndarray, optional): Weight matrix of the roles from
+            build_weight_matrix, built here if None
+        user_skill_levels (Sequence[Dict[str, List[str]]], optional): Skills per
+            proficiency level of each user, see skill_credits
+        default_credit (float): Credit of a skill with no stated level
+
+    Returns:
+        CohortAnalysis: Matched counts, match percentages, weighted scores and
+            levels as users x roles arrays, with per-role missing-skill frequencies
+    """
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        raise ImportError("numpy and scipy are required for cohort analysis. Install them with: pip install numpy scipy")
+
+    skill_count = len(skill_ids)
+    if weights is None:
+        weights = build_weight_matrix(roles, skill_ids)
+
+    # Users x skills: the user's credit for each skill they have
+    rows, columns, credits = [], [], []
+    levels_available = []
+    for user_index, skills in enumerate(user_skills):
+        levels = user_skill_levels[user_index] if user_skill_levels is not None else None
+        levels_available.append(has_skill_levels(levels))
+        for key, credit in skill_credits(skills or [], levels, default_credit).items():
+            skill_id = skill_ids.get(key)
+            if skill_id is not None:
+                rows.append(user_index)
+                columns.append(skill_id)
+                credits.append(credit)
+    user_credits = sparse.csr_matrix(
+        (np.array(credits, dtype=np.float64), (rows, columns)),
+        shape=(len(user_ids), skill_count)
+    )
+    # Membership from the sparsity pattern, so a zero credit still counts as a match
+    users = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+        shape=(len(user_ids), skill_count)
+    )
+
+    # Roles x skills: number of required labels with each skill; duplicates are summed
+    rows, columns = [], []
+    for role_index, role in enumerate(roles):
+        for key in role.keys:
+            if key:
+                rows.append(role_index)
+                columns.append(skill_ids[key])
+    requirements = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+        shape=(len(roles), skill_count)
+    )
+
+    required_counts = np.array([len(role.skills) for role in roles], dtype=np.float64)
+    matched_counts = (users @ requirements.T).toarray()
+    match_percentages = matched_counts / np.maximum(required_counts, 1) * 100
+    levels = (match_percentages >= 40).astype(np.int8) + (match_percentages > 70)
+
+    total_weights = np.array([role.total_weight for role in roles], dtype=np.float64)
+    weighted_scores = np.asarray(user_credits @ weights.T) / np.where(total_weights > 0, total_weights, 1) * 100
+
+    # Users missing each skill, masked to the skills each role requires
+    missing_per_skill = len(user_ids) - np.asarray(users.sum(axis=0)).ravel()
+    missing = (requirements.sign() @ sparse.diags(missing_per_skill, dtype=np.int64)).tocsr()
+
+    missing_frequencies = []
+    for role_index, role in enumerate(roles):
+        # First label of each required skill, with its position for stable ordering
+        labels = {}
+        for position, (skill, key) in enumerate(zip(role.skills, role.keys)):
+            if key:
+                labels.setdefault(skill_ids[key], (position, skill))
+        row = missing.getrow(role_index)
+        frequencies = sorted(
+            (-int(count), *labels[skill_id]) for skill_id, count in zip(row.indices, row.data) if count
+        )
+        missing_frequencies.append([(skill, -count) for count, _, skill in frequencies])
+
+    return CohortAnalysis(
+        user_ids=list(user_ids),
+        roles=list(roles),
+        matched_counts=matched_counts,
+        match_percentages=match_percentages,
+        weighted_scores=weighted_scores,
+        levels=levels,
+        missing_frequencies=missing_frequencies,
+        skill_levels_available=levels_available
+    )
@@ -0,0 +1,194 @@
+"""
+Compiled Roles
+
+This module holds the role requirements model shared by single-resume and
+cohort skill gap analysis: roles compiled over a skill-id space, resume skill
+credits by proficiency level, and the recommendation levels.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from skill_normalization import normalize_skill, normalize_skill_set, skill_mask
+
+
+# Credit for a required skill by the proficiency level the resume states for it,
+# using the levels of skill_extraction.SKILL_LEVEL_INDICATORS. A skill with no
+# stated level counts as intermediate, so leaving levels out, or a resume
+# analysis that skipped them, never scores higher than stating them.
+LEVEL_CREDITS = {'expert': 1.0, 'intermediate': 0.75, 'beginner': 0.5}
+DEFAULT_SKILL_CREDIT = LEVEL_CREDITS['intermediate']
+
+
+def has_skill_levels(skill_levels: Optional[Dict[str, List[str]]]) -> bool:
+    """
+    Check whether proficiency levels were extracted at all.
+    
+    Resume analysis reports every level, possibly with no skills, once it
+    has looked for them, and an empty object when it has not (e.g. when its
+    time budget ran out).
+    
+    Args:
+        skill_levels (Dict[str, List[str]], optional): Skills per proficiency level
+        
+    Returns:
+        bool: True if skill_levels names at least one known level
+    """
+    return isinstance(skill_levels, dict) and any(level in LEVEL_CREDITS for level in skill_levels)
+
+
+def skill_credits(skills: Iterable[str], skill_levels: Optional[Dict[str, List[str]]] = None,
+                  default_credit: float = DEFAULT_SKILL_CREDIT) -> Dict[str, float]:
+    """
+    Credit each resume skill by its stated proficiency level.
+    
+    Args:
+        skills (Iterable[str]): Raw resume skills
+        skill_levels (Dict[str, List[str]], optional): Skills per proficiency level, as in
+            the skill_levels of resume analysis; unknown levels are ignored
+        default_credit (float): Credit of a skill with no stated level
+        
+    Returns:
+        Dict[str, float]: Credit of each normalized resume skill, the highest
+            stated level's credit or default_credit
+    """
+    credits = dict.fromkeys(normalize_skill_set(skills), default_credit)
+    
+    stated: Dict[str, float] = {}
+    for level, level_skills in (skill_levels or {}).items():
+        credit = LEVEL_CREDITS.get(level)
+        if credit is None or not isinstance(level_skills, list):
+            continue
+        for key in map(normalize_skill, level_skills):
+            if key in credits:
+                stated[key] = max(stated.get(key, 0.0), credit)
+    
+    credits.update(stated)
+    return credits
+
+
+class RecommendationLevel(Enum):
+    """Recommendation levels based on skill match percentage."""
+    BEGINNER = "Beginner"
+    INTERMEDIATE = "Intermediate"
+    ADVANCED = "Advanced"
+
+
+@dataclass(frozen=True)
+class CompiledRole:
+    """Required skills of a role, normalized once for repeated analyses."""
+    name: str
+    skills: Tuple[str, ...]
+    keys: Tuple[str, ...]
+    key_set: FrozenSet[str]
+    mask: int
+    weights: Tuple[float, ...]
+    total_weight: float
+    
+    @classmethod
+    def compile(cls, name: str, skills: Iterable[str], skill_ids: Dict[str, int],
+                weights: Optional[Iterable[float]] = None) -> 'CompiledRole':
+        """
+        Compile a role's required skills.
+        
+        Args:
+            name (str): Role name
+            skills (Iterable[str]): Required skills in display order
+            skill_ids (Dict[str, int]): Skill-id space shared by all roles, extended
+                with the role's unseen skills
+            weights (Iterable[float], optional): Weight of each skill, 1.0 each if None
+            
+        Returns:
+            CompiledRole: Original labels with their normalized keys, in the same order
+        """
+        skills = tuple(skills)
+        keys = tuple(normalize_skill(skill) for skill in skills)
+        key_set = frozenset(key for key in keys if key)
+        for key in keys:
+            if key and key not in skill_ids:
+                skill_ids[key] = len(skill_ids)
+        weights = tuple(weights) if weights is not None else (1.0,) * len(skills)
+        if len(weights) != len(skills):
+            raise ValueError(f"Role '{name}' needs one weight per skill")
+        return cls(name=name, skills=skills, keys=keys, key_set=key_set,
+                   mask=skill_mask(key_set, skill_ids), weights=weights, total_weight=sum(weights))
+    
+    @classmethod
+    def from_ids(cls, name: str, skills: Tuple[str, ...], ids: Tuple[int, ...],
+                 weights: Tuple[float, ...], skill_keys: List[str]) -> 'CompiledRole':
+        """
+        Build a role from skills already normalized into skill ids, e.g. by the role catalog.
+        
+        Args:
+            name (str): Role name
+            skills (Tuple[str, ...]): Required skills in display order
+            ids (Tuple[int, ...]): Skill id of each skill
+            weights (Tuple[float, ...]): Weight of each skill
+            skill_keys (List[str]): Normalized skill key of each skill id
+            
+        Returns:
+            CompiledRole: Compiled role
+        """
+        mask = 0
+        for skill_id in ids:
+            mask |= 1 << skill_id
+        keys = tuple(skill_keys[skill_id] for skill_id in ids)
+        return cls(name=name, skills=skills, keys=keys, key_set=frozenset(keys), mask=mask,
+                   weights=weights, total_weight=sum(weights))
+    
+    def match_count(self, resume_mask: int, resume_keys: FrozenSet[str]) -> int:
+        """
+        Count the required skills present in a resume.
+        
+        Args:
+            resume_mask (int): Resume skills encoded with the same skill-id space
+            resume_keys (FrozenSet[str]): Normalized resume skills
+            
+        Returns:
+            int: Number of matched skill labels, as in split
+        """
+        if len(self.key_set) == len(self.skills):
+            return (self.mask & resume_mask).bit_count()
+        # Repeated or empty labels make the popcount differ from the label count
+        return sum(1 for key in self.keys if key and key in resume_keys)
+    
+    def weighted_score(self, credits: Dict[str, float]) -> float:
+        """
+        Score a resume by the weighted share of the role's skills it covers.
+        
+        This is the dot product of the role's weight vector with the resume's
+        credit vector, taken over the role's own skills since every other
+        entry of the weight vector is zero, divided by the total weight.
+        
+        Args:
+            credits (Dict[str, float]): Credit per normalized resume skill, from skill_credits
+            
+        Returns:
+            float: Weighted score from 0 to 100
+        """
+        if not self.total_weight:
+            return 0.0
+        covered = sum(weight * credits.get(key, 0.0) for key, weight in zip(self.keys, self.weights))
+        return covered / self.total_weight * 100
+    
+    def split(self, resume_keys: FrozenSet[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split the required skills into matched and missing ones.
+        
+        Args:
+            resume_keys (FrozenSet[str]): Normalized resume skills
+            
+        Returns:
+            Tuple[List[str], List[str]]: Matched and missing skill labels, in role order
+        """
+        matched = []
+        missing = []
+        for skill, key in zip(self.skills, self.keys):
+            if not key:
+                continue
+            if key in resume_keys:
+                matched.append(skill)
+            else:
+                missing.append(skill)
+        return matched, missing
@@ -0,0 +1,308 @@
+"""
+Legacy DOC Conversion Pool
+
+This module converts legacy Word (.doc) files to text in a small pool of
+long-lived worker processes instead of running textract in the request
+thread. Every job has a timeout; a worker that does not answer in time is
+killed together with any converter it started, and replaced. The number of
+waiting jobs is bounded, and results are memoised by content hash so the
+same file is only ever converted once.
+"""
+
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import queue
+import signal
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Set
+
+
+DEFAULT_WORKERS = int(os.getenv("DOC_CONVERTER_WORKERS", "2"))
+DEFAULT_TIMEOUT = float(os.getenv("DOC_CONVERTER_TIMEOUT", "30"))
+DEFAULT_MAX_PENDING = int(os.getenv("DOC_CONVERTER_MAX_PENDING", "8"))
+DEFAULT_MEMO_ENTRIES = int(os.getenv("DOC_CONVERTER_MEMO_ENTRIES", "128"))
+
+
+class DocConversionError(Exception):
+    """Raised when a .doc file cannot be converted."""
+
+
+class DocConversionTimeout(DocConversionError):
+    """Raised when a conversion does not finish within the job timeout."""
+
+
+class DocConverterBusy(DocConversionError):
+    """Raised when the pool's job queue is full."""
+
+
+def textract_convert(path: str) -> str:
+    """
+    Convert a .doc file to text with textract.
+
+    Args:
+        path (str): Path to the .doc file
+
+    Returns:
+        str: Extracted text
+    """
+    import textract
+
+    return textract.process(path).decode('utf-8')
+
+
+def _worker_main(connection, convert: Callable[[str], str]) -> None:
+    """
+    Serve conversion jobs sent over a pipe until it is closed.
+
+    The worker leads its own process group, so the converter programs it
+    starts can be killed along with it.
+
+    Args:
+        connection: Worker end of the job pipe
+        convert (Callable[[str], str]): Function converting a file path to text
+    """
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+
+    while True:
+        try:
+            content = connection.recv()
+        except (EOFError, OSError):
+            return
+
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix='.doc', delete=False) as temp_file:
+                temp_path = temp_file.name
+                temp_file.write(content)
+            connection.send(('ok', convert(temp_path)))
+        except Exception as e:
+            connection.send(('error', str(e)))
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+
+class _Worker:
+    """A converter process and the parent end of its job pipe."""
+
+    def __init__(self, context, convert: Callable[[str], str], generation: int):
+        self.generation = generation
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_connection, convert), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self._stopped = False
+        self._stop_lock = threading.Lock()
+
+    def stop(self) -> None:
+        """
+        Kill the worker and every process in its group, once.
+
+        The pipe stays open, so a thread waiting on a job of this worker
+        sees the end of file instead of a closed handle.
+        """
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            if self.process.pid and hasattr(os, 'killpg'):
+                try:
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+            self.process.kill()
+            self.process.join()
+
+    def kill(self) -> None:
+        """Stop the worker and close its end of the pipe."""
+        self.stop()
+        self.connection.close()
+
+
+class DocConverterPool:
+    """Pool of persistent .doc conversion workers with a content-hash memo."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, timeout: float = DEFAULT_TIMEOUT,
+                 max_pending: int = DEFAULT_MAX_PENDING, memo_entries: int = DEFAULT_MEMO_ENTRIES,
+                 convert: Callable[[str], str] = textract_convert):
+        """
+        Initialize the pool. Worker processes are started on first use.
+
+        Args:
+            workers (int): Number of worker processes
+            timeout (float): Seconds a job may run before its worker is killed
+            max_pending (int): Jobs allowed to wait for a free worker
+            memo_entries (int): Maximum number of conversion results memoised
+            convert (Callable[[str], str]): Module-level function converting a file path to text
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.memo_entries = memo_entries
+        self.convert = convert
+
+        self._context = multiprocessing.get_context('spawn')
+        self._idle: 'queue.Queue[_Worker]' = queue.Queue()
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._memo: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._started = False
+        # Every live worker, idle or busy; workers of an older generation
+        # belong to a pool that has since been closed
+        self._workers: Set[_Worker] = set()
+        self._generation = 0
+
+    def convert_bytes(self, content: bytes) -> str:
+        """
+        Convert a .doc file to text.
+
+        Args:
+            content (bytes): Raw file content
+
+        Returns:
+            str: Extracted text
+
+        Raises:
+            DocConverterBusy: If the job queue is full
+            DocConversionTimeout: If the conversion exceeds the timeout
+            DocConversionError: If the converter fails
+        """
+        key = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        if not self._slots.acquire(blocking=False):
+            raise DocConverterBusy("Too many .doc conversions in progress, please retry shortly")
+        try:
+            text = self._run(content)
+        finally:
+            self._slots.release()
+
+        with self._lock:
+            self._memo[key] = text
+            while len(self._memo) > self.memo_entries:
+                self._memo.popitem(last=False)
+        return text
+
+    def close(self) -> None:
+        """
+        Kill every worker process, idle or busy.
+
+        Jobs running at the time fail with DocConversionError. The next job
+        starts a fresh set of workers.
+        """
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+            self._generation += 1
+            self._started = False
+
+        for worker in workers:
+            worker.stop()
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                break
+
+    def _spawn(self) -> _Worker:
+        """Start a worker of the current generation. Called with the lock held."""
+        worker = _Worker(self._context, self.convert, self._generation)
+        self._workers.add(worker)
+        return worker
+
+    def _start(self) -> None:
+        """Start the worker processes on first use."""
+        with self._lock:
+            if self._started:
+                return
+            for _ in range(self.workers):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def _acquire(self) -> _Worker:
+        """Wait for an idle worker of the current generation."""
+        while True:
+            self._start()
+            try:
+                worker = self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if worker.generation == self._generation:
+                return worker
+            # Put back by a job that finished while the pool was being closed
+            worker.kill()
+
+    def _release(self, worker: Optional[_Worker]) -> None:
+        """Return a worker to the idle queue, or kill it if the pool was closed since it started."""
+        if worker is None:
+            return
+        with self._lock:
+            current = worker.generation == self._generation
+            if not current:
+                self._workers.discard(worker)
+        if current:
+            self._idle.put(worker)
+        else:
+            worker.kill()
+
+    def _replace(self, worker: _Worker) -> Optional[_Worker]:
+        """Kill a hung or dead worker and start its replacement, unless the pool was closed."""
+        worker.kill()
+        with self._lock:
+            self._workers.discard(worker)
+            if worker.generation != self._generation:
+                return None
+            return self._spawn()
+
+    def _run(self, content: bytes) -> str:
+        """Run one job on an idle worker, replacing the worker if it hangs or dies."""
+        worker = self._acquire()
+        try:
+            worker.connection.send(content)
+            if not worker.connection.poll(self.timeout):
+                worker = self._replace(worker)
+                raise DocConversionTimeout(f"Conversion did not finish within {self.timeout:g} seconds")
+            status, result = worker.connection.recv()
+        except (EOFError, OSError) as e:
+            worker = self._replace(worker)
+            if worker is None:
+                raise DocConversionError("Converter pool was closed during the conversion")
+            raise DocConversionError(f"Converter process failed: {e}")
+        finally:
+            self._release(worker)
+
+        if status != 'ok':
+            raise DocConversionError(result)
+        return result
+
+
+_default_pool: Optional[DocConverterPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_doc_converter() -> DocConverterPool:
+    """
+    Get the shared conversion pool, creating it on first use.
+
+    Returns:
+        DocConverterPool: Process-wide pool configured from the DOC_CONVERTER_* settings
+
+    Raises:
+        ImportError: If textract is not installed
+    """
+    global _default_pool
+
+    if importlib.util.find_spec('textract') is None:
+        raise ImportError("textract is required for DOC extraction. Install it with: pip install textract")
+
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = DocConverterPool()
+        return _default_pool
@@ -0,0 +1,185 @@
+"""
+DOCX Text Extraction
+
+This module reads text from Word (.docx) files without building the
+python-docx object model. The file is opened as a zip archive and its XML
+parts are stream-parsed with iterparse, so memory use does not grow with
+document length.
+
+Unlike python-docx's `Document.paragraphs`, the extractor also returns text
+from table cells, headers, footers and text boxes, where many resume
+templates place contact details and skills.
+"""
+
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, IO, Iterator, List, Optional, Union
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+_PARAGRAPH = _W + 'p'
+_TEXT = _W + 't'
+_TAB = _W + 'tab'
+_BREAKS = {_W + 'br', _W + 'cr'}
+_TABLE = _W + 'tbl'
+_TABLE_ROW = _W + 'tr'
+_TABLE_CELL = _W + 'tc'
+
+# Elements whose top-level children are the part's paragraphs and tables
+_PART_ROOTS = {_W + 'body', _W + 'hdr', _W + 'ftr'}
+
+# Subtrees never holding visible text: paragraph properties (their w:tab
+# elements are tab stops) and the legacy fallback copy of text box content,
+# which would duplicate the mc:Choice copy
+_SKIPPED = {_W + 'pPr', _MC + 'Fallback'}
+
+DOCUMENT_PART = 'word/document.xml'
+APP_PROPERTIES_PART = 'docProps/app.xml'
+_APP_PAGES = '{http://schemas.openxmlformats.org/officeDocument/2006/extended-properties}Pages'
+_HEADER_PART_PATTERN = re.compile(r'word/header\d*\.xml$')
+_FOOTER_PART_PATTERN = re.compile(r'word/footer\d*\.xml$')
+
+
+def iter_part_lines(xml_file: IO[bytes]) -> Iterator[str]:
+    """
+    Stream the text lines of one WordprocessingML part in document order.
+
+    Every paragraph outside a table is one line. Each table row is one line
+    with its cells separated by tabs, and the paragraphs of a cell are joined
+    by spaces. Text box paragraphs are yielded where their anchor appears.
+
+    Args:
+        xml_file (IO[bytes]): Open XML part, e.g. word/document.xml
+
+    Yields:
+        str: Non-empty lines of text
+    """
+    paragraphs: List[List[str]] = []  # text pieces of each open paragraph
+    cells: List[List[str]] = []       # paragraph texts of each open table cell
+    rows: List[List[str]] = []        # cell texts of each open table row
+    skip_depth = 0
+    part_root = None
+
+    for event, element in ET.iterparse(xml_file, events=('start', 'end')):
+        tag = element.tag
+
+        if event == 'start':
+            if tag in _SKIPPED:
+                skip_depth += 1
+            elif skip_depth:
+                continue
+            elif tag == _PARAGRAPH:
+                paragraphs.append([])
+            elif tag == _TABLE_CELL:
+                cells.append([])
+            elif tag == _TABLE_ROW:
+                rows.append([])
+            elif tag in _PART_ROOTS:
+                part_root = element
+            continue
+
+        if tag in _SKIPPED:
+            skip_depth -= 1
+            element.clear()
+            continue
+        if skip_depth:
+            continue
+
+        line = None
+        if tag == _TEXT and paragraphs:
+            paragraphs[-1].append(element.text or '')
+        elif tag == _TAB and paragraphs:
+            paragraphs[-1].append('\t')
+        elif tag in _BREAKS and paragraphs:
+            paragraphs[-1].append('\n')
+        elif tag == _PARAGRAPH:
+            line = ''.join(paragraphs.pop())
+        elif tag == _TABLE_CELL:
+            cell_text = ' '.join(cells.pop())
+            if rows:
+                rows[-1].append(cell_text)
+        elif tag == _TABLE_ROW:
+            line = '\t'.join(cell for cell in rows.pop() if cell)
+
+        if line is not None and line.strip():
+            if cells:
+                cells[-1].append(line)
+            else:
+                yield line
+
+        # Drop finished top-level content so memory stays constant
+        if tag in (_PARAGRAPH, _TABLE) and not (paragraphs or cells or rows) and part_root is not None:
+            part_root.clear()
+
+
+def iter_docx_lines(docx_path: Union[str, BinaryIO]) -> Iterator[str]:
+    """
+    Stream the text lines of a .docx file.
+
+    Header parts come first, then the document body, then footer parts. A
+    line repeated across header or footer parts (first-page, even-page and
+    default variants) is only yielded once.
+
+    Args:
+        docx_path (Union[str, BinaryIO]): Path to the .docx file or a seekable binary stream
+
+    Yields:
+        str: Non-empty lines of text
+
+    Raises:
+        zipfile.BadZipFile: If the file is not a zip archive
+        KeyError: If the archive has no word/document.xml
+        xml.etree.ElementTree.ParseError: If a part is not well-formed XML
+    """
+    with zipfile.ZipFile(docx_path) as archive:
+        names = archive.namelist()
+        headers = sorted(name for name in names if _HEADER_PART_PATTERN.match(name))
+        footers = sorted(name for name in names if _FOOTER_PART_PATTERN.match(name))
+
+        if DOCUMENT_PART not in names:
+            raise KeyError(f"{DOCUMENT_PART} not found in archive")
+
+        seen_margin_lines = set()
+        for name in headers + [DOCUMENT_PART] + footers:
+            with archive.open(name) as part:
+                for line in iter_part_lines(part):
+                    if name != DOCUMENT_PART:
+                        if line in seen_margin_lines:
+                            continue
+                        seen_margin_lines.add(line)
+                    yield line
+
+
+def extract_docx_text(docx_path: Union[str, BinaryIO]) -> str:
+    """
+    Extract the text of a .docx file, one line per paragraph or table row.
+
+    Args:
+        docx_path (Union[str, BinaryIO]): Path to the .docx file or a seekable binary stream
+
+    Returns:
+        str: Extracted text
+    """
+    return '\n'.join(iter_docx_lines(docx_path))
+
+
+def read_docx_page_count(docx_path: Union[str, BinaryIO]) -> Optional[int]:
+    """
+    Read the page count Word stored in a .docx file when it was last saved.
+
+    Args:
+        docx_path (Union[str, BinaryIO]): Path to the .docx file or a seekable binary stream
+
+    Returns:
+        Optional[int]: Page count, or None if the file does not record one
+    """
+    try:
+        with zipfile.ZipFile(docx_path) as archive:
+            root = ET.fromstring(archive.read(APP_PROPERTIES_PART))
+        pages = root.find(_APP_PAGES)
+        return int(pages.text) if pages is not None and pages.text else None
+    except (zipfile.BadZipFile, KeyError, ET.ParseError, ValueError):
+        return None
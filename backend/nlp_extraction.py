@@ -5,36 +5,124 @@ This module uses spaCy to extract structured information from resume text,
 including names, education, work experience, and other entities.
 """
 
+import os
 import re
-from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
+import threading
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Tuple, Optional, Union
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 
-# Try to load spaCy model, fall back to basic if not available
-try:
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
-except ImportError:
-    nlp = None
-except OSError:
-    nlp = None
+from resume_document import ResumeDocument, as_document
+from time_budget import TimeBudget, allows
 
+# spaCy model used for named entity recognition
+SPACY_MODEL = "en_core_web_sm"
 
-def extract_name(text: str) -> Optional[str]:
+# Pipeline components not needed for NER; they are never loaded
+NER_EXCLUDED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# Number of leading characters searched for the candidate's name
+NER_HEADER_CHARS = int(os.getenv("NER_HEADER_CHARS", "1000"))
+
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    Get the spaCy pipeline, loading it on first use.
+    
+    Only the components needed for NER are loaded. If spaCy or the model
+    is not installed, None is returned and NER-based extraction is skipped.
+    
+    Returns:
+        Optional[spacy.Language]: Loaded spaCy pipeline or None
+    """
+    global _nlp, _nlp_loaded
+    
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                try:
+                    import spacy
+                    _nlp = spacy.load(SPACY_MODEL, exclude=NER_EXCLUDED_COMPONENTS)
+                except (ImportError, OSError):
+                    _nlp = None
+                _nlp_loaded = True
+    
+    return _nlp
+
+
+def warmup() -> bool:
+    """
+    Load the spaCy pipeline ahead of the first request.
+    
+    Returns:
+        bool: True if the pipeline is available
+    """
+    return get_nlp() is not None
+
+
+def get_header_window(document: ResumeDocument, header_chars: Optional[int] = None) -> str:
+    """
+    Get the leading part of the document where the candidate's name appears.
+    
+    The window is cut back to the last line break inside it so that NER never
+    sees a truncated line, unless the first line alone is longer than the window.
+    
+    Args:
+        document (ResumeDocument): Resume document
+        header_chars (int, optional): Window size, defaults to NER_HEADER_CHARS
+        
+    Returns:
+        str: Header text
+    """
+    if header_chars is None:
+        header_chars = NER_HEADER_CHARS
+    
+    if len(document.text) <= header_chars:
+        return document.text
+    
+    window = document.text[:header_chars]
+    last_break = window.rfind('\n')
+    return window[:last_break] if last_break > 0 else window
+
+
+def extract_name(text: Union[str, ResumeDocument], header_chars: Optional[int] = None) -> Optional[str]:
     """
     Extract full name from resume text using spaCy NER.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        header_chars (int, optional): Number of leading characters to run NER on,
+            defaults to NER_HEADER_CHARS
         
     Returns:
         Optional[str]: Extracted name or None if not found
     """
-    if not text or not nlp:
+    document = as_document(text)
+    if not document.text:
         return None
     
-    doc = nlp(text)
+    nlp = get_nlp()
+    if not nlp:
+        return None
     
+    return select_person_name(nlp(get_header_window(document, header_chars)))
+
+
+def select_person_name(doc) -> Optional[str]:
+    """
+    Pick the candidate's name from the PERSON entities of a spaCy Doc.
+    
+    Args:
+        doc (spacy.tokens.Doc): Processed header window
+        
+    Returns:
+        Optional[str]: Most likely full name or None if not found
+    """
     # Look for PERSON entities
     person_entities = []
     for ent in doc.ents:
@@ -61,311 +149,429 @@ def extract_name(text: str) -> Optional[str]:
     return None
 
 
-def extract_education(text: str) -> List[Dict[str, str]]:
+# Precompiled line classification patterns. Patterns applied to the
+# lowercased line are compiled without IGNORECASE, which makes them much
+# cheaper to search; patterns applied to the original line keep it.
+_DEGREE_PATTERNS = [
+    re.compile(r'(?:bachelor|b\.sc\.?|bsc|b\.tech\.?|btech|master|msc|m\.sc\.?|m\.tech\.?|mtech|ph\.?d\.?|doctorate|mba|bba|bca|mca)'),
+    re.compile(r'(?:associate|diploma|certificate|training)'),
+]
+
+_INSTITUTION_PATTERN = re.compile(r'(?:university|college|institute|school|academy|campus)')
+
+# Any degree or institution keyword, checked before the individual patterns
+_EDUCATION_INDICATOR_PATTERN = re.compile(
+    '|'.join(pattern.pattern for pattern in _DEGREE_PATTERNS + [_INSTITUTION_PATTERN])
+)
+
+_INSTITUTION_NAME_PATTERN = re.compile(r'([A-Z][a-zA-Z\s&]+(?:University|College|Institute|School|Academy))', re.IGNORECASE)
+
+_YEAR_PATTERNS = [
+    re.compile(r'\b(?:19|20)\d{2}\b'),  # 1900-2099
+    re.compile(r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\b'),  # Month Year
+    re.compile(r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\b'),
+]
+
+# Company, organization or job title indicators, combined into one search
+_EXPERIENCE_INDICATOR_PATTERN = re.compile(
+    r'(?:experience|employment|work\s+history|professional\s+experience)'
+    r'|(?:company|organization|firm|corporation|inc|llc)'
+    r'|(?:position|role|title|job)'
+)
+
+_COMPANY_PATTERN = re.compile(r'([A-Z][a-zA-Z\s&]+(?:Company|Corporation|Inc|LLC|Ltd|Group|Organization))', re.IGNORECASE)
+
+_ROLE_PATTERNS = [
+    re.compile(r'(?:developer|engineer|manager|director|analyst|consultant|specialist|coordinator|officer|executive)'),
+    re.compile(r'(?:senior|junior|lead|principal|associate)'),
+]
+
+# Month ranges, shared by experience and project durations
+_DURATION_PATTERNS = [
+    re.compile(r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\s*-\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\b'),
+    re.compile(r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\s*-\s*(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\b'),
+    re.compile(r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\s*-\s*(?:present|current)\b'),
+    re.compile(r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\s*-\s*(?:present|current)\b'),
+]
+
+# Plain year ranges, only used for experience durations
+_YEAR_RANGE_PATTERN = re.compile(r'\b\d{4}\s*-\s*\d{4}\b')
+
+# Project indicators, combined into one search
+_PROJECT_INDICATOR_PATTERN = re.compile(
+    r'(?:projects?|portfolio|achievements?)'
+    r'|(?:developed|created|built|implemented)'
+    r'|(?:project\s*title|name\s*of\s*project)'
+)
+
+_PROJECT_TITLE_PATTERN = re.compile(r'(?:project\s*[:\-]?\s*|title\s*[:\-]?\s*)([A-Z][a-zA-Z\s]+)', re.IGNORECASE)
+
+_PROJECT_TECH_KEYWORDS = ['python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'django', 'flask', 'spring', 'aws', 'docker', 'kubernetes']
+
+_CERT_KEYWORDS = ['certified', 'certification', 'certificate']
+
+_CERT_PATTERNS = [
+    re.compile(r'(?:certified|certification|certificate)\s+[:\-]?\s*([A-Z][a-zA-Z\s]+)', re.IGNORECASE),
+    re.compile(r'(?:AWS|Microsoft|Google|Oracle|Cisco|PMP|Scrum)\s+[A-Z][a-zA-Z\s]+', re.IGNORECASE),
+    re.compile(r'\b(?:AWS|Azure|GCP|Oracle|Cisco|PMP|CSM|PSM)\b', re.IGNORECASE),
+]
+
+# Section words that end the look-ahead of an entry into the following lines
+_SECTION_BREAK_PATTERN = re.compile(r'experience|education|skills|projects|certifications')
+
+_EDUCATION_BREAKS = frozenset({'experience', 'skills', 'projects', 'certifications'})
+_EXPERIENCE_BREAKS = frozenset({'education', 'skills', 'projects', 'certifications'})
+_PROJECT_BREAKS = frozenset({'experience', 'education', 'skills', 'certifications'})
+
+
+@dataclass
+class LineTags:
+    """Classification of a single resume line, computed once per line."""
+    text: str
+    section_breaks: FrozenSet[str]
+    is_education: bool = False
+    degree: str = ''
+    institution: str = ''
+    year: str = ''
+    is_experience: bool = False
+    company: str = ''
+    role: str = ''
+    duration: str = ''
+    year_range: str = ''
+    is_project: bool = False
+    project_title: str = ''
+    technologies: List[str] = field(default_factory=list)
+    is_certification: bool = False
+    certifications: List[str] = field(default_factory=list)
+
+
+def _first_match(patterns: List[re.Pattern], text: str) -> Optional[re.Match]:
+    """Return the match of the first pattern that matches the text."""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+
+def _classify_line(line: str, line_lower: str) -> LineTags:
+    """Tag a line with every entity field the extractors need."""
+    stripped = line.strip()
+    tags = LineTags(
+        text=stripped,
+        section_breaks=frozenset(match.group() for match in _SECTION_BREAK_PATTERN.finditer(line_lower))
+    )
+    
+    if _EDUCATION_INDICATOR_PATTERN.search(line_lower):
+        tags.is_education = True
+        degree_match = _first_match(_DEGREE_PATTERNS, line_lower)
+        institution_match = _INSTITUTION_PATTERN.search(line_lower)
+        if degree_match:
+            tags.degree = degree_match.group(0).title()
+        if institution_match:
+            name_match = _INSTITUTION_NAME_PATTERN.search(line)
+            tags.institution = name_match.group(1).strip() if name_match else institution_match.group(0).title()
+        year_match = _first_match(_YEAR_PATTERNS, line_lower)
+        if year_match:
+            tags.year = year_match.group(0)
+    
+    duration_match = None
+    
+    if _EXPERIENCE_INDICATOR_PATTERN.search(line_lower):
+        tags.is_experience = True
+        company_match = _COMPANY_PATTERN.search(line)
+        if company_match:
+            tags.company = company_match.group(1).strip()
+        role_match = _first_match(_ROLE_PATTERNS, line_lower)
+        if role_match:
+            tags.role = role_match.group(0).title()
+        duration_match = _first_match(_DURATION_PATTERNS, line_lower)
+        if duration_match:
+            tags.duration = duration_match.group(0)
+        else:
+            year_range_match = _YEAR_RANGE_PATTERN.search(line_lower)
+            if year_range_match:
+                tags.year_range = year_range_match.group(0)
+    
+    if _PROJECT_INDICATOR_PATTERN.search(line_lower):
+        tags.is_project = True
+        title_match = _PROJECT_TITLE_PATTERN.search(line)
+        if title_match:
+            tags.project_title = title_match.group(1).strip()
+        tags.technologies = [tech.title() for tech in _PROJECT_TECH_KEYWORDS if tech in line_lower]
+        if not tags.is_experience:
+            duration_match = _first_match(_DURATION_PATTERNS, line_lower)
+            if duration_match:
+                tags.duration = duration_match.group(0)
+    
+    if any(word in line_lower for word in _CERT_KEYWORDS):
+        tags.is_certification = True
+        for pattern in _CERT_PATTERNS:
+            tags.certifications.extend(match.strip() for match in pattern.findall(line))
+    
+    return tags
+
+
+def classify_lines(text: Union[str, ResumeDocument]) -> List[LineTags]:
+    """
+    Classify every line of a resume once for the line-based extractors.
+    
+    Args:
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        
+    Returns:
+        List[LineTags]: Tags for each line, in document order
+    """
+    document = as_document(text)
+    return [_classify_line(line, line_lower) for line, line_lower in zip(document.lines, document.lines_lower)]
+
+
+def _collect_details(line_tags: List[LineTags], index: int, lookahead: int, breaks: FrozenSet[str], stop_at_break: bool) -> str:
+    """
+    Join an entry line with the following lines that belong to it.
+    
+    Args:
+        line_tags (List[LineTags]): Tags for every line
+        index (int): Index of the entry line
+        lookahead (int): Maximum number of following lines to consider
+        breaks (FrozenSet[str]): Section words that exclude a following line
+        stop_at_break (bool): Stop at the first excluded line instead of skipping it
+        
+    Returns:
+        str: Entry details
+    """
+    details = line_tags[index].text
+    for tags in line_tags[index + 1:index + 1 + lookahead]:
+        if tags.text and not (tags.section_breaks & breaks):
+            details += ' ' + tags.text
+        elif stop_at_break:
+            break
+    return details
+
+
+def extract_education(text: Union[str, ResumeDocument], line_tags: Optional[List[LineTags]] = None) -> List[Dict[str, str]]:
     """
     Extract education information from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        line_tags (List[LineTags], optional): Precomputed line classification
         
     Returns:
         List[Dict[str, str]]: List of education entries with degree, university, and year
     """
-    if not text:
+    document = as_document(text)
+    if not document.text:
         return []
     
-    education_entries = []
-    
-    # Common degree patterns
-    degree_patterns = [
-        r'(?:bachelor|b\.sc\.?|bsc|b\.tech\.?|btech|master|msc|m\.sc\.?|m\.tech\.?|mtech|ph\.?d\.?|doctorate|mba|bba|bca|mca)',
-        r'(?:associate|diploma|certificate|training)',
-    ]
-    
-    # University patterns
-    university_patterns = [
-        r'(?:university|college|institute|school|academy|campus)',
-    ]
+    if line_tags is None:
+        line_tags = classify_lines(document)
     
-    # Year patterns
-    year_patterns = [
-        r'\b(?:19|20)\d{2}\b',  # 1900-2099
-        r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\b',  # Month Year
-        r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\b',
-    ]
-    
-    lines = text.split('\n')
+    education_entries = []
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        
-        # Check if line contains education keywords
-        if any(re.search(pattern, line_lower, re.IGNORECASE) for pattern in degree_patterns + university_patterns):
-            education_entry = {
-                'degree': '',
-                'university': '',
-                'year': '',
-                'details': line.strip()
-            }
-            
-            # Extract degree
-            for pattern in degree_patterns:
-                match = re.search(pattern, line_lower, re.IGNORECASE)
-                if match:
-                    education_entry['degree'] = match.group(0).title()
-                    break
-            
-            # Extract university
-            for pattern in university_patterns:
-                match = re.search(pattern, line_lower, re.IGNORECASE)
-                if match:
-                    # Try to extract the full university name
-                    university_match = re.search(r'([A-Z][a-zA-Z\s&]+(?:University|College|Institute|School|Academy))', line, re.IGNORECASE)
-                    if university_match:
-                        education_entry['university'] = university_match.group(1).strip()
-                    else:
-                        education_entry['university'] = match.group(0).title()
-                    break
-            
-            # Extract year
-            for pattern in year_patterns:
-                match = re.search(pattern, line_lower, re.IGNORECASE)
-                if match:
-                    education_entry['year'] = match.group(0)
-                    break
-            
-            # Look for additional context in next few lines
-            for j in range(i + 1, min(i + 3, len(lines))):
-                next_line = lines[j].strip()
-                if next_line and not re.search(r'(?:experience|skills|projects|certifications)', next_line.lower(), re.IGNORECASE):
-                    education_entry['details'] += ' ' + next_line
-            
-            education_entries.append(education_entry)
+    for i, tags in enumerate(line_tags):
+        if tags.is_education:
+            education_entries.append({
+                'degree': tags.degree,
+                'university': tags.institution,
+                'year': tags.year,
+                # Additional context from the next two lines
+                'details': _collect_details(line_tags, i, 2, _EDUCATION_BREAKS, stop_at_break=False)
+            })
     
     return education_entries
 
 
-def extract_work_experience(text: str) -> List[Dict[str, str]]:
+def extract_work_experience(text: Union[str, ResumeDocument], line_tags: Optional[List[LineTags]] = None) -> List[Dict[str, str]]:
     """
     Extract work experience information from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        line_tags (List[LineTags], optional): Precomputed line classification
         
     Returns:
         List[Dict[str, str]]: List of work experience entries
     """
-    if not text:
+    document = as_document(text)
+    if not document.text:
         return []
     
-    experience_entries = []
-    
-    # Common experience indicators
-    experience_indicators = [
-        r'(?:experience|employment|work\s+history|professional\s+experience)',
-        r'(?:company|organization|firm|corporation|inc|llc)',
-        r'(?:position|role|title|job)',
-    ]
+    if line_tags is None:
+        line_tags = classify_lines(document)
     
-    lines = text.split('\n')
+    experience_entries = []
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        
+    for i, tags in enumerate(line_tags):
         # Look for company names or job titles
-        if any(re.search(pattern, line_lower, re.IGNORECASE) for pattern in experience_indicators):
-            experience_entry = {
-                'company': '',
-                'role': '',
-                'duration': '',
-                'details': line.strip()
-            }
-            
-            # Extract company name (simple heuristic)
-            company_match = re.search(r'([A-Z][a-zA-Z\s&]+(?:Company|Corporation|Inc|LLC|Ltd|Group|Organization))', line, re.IGNORECASE)
-            if company_match:
-                experience_entry['company'] = company_match.group(1).strip()
-            
-            # Extract role/title
-            role_patterns = [
-                r'(?:developer|engineer|manager|director|analyst|consultant|specialist|coordinator|officer|executive)',
-                r'(?:senior|junior|lead|principal|associate)',
-            ]
-            
-            for pattern in role_patterns:
-                match = re.search(pattern, line_lower, re.IGNORECASE)
-                if match:
-                    experience_entry['role'] = match.group(0).title()
-                    break
-            
-            # Extract duration
-            duration_patterns = [
-                r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\s*-\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\b',
-                r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\s*-\s*(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\b',
-                r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\s*-\s*(?:present|current)\b',
-                r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\s*-\s*(?:present|current)\b',
-                r'\b\d{4}\s*-\s*\d{4}\b',
-            ]
-            
-            for pattern in duration_patterns:
-                match = re.search(pattern, line_lower, re.IGNORECASE)
-                if match:
-                    experience_entry['duration'] = match.group(0)
-                    break
-            
-            # Look for additional context in next few lines
-            for j in range(i + 1, min(i + 4, len(lines))):
-                next_line = lines[j].strip()
-                if next_line and not re.search(r'(?:education|skills|projects|certifications)', next_line.lower(), re.IGNORECASE):
-                    experience_entry['details'] += ' ' + next_line
-                else:
-                    break
-            
-            if experience_entry['company'] or experience_entry['role']:
-                experience_entries.append(experience_entry)
+        if tags.is_experience and (tags.company or tags.role):
+            experience_entries.append({
+                'company': tags.company,
+                'role': tags.role,
+                'duration': tags.duration or tags.year_range,
+                # Additional context from the next three lines
+                'details': _collect_details(line_tags, i, 3, _EXPERIENCE_BREAKS, stop_at_break=True)
+            })
     
     return experience_entries
 
 
-def extract_projects(text: str) -> List[Dict[str, str]]:
+def extract_projects(text: Union[str, ResumeDocument], line_tags: Optional[List[LineTags]] = None) -> List[Dict[str, str]]:
     """
     Extract project information from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        line_tags (List[LineTags], optional): Precomputed line classification
         
     Returns:
         List[Dict[str, str]]: List of project entries
     """
-    if not text:
+    document = as_document(text)
+    if not document.text:
         return []
     
-    project_entries = []
-    
-    # Look for project sections
-    project_indicators = [
-        r'(?:projects?|portfolio|achievements?)',
-        r'(?:developed|created|built|implemented)',
-        r'(?:project\s*title|name\s*of\s*project)',
-    ]
+    if line_tags is None:
+        line_tags = classify_lines(document)
     
-    lines = text.split('\n')
+    project_entries = []
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
+    for i, tags in enumerate(line_tags):
+        if not tags.is_project:
+            continue
+        
+        # Additional context from the next two lines
+        description = _collect_details(line_tags, i, 2, _PROJECT_BREAKS, stop_at_break=True)
         
-        # Check if line indicates a project
-        if any(re.search(pattern, line_lower, re.IGNORECASE) for pattern in project_indicators):
-            project_entry = {
-                'title': '',
-                'description': line.strip(),
-                'technologies': [],
-                'duration': ''
-            }
-            
-            # Extract project title
-            title_match = re.search(r'(?:project\s*[:\-]?\s*|title\s*[:\-]?\s*)([A-Z][a-zA-Z\s]+)', line, re.IGNORECASE)
-            if title_match:
-                project_entry['title'] = title_match.group(1).strip()
-            
-            # Look for technologies used
-            tech_keywords = ['python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'django', 'flask', 'spring', 'aws', 'docker', 'kubernetes']
-            for tech in tech_keywords:
-                if tech in line_lower:
-                    project_entry['technologies'].append(tech.title())
-            
-            # Look for duration
-            duration_patterns = [
-                r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\s*-\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\b',
-                r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\s*-\s*(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\b',
-                r'\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}\s*-\s*(?:present|current)\b',
-                r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s*\d{4}\s*-\s*(?:present|current)\b',
-            ]
-            
-            for pattern in duration_patterns:
-                match = re.search(pattern, line_lower, re.IGNORECASE)
-                if match:
-                    project_entry['duration'] = match.group(0)
-                    break
-            
-            # Look for additional context in next few lines
-            for j in range(i + 1, min(i + 3, len(lines))):
-                next_line = lines[j].strip()
-                if next_line and not re.search(r'(?:experience|education|skills|certifications)', next_line.lower(), re.IGNORECASE):
-                    project_entry['description'] += ' ' + next_line
-                else:
-                    break
-            
-            if project_entry['title'] or len(project_entry['description']) > 20:
-                project_entries.append(project_entry)
+        if tags.project_title or len(description) > 20:
+            project_entries.append({
+                'title': tags.project_title,
+                'description': description,
+                'technologies': list(tags.technologies),
+                'duration': tags.duration
+            })
     
     return project_entries
 
 
-def extract_certifications(text: str) -> List[str]:
+def extract_certifications(text: Union[str, ResumeDocument], line_tags: Optional[List[LineTags]] = None) -> List[str]:
     """
     Extract certifications from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        line_tags (List[LineTags], optional): Precomputed line classification
         
     Returns:
         List[str]: List of certifications found
     """
-    if not text:
+    document = as_document(text)
+    if not document.text:
         return []
     
-    certifications = []
-    
-    # Common certification patterns
-    cert_patterns = [
-        r'(?:certified|certification|certificate)\s+[:\-]?\s*([A-Z][a-zA-Z\s]+)',
-        r'(?:AWS|Microsoft|Google|Oracle|Cisco|PMP|Scrum)\s+[A-Z][a-zA-Z\s]+',
-        r'\b(?:AWS|Azure|GCP|Oracle|Cisco|PMP|CSM|PSM)\b',
-    ]
+    if line_tags is None:
+        line_tags = classify_lines(document)
     
-    lines = text.split('\n')
+    certifications = []
     
-    for line in lines:
-        line_lower = line.lower()
-        
-        # Check for certification keywords
-        if any(word in line_lower for word in ['certified', 'certification', 'certificate']):
-            for pattern in cert_patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    cert_name = match.strip()
-                    if cert_name and cert_name not in certifications:
-                        certifications.append(cert_name)
+    for tags in line_tags:
+        for cert_name in tags.certifications:
+            if cert_name and cert_name not in certifications:
+                certifications.append(cert_name)
     
     return certifications
 
 
-def extract_entities(text: str) -> Dict[str, any]:
+def extract_entities(text: Union[str, ResumeDocument], budget: Optional[TimeBudget] = None) -> Dict[str, any]:
     """
     Complete entity extraction pipeline for resume text.
     
+    Education, experience, projects and certifications are always extracted;
+    NER name extraction is optional and skipped (name None) under a spent budget.
+    
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        budget (TimeBudget, optional): Time budget of the current analysis
         
     Returns:
         Dict[str, any]: Extracted entities including name, education, experience, projects, certifications
     """
-    if not text:
-        return {
-            'name': None,
-            'education': [],
-            'experience': [],
-            'projects': [],
-            'certifications': []
-        }
-    
-    # Extract different types of entities
-    name = extract_name(text)
-    education = extract_education(text)
-    experience = extract_work_experience(text)
-    projects = extract_projects(text)
-    certifications = extract_certifications(text)
+    document = as_document(text)
+    if not document.text:
+        return _empty_entities()
+    
+    # Core extractors run first; the NER name is only looked up while budget remains
+    entities = _assemble_entities(document, None)
+    if allows(budget, 'name'):
+        entities['name'] = extract_name(document)
+    return entities
+
+
+def extract_entities_batch(
+    texts: Iterable[Union[str, ResumeDocument]],
+    batch_size: int = 32,
+    n_process: int = 1,
+    header_chars: Optional[int] = None
+) -> Iterator[Dict[str, any]]:
+    """
+    Extract entities from many resumes, batching NER through nlp.pipe.
+    
+    Texts are consumed lazily and results are yielded in input order; each
+    result is identical to what extract_entities returns for that text.
+    
+    Args:
+        texts (Iterable[Union[str, ResumeDocument]]): Cleaned resume texts or documents
+        batch_size (int): Number of header windows per spaCy batch
+        n_process (int): Number of spaCy worker processes
+        header_chars (int, optional): Number of leading characters to run NER on,
+            defaults to NER_HEADER_CHARS
+        
+    Yields:
+        Dict[str, any]: Extracted entities for each resume
+    """
+    nlp = get_nlp()
+    if not nlp:
+        for text in texts:
+            yield extract_entities(text)
+        return
+    
+    # nlp.pipe yields in input order, so documents can be matched up FIFO
+    pending = deque()
+    
+    def header_windows():
+        for text in texts:
+            document = as_document(text)
+            pending.append(document)
+            yield get_header_window(document, header_chars) if document.text else ''
+    
+    for doc in nlp.pipe(header_windows(), batch_size=batch_size, n_process=n_process):
+        document = pending.popleft()
+        if not document.text:
+            yield _empty_entities()
+        else:
+            yield _assemble_entities(document, select_person_name(doc))
+
+
+def _empty_entities() -> Dict[str, any]:
+    """Get the entity structure for an empty resume."""
+    return {
+        'name': None,
+        'education': [],
+        'experience': [],
+        'projects': [],
+        'certifications': []
+    }
+
+
+def _assemble_entities(document: ResumeDocument, name: Optional[str]) -> Dict[str, any]:
+    """Run the line-based extractors and combine them with the extracted name."""
+    # Every line is classified once and shared by the four extractors
+    line_tags = classify_lines(document)
+    
+    education = extract_education(document, line_tags)
+    experience = extract_work_experience(document, line_tags)
+    projects = extract_projects(document, line_tags)
+    certifications = extract_certifications(document, line_tags)
     
     return {
         'name': name,
@@ -373,4 +579,4 @@ def extract_entities(text: str) -> Dict[str, any]:
         'experience': experience,
         'projects': projects,
         'certifications': certifications
-    }
\ No newline at end of file
+    }
@@ -5,57 +5,343 @@ This module provides the main functionality for analyzing resumes,
 including text extraction, preprocessing, and structured data extraction.
 """
 
+import io
 import os
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO, Callable, Iterable, Iterator
 from pathlib import Path
 
 from flask import request
-from text_preprocessing import preprocess_resume_text, extract_emails, extract_phone_numbers
+from doc_converter import DocConverterPool, get_doc_converter
+from docx_extraction import extract_docx_text, read_docx_page_count
+from text_preprocessing import extract_emails, extract_phone_numbers
+from resume_document import preprocess_resume
 from nlp_extraction import extract_entities
 from skill_extraction import extract_skills_comprehensive
 from skill_keywords import ALL_KEYWORDS
+from analysis_cache import AnalysisCache, get_vocabulary_fingerprint
+from analysis_jobs import AnalysisJobManager, JobQueueFull
+from time_budget import TimeBudget
+
+
+# Bump whenever a change to the pipeline changes analysis output, so cached
+# results from the previous version are no longer served
+ANALYZER_VERSION = "7"
+
+# Uploads up to this size are parsed from memory; larger ones spill to disk
+DEFAULT_SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
+# Pipeline stages reported to progress callbacks, in order
+ANALYSIS_STAGES = ('extract_text', 'preprocess', 'skills', 'entities')
+
+# Per-stage timings and input size in processing_metadata; set RESUME_TIMINGS=0
+# (or this flag to False at runtime) to leave them out of every result
+TIMINGS_ENABLED = os.getenv('RESUME_TIMINGS', '1') != '0'
+
+# PDFs with fewer pages than this are extracted serially even when parallel
+# extraction is enabled, as starting the work in other processes costs more
+# than it saves on short resumes
+DEFAULT_PDF_PARALLEL_MIN_PAGES = 6
+
+
+def _extract_pdf_page_range(source: Union[str, bytes], start: int, end: int) -> List[str]:
+    """
+    Extract the text of a range of PDF pages in a worker process.
+    
+    Each worker opens the document itself, so only the path or file content
+    and the page numbers cross the process boundary.
+    
+    Args:
+        source (Union[str, bytes]): Path to the PDF file or its content
+        start (int): Index of the first page
+        end (int): Index after the last page
+        
+    Returns:
+        List[str]: Text of each page in the range, empty for pages without text
+    """
+    import pdfplumber
+    
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    
+    with pdfplumber.open(source) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages[start:end]]
+
+
+def _split_page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split pages into contiguous, near-equal (start, end) ranges.
+    
+    Args:
+        page_count (int): Number of pages in the document
+        parts (int): Maximum number of ranges
+        
+    Returns:
+        List[Tuple[int, int]]: Page ranges in document order
+    """
+    parts = max(1, min(parts, page_count))
+    size, remainder = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < remainder else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+class StageTimer:
+    """Times consecutive pipeline stages with a monotonic clock and reports progress."""
+    
+    def __init__(self, progress: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the timer.
+        
+        Args:
+            progress (Callable[[str], None], optional): Called with each stage name as it starts
+        """
+        self.progress = progress
+        self.durations: Dict[str, float] = {}
+        self._stage: Optional[str] = None
+        self._stage_start = 0.0
+        self._start = time.perf_counter()
+    
+    def start(self, stage: str) -> None:
+        """
+        End the running stage, if any, and start the next one.
+        
+        Args:
+            stage (str): Stage name from ANALYSIS_STAGES
+        """
+        now = time.perf_counter()
+        if self._stage:
+            self.durations[self._stage] = self.durations.get(self._stage, 0.0) + now - self._stage_start
+        self._stage, self._stage_start = stage, now
+        if self.progress:
+            self.progress(stage)
+    
+    def timings_ms(self) -> Dict[str, float]:
+        """
+        End the running stage and get every stage's duration.
+        
+        Returns:
+            Dict[str, float]: Milliseconds per stage, plus 'total' since the timer was created
+        """
+        now = time.perf_counter()
+        if self._stage:
+            self.durations[self._stage] = self.durations.get(self._stage, 0.0) + now - self._stage_start
+            self._stage = None
+        timings = {stage: round(seconds * 1000, 2) for stage, seconds in self.durations.items()}
+        timings['total'] = round((now - self._start) * 1000, 2)
+        return timings
 
 
 class ResumeAnalyzer:
     """Main class for resume analysis and structured data extraction."""
     
-    def __init__(self):
-        """Initialize the resume analyzer."""
-        pass
+    def __init__(self, spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE, pdf_workers: int = 0,
+                 pdf_parallel_min_pages: int = DEFAULT_PDF_PARALLEL_MIN_PAGES, pdf_streaming: bool = False,
+                 pdf_max_pages: Optional[int] = None, pdf_max_chars: Optional[int] = None,
+                 doc_converter: Optional[DocConverterPool] = None, time_budget: Optional[float] = None,
+                 include_context_spans: bool = False):
+        """
+        Initialize the resume analyzer.
+        
+        Args:
+            spool_max_size (int): Largest upload, in bytes, kept in memory by analyze_resume_bytes
+            pdf_workers (int): Processes used to extract PDF pages in parallel, 0 or 1 to stay serial
+            pdf_parallel_min_pages (int): Smallest page count extracted in parallel
+            pdf_streaming (bool): Extract PDFs page by page with iter_pdf_pages instead of all at once
+            pdf_max_pages (int, optional): Default page budget of iter_pdf_pages
+            pdf_max_chars (int, optional): Default character budget of iter_pdf_pages
+            doc_converter (DocConverterPool, optional): Pool for .doc files, the shared pool if None
+            time_budget (float, optional): Default seconds allowed per analysis before optional
+                stages are degraded, unlimited if None
+            include_context_spans (bool): Add the cleaned text and the offsets of the sentences
+                each skill occurs in, for highlighting skills in the UI
+        """
+        self.spool_max_size = spool_max_size
+        self.pdf_workers = pdf_workers
+        self.pdf_parallel_min_pages = pdf_parallel_min_pages
+        self.pdf_streaming = pdf_streaming
+        self.pdf_max_pages = pdf_max_pages
+        self.pdf_max_chars = pdf_max_chars
+        self.doc_converter = doc_converter
+        self.time_budget = time_budget
+        self.include_context_spans = include_context_spans
+        
+        self._pdf_pool = None
+        self._pdf_pool_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Shut down the PDF worker processes, if any were started."""
+        with self._pdf_pool_lock:
+            if self._pdf_pool is not None:
+                self._pdf_pool.shutdown()
+                self._pdf_pool = None
+    
+    def _get_pdf_pool(self) -> ProcessPoolExecutor:
+        """Get the PDF worker pool, starting it on first use."""
+        with self._pdf_pool_lock:
+            if self._pdf_pool is None:
+                self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers)
+            return self._pdf_pool
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    def extract_text_from_pdf(self, pdf_path: Union[str, BinaryIO], streaming: bool = False,
+                              stats: Optional[Dict[str, Any]] = None) -> Union[str, Iterator[str]]:
         """
         Extract text from a PDF file.
         
         Args:
-            pdf_path (str): Path to the PDF file
+            pdf_path (Union[str, BinaryIO]): Path to the PDF file or a seekable binary stream
+            streaming (bool): Return a page generator from iter_pdf_pages instead of the full text
+            stats (Dict[str, Any], optional): Receives the page count under 'pages'
             
         Returns:
-            str: Extracted text from the PDF
+            Union[str, Iterator[str]]: Extracted text from the PDF, or its page texts when streaming
+        """
+        if streaming:
+            return self.iter_pdf_pages(pdf_path, stats=stats)
+        
+        try:
+            import pdfplumber
+        except ImportError:
+            raise ImportError("pdfplumber is required for PDF extraction. Install it with: pip install pdfplumber")
+        
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                page_count = len(pdf.pages)
+                if stats is not None:
+                    stats['pages'] = page_count
+                if self.pdf_workers > 1 and page_count >= self.pdf_parallel_min_pages:
+                    page_texts = None
+                else:
+                    page_texts = [page.extract_text() for page in pdf.pages]
+            
+            if page_texts is None:
+                page_texts = self._extract_pdf_pages_parallel(pdf_path, page_count)
+            
+            return '\n\n'.join(text for text in page_texts if text)
+        except Exception as e:
+            raise Exception(f"Error extracting text from PDF: {str(e)}")
+    
+    def iter_pdf_pages(self, pdf_path: Union[str, BinaryIO], max_pages: Optional[int] = None,
+                       max_chars: Optional[int] = None, stats: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Yield the text of a PDF page by page within a page and character budget.
+        
+        pdfplumber keeps every page's parsed layout objects until the document
+        is closed; each page is closed right after its text is extracted, so
+        memory stays bounded by the largest page rather than the whole file.
+        Extraction stops quietly once either budget is used up, the last page
+        being cut to the remaining characters.
+        
+        Args:
+            pdf_path (Union[str, BinaryIO]): Path to the PDF file or a seekable binary stream
+            max_pages (int, optional): Maximum pages to read, pdf_max_pages if None
+            max_chars (int, optional): Maximum characters to yield, pdf_max_chars if None
+            stats (Dict[str, Any], optional): Receives the number of pages read so far under 'pages'
+            
+        Yields:
+            str: Text of each page that has any
         """
         try:
             import pdfplumber
         except ImportError:
             raise ImportError("pdfplumber is required for PDF extraction. Install it with: pip install pdfplumber")
         
+        max_pages = self.pdf_max_pages if max_pages is None else max_pages
+        remaining_chars = self.pdf_max_chars if max_chars is None else max_chars
+        
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                text_pages = []
-                for page in pdf.pages:
-                    text = page.extract_text()
+                for index, page in enumerate(pdf.pages):
+                    if max_pages is not None and index >= max_pages:
+                        break
+                    
+                    try:
+                        text = page.extract_text() or ''
+                    finally:
+                        page.close()
+                    if stats is not None:
+                        stats['pages'] = index + 1
+                    
+                    if remaining_chars is not None:
+                        text = text[:remaining_chars]
+                        remaining_chars -= len(text)
                     if text:
-                        text_pages.append(text)
-                return '\n\n'.join(text_pages)
+                        yield text
+                    if remaining_chars == 0:
+                        break
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
     
-    def extract_text_from_docx(self, docx_path: str) -> str:
+    def _extract_pdf_pages_parallel(self, pdf_path: Union[str, BinaryIO], page_count: int) -> List[str]:
+        """
+        Extract PDF pages across the worker pool, keeping document order.
+        
+        Args:
+            pdf_path (Union[str, BinaryIO]): Path to the PDF file or a seekable binary stream
+            page_count (int): Number of pages in the document
+            
+        Returns:
+            List[str]: Text of every page in order
+        """
+        if isinstance(pdf_path, (str, os.PathLike)):
+            source = os.fspath(pdf_path)
+        else:
+            pdf_path.seek(0)
+            source = pdf_path.read()
+        
+        pool = self._get_pdf_pool()
+        futures = [
+            pool.submit(_extract_pdf_page_range, source, start, end)
+            for start, end in _split_page_ranges(page_count, self.pdf_workers)
+        ]
+        
+        page_texts = []
+        for future in futures:
+            page_texts.extend(future.result())
+        return page_texts
+    
+    def extract_text_from_docx(self, docx_path: Union[str, BinaryIO], stats: Optional[Dict[str, Any]] = None) -> str:
         """
         Extract text from a Word document (.docx).
         
+        The archive is stream-parsed by docx_extraction, which also reads
+        tables, headers, footers and text boxes. python-docx is only used
+        as a fallback for files that extractor cannot parse.
+        
         Args:
-            docx_path (str): Path to the Word document
+            docx_path (Union[str, BinaryIO]): Path to the Word document or a seekable binary stream
+            stats (Dict[str, Any], optional): Receives the page count Word recorded under 'pages'
+            
+        Returns:
+            str: Extracted text from the document
+        """
+        try:
+            text = extract_docx_text(docx_path)
+            if stats is not None:
+                stats['pages'] = read_docx_page_count(docx_path)
+            return text
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            if not isinstance(docx_path, (str, os.PathLike)):
+                docx_path.seek(0)
+            return self._extract_text_from_docx_model(docx_path)
+    
+    def _extract_text_from_docx_model(self, docx_path: Union[str, BinaryIO]) -> str:
+        """
+        Extract body paragraph text from a Word document with python-docx.
+        
+        Args:
+            docx_path (Union[str, BinaryIO]): Path to the Word document or a seekable binary stream
             
         Returns:
             str: Extracted text from the document
@@ -75,24 +361,30 @@ class ResumeAnalyzer:
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX: {str(e)}")
     
-    def extract_text_from_doc(self, doc_path: str) -> str:
+    def extract_text_from_doc(self, doc_path: Union[str, BinaryIO]) -> str:
         """
         Extract text from a legacy Word document (.doc).
         
+        Conversion runs in the persistent worker pool of doc_converter, which
+        enforces a timeout and memoises results by content hash.
+        
         Args:
-            doc_path (str): Path to the Word document
+            doc_path (Union[str, BinaryIO]): Path to the Word document or a binary stream
             
         Returns:
             str: Extracted text from the document
         """
-        try:
-            import textract
-        except ImportError:
-            raise ImportError("textract is required for DOC extraction. Install it with: pip install textract")
+        converter = self.doc_converter or get_doc_converter()
         
         try:
-            text = textract.process(doc_path).decode('utf-8')
-            return text
+            if isinstance(doc_path, (str, os.PathLike)):
+                with open(doc_path, 'rb') as doc_file:
+                    content = doc_file.read()
+            else:
+                doc_path.seek(0)
+                content = doc_path.read()
+            
+            return converter.convert_bytes(content)
         except Exception as e:
             raise Exception(f"Error extracting text from DOC: {str(e)}")
     
@@ -116,50 +408,101 @@ class ResumeAnalyzer:
         else:
             return 'unknown'
     
-    def extract_text_from_file(self, file_path: str) -> str:
+    def extract_text_from_file(self, file_path: str, stats: Optional[Dict[str, Any]] = None) -> Union[str, Iterator[str]]:
         """
         Extract text from a file based on its type.
         
         Args:
             file_path (str): Path to the file
+            stats (Dict[str, Any], optional): Receives the page count, when the format has one
             
         Returns:
-            str: Extracted text
+            Union[str, Iterator[str]]: Extracted text, or page texts for PDFs in streaming mode
+        """
+        return self.extract_text_from_stream(file_path, self.detect_file_type(file_path), stats)
+    
+    def extract_text_from_stream(self, source: Union[str, BinaryIO], file_type: str,
+                                 stats: Optional[Dict[str, Any]] = None) -> Union[str, Iterator[str]]:
         """
-        file_type = self.detect_file_type(file_path)
+        Extract text from a file path or binary stream of a known type.
         
+        Args:
+            source (Union[str, BinaryIO]): Path to the file or a seekable binary stream
+            file_type (str): File type as returned by detect_file_type
+            stats (Dict[str, Any], optional): Receives the page count, when the format has one
+            
+        Returns:
+            Union[str, Iterator[str]]: Extracted text, or page texts for PDFs in streaming mode
+        """
         if file_type == 'pdf':
-            return self.extract_text_from_pdf(file_path)
+            return self.extract_text_from_pdf(source, streaming=self.pdf_streaming, stats=stats)
         elif file_type == 'docx':
-            return self.extract_text_from_docx(file_path)
+            return self.extract_text_from_docx(source, stats)
         elif file_type == 'doc':
-            return self.extract_text_from_doc(file_path)
+            return self.extract_text_from_doc(source)
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
     
-    def analyze_resume_text(self, text: str) -> Dict[str, Any]:
+    def analyze_resume_text(self, text: Union[str, Iterable[str]],
+                            progress: Optional[Callable[[str], None]] = None,
+                            time_budget: Optional[float] = None) -> Dict[str, Any]:
         """
         Analyze resume text and extract structured information.
         
+        Contact details, skills, education, experience, projects and
+        certifications are always extracted. Once the time budget is spent,
+        the optional stages (skill levels, skill context, skill distribution
+        and NER name extraction) are skipped or cut short, and
+        processing_metadata['degraded_stages'] names each one.
+        
+        Args:
+            text (Union[str, Iterable[str]]): Raw resume text, or chunks of it such as page texts
+            progress (Callable[[str], None], optional): Called with each stage name from
+                ANALYSIS_STAGES as that stage starts
+            time_budget (float, optional): Seconds allowed for the analysis, self.time_budget if None
+            
+        Returns:
+            Dict[str, Any]: Structured resume data
+        """
+        budget = TimeBudget(self.time_budget if time_budget is None else time_budget)
+        return self._analyze_text(text, StageTimer(progress), {}, budget)
+    
+    def _analyze_text(self, text: Union[str, Iterable[str]], timer: StageTimer,
+                      input_stats: Dict[str, Any], budget: TimeBudget) -> Dict[str, Any]:
+        """
+        Run the analysis stages after text extraction.
+        
         Args:
-            text (str): Raw resume text
+            text (Union[str, Iterable[str]]): Raw resume text or chunks of it
+            timer (StageTimer): Timer of the current analysis, possibly already timing extraction
+            input_stats (Dict[str, Any]): Input size known from extraction, e.g. bytes and pages
+            budget (TimeBudget): Time budget of the current analysis, started before extraction
             
         Returns:
             Dict[str, Any]: Structured resume data
         """
-        if not text or not isinstance(text, str):
+        if not text:
             return self.get_empty_resume_data()
         
-        # Preprocess the text
-        preprocessed = preprocess_resume_text(text)
-        cleaned_text = preprocessed['cleaned_text']
+        # Preprocess the text; the document is shared by every extractor below.
+        # Streamed PDF pages are extracted as this stage consumes them.
+        timer.start('preprocess')
+        preprocessed = preprocess_resume(text)
+        document = preprocessed['document']
         sections = preprocessed['sections']
         
-        # Extract entities using NLP
-        entities = extract_entities(cleaned_text)
+        if not document.text:
+            return self.get_empty_resume_data()
+        
+        # Extract skills comprehensively; core skills come before any optional stage
+        timer.start('skills')
+        skills_analysis = extract_skills_comprehensive(
+            document, sections, include_context_spans=self.include_context_spans, budget=budget
+        )
         
-        # Extract skills comprehensively
-        skills_analysis = extract_skills_comprehensive(cleaned_text, sections)
+        # Extract entities using NLP
+        timer.start('entities')
+        entities = extract_entities(document, budget)
         
         # Extract contact information
         emails = preprocessed['emails']
@@ -172,6 +515,7 @@ class ResumeAnalyzer:
             'phone': phone_numbers[0] if phone_numbers else None,
             'education': entities['education'],
             'skills': skills_analysis['skills']['all'],
+            'skill_levels': skills_analysis['skill_levels'],
             'experience': entities['experience'],
             'projects': entities['projects'],
             'certifications': entities['certifications'],
@@ -181,28 +525,93 @@ class ResumeAnalyzer:
                 'technical_skills_count': skills_analysis['summary']['technical_skills'],
                 'soft_skills_count': skills_analysis['summary']['soft_skills'],
                 'skill_categories': list(skills_analysis['distribution'].keys()),
-                'sections_found': list(sections.keys())
+                'sections_found': list(sections.keys()),
+                'time_budget_ms': round(budget.seconds * 1000) if budget.seconds is not None else None,
+                'degraded_stages': dict(budget.degraded)
             }
         }
         
+        if self.include_context_spans:
+            # Offsets index into 'text', the cleaned text the skills were found in
+            resume_data['text'] = document.text
+            resume_data['skill_context_spans'] = skills_analysis['context_spans']
+        
+        if TIMINGS_ENABLED:
+            resume_data['processing_metadata']['timings_ms'] = timer.timings_ms()
+            resume_data['processing_metadata']['input'] = {
+                'bytes': input_stats.get('bytes'),
+                'pages': input_stats.get('pages'),
+                'chars': len(document.text),
+                'lines': len(document.lines)
+            }
+        
         return resume_data
     
-    def analyze_resume_file(self, file_path: str) -> Dict[str, Any]:
+    def analyze_resume_file(self, file_path: str, time_budget: Optional[float] = None) -> Dict[str, Any]:
         """
         Analyze a resume file and extract structured information.
         
         Args:
             file_path (str): Path to the resume file
+            time_budget (float, optional): Seconds allowed including text extraction,
+                see analyze_resume_text
             
         Returns:
             Dict[str, Any]: Structured resume data
         """
         try:
+            budget = TimeBudget(self.time_budget if time_budget is None else time_budget)
+            timer = StageTimer()
+            input_stats = {'bytes': os.path.getsize(file_path)}
+            
             # Extract text from file
-            raw_text = self.extract_text_from_file(file_path)
+            timer.start('extract_text')
+            raw_text = self.extract_text_from_file(file_path, input_stats)
             
             # Analyze the extracted text
-            return self.analyze_resume_text(raw_text)
+            return self._analyze_text(raw_text, timer, input_stats, budget)
+            
+        except Exception as e:
+            return {
+                'error': True,
+                'message': str(e),
+                'data': self.get_empty_resume_data()
+            }
+    
+    def analyze_resume_bytes(self, content: bytes, filename: str,
+                             progress: Optional[Callable[[str], None]] = None,
+                             time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Analyze an in-memory resume file and extract structured information.
+        
+        The content is parsed from a spooled buffer that only spills to a
+        temporary file when it is larger than spool_max_size, so uploads
+        never need to be written out and re-opened by path.
+        
+        Args:
+            content (bytes): Raw file content
+            filename (str): Original file name, used to detect the file type
+            progress (Callable[[str], None], optional): Stage callback, see analyze_resume_text
+            time_budget (float, optional): Seconds allowed including text extraction,
+                see analyze_resume_text
+            
+        Returns:
+            Dict[str, Any]: Structured resume data
+        """
+        try:
+            file_type = self.detect_file_type(filename)
+            budget = TimeBudget(self.time_budget if time_budget is None else time_budget)
+            timer = StageTimer(progress)
+            input_stats = {'bytes': len(content)}
+            
+            timer.start('extract_text')
+            with tempfile.SpooledTemporaryFile(max_size=self.spool_max_size) as buffer:
+                buffer.write(content)
+                buffer.seek(0)
+                raw_text = self.extract_text_from_stream(buffer, file_type, input_stats)
+                
+                # Analyze while the buffer is open, as streamed pages are read lazily
+                return self._analyze_text(raw_text, timer, input_stats, budget)
             
         except Exception as e:
             return {
@@ -218,12 +627,13 @@ class ResumeAnalyzer:
         Returns:
             Dict[str, Any]: Empty resume data structure
         """
-        return {
+        resume_data = {
             'name': None,
             'email': None,
             'phone': None,
             'education': [],
             'skills': [],
+            'skill_levels': {},
             'experience': [],
             'projects': [],
             'certifications': [],
@@ -233,19 +643,160 @@ class ResumeAnalyzer:
                 'technical_skills_count': 0,
                 'soft_skills_count': 0,
                 'skill_categories': [],
-                'sections_found': []
+                'sections_found': [],
+                'time_budget_ms': None,
+                'degraded_stages': {}
             }
         }
+        
+        if self.include_context_spans:
+            resume_data['text'] = ''
+            resume_data['skill_context_spans'] = {}
+        
+        return resume_data
+
+
+def get_resume_upload() -> Tuple[Any, Optional[Tuple[Dict[str, Any], int]]]:
+    """
+    Get and validate the resume file of the current upload request.
+    
+    Returns:
+        Tuple[Any, Optional[Tuple[Dict[str, Any], int]]]: The uploaded file and None,
+            or None and the error response to return
+    """
+    # Check if file is present in request
+    if 'resume' not in request.files:
+        return None, ({
+            'success': False,
+            'error': 'No file provided',
+            'message': 'Please upload a resume file with the field name "resume"'
+        }, 400)
+    
+    file = request.files['resume']
+    
+    # Check if file has a name
+    if not file or file.filename == '':
+        return None, ({
+            'success': False,
+            'error': 'No file selected',
+            'message': 'Please select a file to upload'
+        }, 400)
+    
+    # Check file extension
+    allowed_extensions = {'pdf', 'doc', 'docx'}
+    if '.' not in file.filename:
+        return None, ({
+            'success': False,
+            'error': 'Invalid file',
+            'message': f'File must have one of these extensions: {", ".join(allowed_extensions)}'
+        }, 400)
+    
+    file_extension = file.filename.rsplit('.', 1)[1].lower()
+    if file_extension not in allowed_extensions:
+        return None, ({
+            'success': False,
+            'error': 'Invalid file type',
+            'message': f'File type not supported. Please upload a PDF, DOC, or DOCX file.'
+        }, 400)
+    
+    return file, None
+
+
+def get_analyzer_options(config) -> Dict[str, Any]:
+    """
+    Get ResumeAnalyzer keyword arguments from the application config.
+    
+    Args:
+        config: Flask application config
+        
+    Returns:
+        Dict[str, Any]: Picklable keyword arguments for ResumeAnalyzer
+    """
+    return {
+        'spool_max_size': config.get('RESUME_SPOOL_MAX_SIZE', DEFAULT_SPOOL_MAX_SIZE),
+        'pdf_workers': config.get('RESUME_PDF_WORKERS', 0),
+        'pdf_parallel_min_pages': config.get('RESUME_PDF_PARALLEL_MIN_PAGES', DEFAULT_PDF_PARALLEL_MIN_PAGES),
+        'pdf_streaming': config.get('RESUME_PDF_STREAMING', False),
+        'pdf_max_pages': config.get('RESUME_PDF_MAX_PAGES'),
+        'pdf_max_chars': config.get('RESUME_PDF_MAX_CHARS'),
+        'time_budget': config.get('RESUME_TIME_BUDGET_SECONDS'),
+        'include_context_spans': config.get('RESUME_CONTEXT_SPANS', False)
+    }
+
+
+def is_cacheable(result: Dict[str, Any]) -> bool:
+    """
+    Check whether an analysis result may be cached.
+    
+    Failed analyses and results with stages degraded by the time budget are
+    not cached, so the next upload of the same file gets a complete analysis.
+    
+    Args:
+        result (Dict[str, Any]): Result of a ResumeAnalyzer analysis
+        
+    Returns:
+        bool: True if the result is complete
+    """
+    if result.get('error', False):
+        return False
+    return not result.get('processing_metadata', {}).get('degraded_stages')
+
+
+def create_analysis_cache(config) -> AnalysisCache:
+    """
+    Create the analysis result cache described by the application config.
+    
+    Args:
+        config: Flask application config
+        
+    Returns:
+        AnalysisCache: Cache stamped with the analyzer version, skill vocabulary
+            and the options that change the content or shape of results
+    """
+    version = f"{ANALYZER_VERSION}-{get_vocabulary_fingerprint()}"
+    if config.get('RESUME_CONTEXT_SPANS', False):
+        version += "-spans"
+    # Streamed PDFs are cut to the page and character budgets, so results
+    # computed under other budgets must not be served
+    max_pages = config.get('RESUME_PDF_MAX_PAGES')
+    max_chars = config.get('RESUME_PDF_MAX_CHARS')
+    if config.get('RESUME_PDF_STREAMING', False) and (max_pages or max_chars):
+        version += f"-pdf{max_pages or 0}p{max_chars or 0}c"
+    
+    return AnalysisCache(
+        version=version,
+        cache_dir=config.get('RESUME_CACHE_DIR'),
+        max_entries=config.get('RESUME_CACHE_MAX_ENTRIES', 256),
+        disk_max_bytes=config.get('RESUME_CACHE_DISK_MAX_BYTES'),
+        ttl_seconds=config.get('RESUME_CACHE_TTL_SECONDS')
+    )
 
 
 def create_analyze_resume_endpoint(app):
     """
-    Create the /analyze-resume API endpoint.
+    Create the /analyze-resume API endpoints.
     
     Args:
         app: Flask application instance
     """
-    analyzer = ResumeAnalyzer()
+    analyzer = ResumeAnalyzer(**get_analyzer_options(app.config))
+    cache = create_analysis_cache(app.config)
+    
+    def run_analysis_job(content: bytes, filename: str, progress: Callable[[str], None]) -> Dict[str, Any]:
+        """Analyze an upload on a job thread and cache a successful result."""
+        result = analyzer.analyze_resume_bytes(content, filename, progress)
+        if is_cacheable(result):
+            cache.put(cache.make_key(content), result)
+        return result
+    
+    jobs = AnalysisJobManager(
+        run_analysis_job,
+        stages=ANALYSIS_STAGES,
+        workers=app.config.get('RESUME_JOB_WORKERS', 2),
+        max_queued=app.config.get('RESUME_JOB_MAX_QUEUED', 32),
+        ttl_seconds=app.config.get('RESUME_JOB_TTL_SECONDS', 900),
+        state_dir=app.config.get('RESUME_JOB_DIR')
+    )
     
     @app.route('/analyze-resume', methods=['POST'])
     def analyze_resume():
@@ -257,53 +808,25 @@ def create_analyze_resume_endpoint(app):
         Returns:
             JSON response with structured resume data
         """
-        # Check if file is present in request
-        if 'resume' not in request.files:
-            return {
-                'success': False,
-                'error': 'No file provided',
-                'message': 'Please upload a resume file with the field name "resume"'
-            }, 400
-        
-        file = request.files['resume']
-        
-        # Check if file has a name
-        if not file or file.filename == '':
-            return {
-                'success': False,
-                'error': 'No file selected',
-                'message': 'Please select a file to upload'
-            }, 400
-        
-        # Check file extension
-        allowed_extensions = {'pdf', 'doc', 'docx'}
-        if '.' not in file.filename:
-            return {
-                'success': False,
-                'error': 'Invalid file',
-                'message': f'File must have one of these extensions: {", ".join(allowed_extensions)}'
-            }, 400
-        
-        file_extension = file.filename.rsplit('.', 1)[1].lower()
-        if file_extension not in allowed_extensions:
-            return {
-                'success': False,
-                'error': 'Invalid file type',
-                'message': f'File type not supported. Please upload a PDF, DOC, or DOCX file.'
-            }, 400
+        file, error_response = get_resume_upload()
+        if error_response:
+            return error_response
         
         try:
-            # Save file temporarily
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_extension}') as temp_file:
-                file.save(temp_file.name)
-                temp_file_path = temp_file.name
+            content = file.read()
             
-            # Analyze the resume
-            result = analyzer.analyze_resume_file(temp_file_path)
+            # Identical uploads are served from the cache without parsing the file
+            cache_key = cache.make_key(content)
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                return {
+                    'success': True,
+                    'data': cached_result,
+                    'cache': {'hit': True, **cache.stats()}
+                }, 200
             
-            # Clean up temporary file
-            os.unlink(temp_file_path)
+            # Analyze the resume straight from the uploaded bytes
+            result = analyzer.analyze_resume_bytes(content, file.filename)
             
             # Check if there was an error during analysis
             if result.get('error', False):
@@ -313,10 +836,14 @@ def create_analyze_resume_endpoint(app):
                     'message': result['message']
                 }, 500
             
+            if is_cacheable(result):
+                cache.put(cache_key, result)
+            
             # Return successful analysis result
             return {
                 'success': True,
-                'data': result
+                'data': result,
+                'cache': {'hit': False, **cache.stats()}
             }, 200
             
         except Exception as e:
@@ -325,6 +852,73 @@ def create_analyze_resume_endpoint(app):
                 'error': 'Server error',
                 'message': f'An error occurred while processing the file: {str(e)}'
             }, 500
+    
+    @app.route('/analyze-resume/jobs', methods=['POST'])
+    def submit_analysis_job():
+        """
+        API endpoint to queue a resume file for analysis.
+        
+        Expects the same multipart/form-data request as /analyze-resume and
+        returns as soon as the file is queued.
+        
+        Returns:
+            JSON response with the job id and the URL to poll for its status
+        """
+        file, error_response = get_resume_upload()
+        if error_response:
+            return error_response
+        
+        try:
+            content = file.read()
+            
+            # A cached result completes the job without queueing any work
+            cached_result = cache.get(cache.make_key(content))
+            if cached_result is not None:
+                job = jobs.add_completed(file.filename, cached_result)
+            else:
+                job = jobs.submit(content, file.filename)
+            
+            return {
+                'success': True,
+                'job_id': job.job_id,
+                'status': job.status,
+                'status_url': f'/analyze-resume/jobs/{job.job_id}'
+            }, 202
+            
+        except JobQueueFull as e:
+            return {
+                'success': False,
+                'error': 'Too many jobs',
+                'message': f'The analysis queue is full, please retry shortly ({str(e)})'
+            }, 503
+        except Exception as e:
+            return {
+                'success': False,
+                'error': 'Server error',
+                'message': f'An error occurred while queueing the file: {str(e)}'
+            }, 500
+    
+    @app.route('/analyze-resume/jobs/<job_id>', methods=['GET'])
+    def get_analysis_job(job_id):
+        """
+        API endpoint to poll an analysis job.
+        
+        Returns:
+            JSON response with the job status, stage progress and, once the
+            job has finished, the analysis result or error message
+        """
+        job = jobs.get(job_id)
+        if job is None:
+            return {
+                'success': False,
+                'error': 'Job not found',
+                'message': f'No job with id {job_id}, it may have expired'
+            }, 404
+        
+        return {
+            'success': True,
+            'data': job
+        }, 200
 
 
 def get_sample_resume_data() -> Dict[str, Any]:
@@ -350,6 +944,10 @@ def get_sample_resume_data() -> Dict[str, Any]:
             "Python", "JavaScript", "React", "Node.js", "AWS", "Docker", 
             "Communication", "Teamwork", "Problem Solving"
         ],
+        "skill_levels": {
+            "expert": ["Python"],
+            "intermediate": ["React", "Node.js"]
+        },
         "experience": [
             {
                 "company": "Tech Corp",
@@ -384,4 +982,12 @@ def get_sample_resume_data() -> Dict[str, Any]:
             "skill_categories": ["programming_languages", "web_technologies", "cloud_devops"],
             "sections_found": ["contact", "summary", "experience", "education", "skills"]
         }
-    }
\ No newline at end of file
+    }
+
+
+if __name__ == '__main__':
+    # Run as `python -m resume_analyzer`: register this module under its own
+    # name first, so bulk_analyzer's import reuses it instead of loading a copy
+    sys.modules.setdefault('resume_analyzer', sys.modules[__name__])
+    from bulk_analyzer import main
+    main()
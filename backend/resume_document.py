@@ -0,0 +1,161 @@
+"""
+Resume Document Representation
+
+This module provides the immutable document object shared by all pipeline
+stages. A resume is normalised once; the lowercased text, line and sentence
+offsets and section spans are computed lazily on first access and cached.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from text_preprocessing import clean_text, extract_contact_info, extract_sections, find_section_spans, lower_aligned
+
+
+_SENTENCE_PATTERN = re.compile(r'[^.!?]+')
+
+
+@dataclass(frozen=True)
+class ResumeDocument:
+    """Normalised resume text with cached derived views."""
+    text: str
+
+    @classmethod
+    def from_text(cls, raw_text: str) -> 'ResumeDocument':
+        """
+        Normalise raw extracted text into a document, keeping line structure.
+
+        Args:
+            raw_text (str): Raw text extracted from the resume file
+
+        Returns:
+            ResumeDocument: Normalised document
+        """
+        return cls(clean_text(raw_text or '', preserve_lines=True))
+
+    @classmethod
+    def from_chunks(cls, raw_chunks: Iterable[str]) -> 'ResumeDocument':
+        """
+        Normalise raw text arriving in chunks, such as PDF pages, into a document.
+
+        Each chunk is cleaned as soon as it is consumed, so the raw text is
+        never held in full. Chunks are treated as separate lines, and the
+        result is the same as from_text on the chunks joined by newlines.
+
+        Args:
+            raw_chunks (Iterable[str]): Raw text chunks in document order
+
+        Returns:
+            ResumeDocument: Normalised document
+        """
+        cleaned_chunks = (clean_text(chunk, preserve_lines=True) for chunk in raw_chunks if chunk)
+        return cls('\n'.join(chunk for chunk in cleaned_chunks if chunk))
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased text, always offset-aligned with `text`."""
+        return lower_aligned(self.text)
+
+    @cached_property
+    def lines(self) -> Tuple[str, ...]:
+        """Lines of the text."""
+        return tuple(self.text.split('\n'))
+
+    @cached_property
+    def lines_lower(self) -> Tuple[str, ...]:
+        """Lowercased lines of the text."""
+        return tuple(self.lower.split('\n'))
+
+    @cached_property
+    def line_starts(self) -> Tuple[int, ...]:
+        """Start offset of every line."""
+        starts = [0]
+        for line in self.lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        return tuple(starts)
+
+    @cached_property
+    def sentence_spans(self) -> Tuple[Tuple[int, int], ...]:
+        """(start, end) offsets of non-empty sentences, split on '.', '!' and '?'."""
+        spans = []
+        for match in _SENTENCE_PATTERN.finditer(self.text):
+            sentence = match.group()
+            stripped = sentence.strip()
+            if stripped:
+                start = match.start() + (len(sentence) - len(sentence.lstrip()))
+                spans.append((start, start + len(stripped)))
+        return tuple(spans)
+
+    @cached_property
+    def sentences(self) -> Tuple[str, ...]:
+        """Non-empty sentences of the text, stripped."""
+        return tuple(self.text[start:end] for start, end in self.sentence_spans)
+
+    @cached_property
+    def section_spans(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Ordered (section, start, end) spans from the section header scan."""
+        return tuple(find_section_spans(self.text, self.lower))
+
+    @cached_property
+    def sections(self) -> Dict[str, str]:
+        """Section name to section content."""
+        return extract_sections(self.text, list(self.section_spans))
+
+    def line_number(self, offset: int) -> int:
+        """
+        Get the index of the line containing a character offset.
+
+        Args:
+            offset (int): Character offset into the text
+
+        Returns:
+            int: Zero-based line index
+        """
+        return bisect_right(self.line_starts, offset) - 1
+
+
+def as_document(text: Union[str, ResumeDocument]) -> ResumeDocument:
+    """
+    Wrap already-cleaned text in a document, passing documents through.
+
+    Args:
+        text (Union[str, ResumeDocument]): Cleaned text or an existing document
+
+    Returns:
+        ResumeDocument: Document for the text
+    """
+    if isinstance(text, ResumeDocument):
+        return text
+    return ResumeDocument(text or '')
+
+
+def preprocess_resume(text: Union[str, Iterable[str]]) -> Dict[str, Any]:
+    """
+    Build the document for raw resume text and run the preprocessing steps on it.
+
+    Returns the same fields as text_preprocessing.preprocess_resume_text, plus
+    the document every later pipeline stage shares.
+
+    Args:
+        text (Union[str, Iterable[str]]): Raw resume text, or chunks of it
+            (e.g. a page generator) that are cleaned as they are consumed
+
+    Returns:
+        Dict[str, Any]: Preprocessed data including the document, cleaned text,
+            sections, and extracted info
+    """
+    if text is None or isinstance(text, str):
+        document = ResumeDocument.from_text(text)
+    else:
+        document = ResumeDocument.from_chunks(text)
+
+    return {
+        'cleaned_text': document.text,
+        'document': document,
+        'sections': document.sections,
+        'section_spans': list(document.section_spans),
+        **extract_contact_info(document.text)
+    }
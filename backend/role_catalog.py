@@ -0,0 +1,375 @@
+"""
+Role Requirement Catalog
+
+This module compiles the role requirements in data/role_requirements.json
+into a binary artifact that analyzer processes memory-map at startup instead
+of parsing JSON. The artifact holds a string table (role names, skill labels
+and normalized skill keys, NUL-separated so it decodes in one call) and flat
+arrays of string ids, skill ids and weights per role.
+
+Each role lists its skills in tiers (core, important, nice_to_have) whose
+weights are set by the file's tier_weights; a role may also be a plain list
+of skills, all weighted 1.0. The artifact is written to a temporary file and
+swapped in with os.replace, so a reader never maps a half-written catalog.
+Processes that already mapped the previous artifact keep their copy until
+they restart.
+
+Build the artifact with:
+    python role_catalog.py [--source data/role_requirements.json] [--output data/role_requirements.bin]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from skill_normalization import get_normalization_fingerprint, normalize_skill
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+ROLE_REQUIREMENTS_SOURCE = os.path.join(DATA_DIR, 'role_requirements.json')
+ROLE_CATALOG_PATH = os.getenv('ROLE_CATALOG_PATH', os.path.join(DATA_DIR, 'role_requirements.bin'))
+
+TIERS = ('core', 'important', 'nice_to_have')
+
+CATALOG_MAGIC = b'SVRC'
+CATALOG_FORMAT_VERSION = 1
+
+# magic, format version, string count, string table bytes, skill count,
+# role count, entry count, fingerprint of the skill normalization rules
+_HEADER = struct.Struct('<4sIIIIII32s')
+
+
+class RoleCatalogError(ValueError):
+    """Raised when a role requirements file or compiled catalog is invalid."""
+
+
+@dataclass(frozen=True)
+class RoleRequirements:
+    """Required skills of one role as stored in the catalog."""
+    name: str
+    skills: Tuple[str, ...]
+    skill_ids: Tuple[int, ...]
+    weights: Tuple[float, ...]
+
+
+def load_role_requirements(source_path: str = ROLE_REQUIREMENTS_SOURCE) -> List[Tuple[str, List[Tuple[str, float]]]]:
+    """
+    Read and validate a role requirements file.
+
+    Args:
+        source_path (str): JSON file with tier_weights and roles
+
+    Returns:
+        List[Tuple[str, List[Tuple[str, float]]]]: Each role with its (skill, weight)
+            pairs, core skills first
+
+    Raises:
+        RoleCatalogError: If a role is empty, names an unknown tier, or repeats a skill
+    """
+    with open(source_path, 'r', encoding='utf-8') as source_file:
+        data = json.load(source_file)
+
+    tier_weights = {tier: float(weight) for tier, weight in data.get('tier_weights', {}).items()}
+    roles = []
+
+    for role, requirements in data.get('roles', {}).items():
+        if isinstance(requirements, list):
+            requirements = {None: requirements}
+        elif not isinstance(requirements, dict):
+            raise RoleCatalogError(f"Role '{role}' must be a list of skills or an object of tiers")
+
+        unknown = [tier for tier in requirements if tier is not None and tier not in tier_weights]
+        if unknown:
+            raise RoleCatalogError(f"Role '{role}' uses tiers without a weight: {', '.join(unknown)}")
+
+        ordered_tiers = sorted(requirements, key=lambda tier: TIERS.index(tier) if tier in TIERS else len(TIERS))
+        skills = []
+        seen = set()
+        for tier in ordered_tiers:
+            weight = tier_weights[tier] if tier is not None else 1.0
+            for skill in requirements[tier]:
+                key = normalize_skill(skill)
+                if not key or '\0' in skill:
+                    raise RoleCatalogError(f"Role '{role}' has an empty or invalid skill")
+                if key in seen:
+                    raise RoleCatalogError(f"Role '{role}' lists '{skill}' more than once")
+                seen.add(key)
+                skills.append((skill, weight))
+
+        if not skills:
+            raise RoleCatalogError(f"Role '{role}' has no skills")
+        if '\0' in role:
+            raise RoleCatalogError(f"Role name {role!r} is invalid")
+        roles.append((role, skills))
+
+    return roles
+
+
+def build_role_catalog(roles: List[Tuple[str, List[Tuple[str, float]]]]) -> bytes:
+    """
+    Encode role requirements as a catalog artifact.
+
+    Args:
+        roles (List[Tuple[str, List[Tuple[str, float]]]]): Output of load_role_requirements
+
+    Returns:
+        bytes: Header, string table and little-endian id and weight arrays
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+    skill_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    skill_key_ids = array('I')
+    role_name_ids = array('I')
+    role_starts = array('I', [0])
+    entry_label_ids = array('I')
+    entry_skill_ids = array('I')
+    entry_weights = array('f')
+
+    for role, skills in roles:
+        role_name_ids.append(intern(role))
+        for skill, weight in skills:
+            key = normalize_skill(skill)
+            if key not in skill_ids:
+                skill_ids[key] = len(skill_ids)
+                skill_key_ids.append(intern(key))
+            entry_label_ids.append(intern(skill))
+            entry_skill_ids.append(skill_ids[key])
+            entry_weights.append(weight)
+        role_starts.append(len(entry_label_ids))
+
+    blob = '\0'.join(strings).encode('utf-8')
+    string_bytes = len(blob)
+    blob += b'\0' * (-string_bytes % 4)
+
+    arrays = [skill_key_ids, role_name_ids, role_starts, entry_label_ids, entry_skill_ids, entry_weights]
+    if sys.byteorder == 'big':
+        for values in arrays:
+            values.byteswap()
+
+    header = _HEADER.pack(
+        CATALOG_MAGIC, CATALOG_FORMAT_VERSION, len(strings), string_bytes,
+        len(skill_ids), len(roles), len(entry_label_ids), get_normalization_fingerprint()
+    )
+    return b''.join([header, blob] + [values.tobytes() for values in arrays])
+
+
+def compile_role_catalog(source_path: str = ROLE_REQUIREMENTS_SOURCE, output_path: str = ROLE_CATALOG_PATH) -> int:
+    """
+    Compile a role requirements file and atomically replace the catalog artifact.
+
+    Args:
+        source_path (str): JSON role requirements
+        output_path (str): Catalog artifact to write
+
+    Returns:
+        int: Number of roles compiled
+    """
+    roles = load_role_requirements(source_path)
+    content = build_role_catalog(roles)
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=output_dir, prefix='.role_catalog-', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        # mkstemp creates the file private to its owner; workers may run as another user
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return len(roles)
+
+
+def _view(buffer: memoryview, typecode: str, count: int) -> Union[memoryview, array]:
+    """View little-endian 4-byte values in place, copying only on big-endian hosts."""
+    if sys.byteorder == 'little':
+        return buffer[:count * 4].cast(typecode)
+    values = array(typecode)
+    values.frombytes(buffer[:count * 4])
+    values.byteswap()
+    return values
+
+
+class RoleCatalog:
+    """Read-only view of a compiled role catalog."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        """
+        Parse the header and locate the sections of a catalog.
+
+        Args:
+            buffer (Union[bytes, mmap.mmap]): Catalog content, usually a read-only mapping
+
+        Raises:
+            RoleCatalogError: If the buffer is not a catalog of this format and normalization rules
+        """
+        self._buffer = buffer
+
+        if len(buffer) < _HEADER.size:
+            raise RoleCatalogError('Role catalog is truncated')
+        (magic, version, string_count, string_bytes, skill_count,
+         role_count, entry_count, fingerprint) = _HEADER.unpack_from(buffer)
+        if magic != CATALOG_MAGIC or version != CATALOG_FORMAT_VERSION:
+            raise RoleCatalogError('Not a role catalog of a supported version')
+        if fingerprint != get_normalization_fingerprint():
+            raise RoleCatalogError('Role catalog was compiled with other skill normalization rules')
+
+        expected = (_HEADER.size + string_bytes + (-string_bytes % 4)
+                    + 4 * (skill_count + role_count + role_count + 1 + 3 * entry_count))
+        if len(buffer) != expected:
+            raise RoleCatalogError('Role catalog is truncated')
+
+        self._memory = memoryview(buffer)
+        sections = []
+        try:
+            offset = _HEADER.size
+            with self._memory[offset:offset + string_bytes] as strings:
+                try:
+                    self.strings = str(strings, 'utf-8').split('\0') if string_count else []
+                except UnicodeDecodeError:
+                    self.strings = None
+            if self.strings is None or len(self.strings) != string_count:
+                raise RoleCatalogError('Role catalog string table is corrupt')
+            offset += string_bytes + (-string_bytes % 4)
+
+            for typecode, count in (('I', skill_count), ('I', role_count), ('I', role_count + 1),
+                                    ('I', entry_count), ('I', entry_count), ('f', entry_count)):
+                sections.append(_view(self._memory[offset:], typecode, count))
+                offset += 4 * count
+        except BaseException:
+            for values in sections:
+                if isinstance(values, memoryview):
+                    values.release()
+            self.close()
+            raise
+
+        (self._skill_key_ids, self._role_name_ids, self._role_starts,
+         self._entry_label_ids, self._entry_skill_ids, self._entry_weights) = sections
+        self.role_count = role_count
+
+    @classmethod
+    def open(cls, path: str) -> 'RoleCatalog':
+        """
+        Memory-map a catalog artifact.
+
+        Args:
+            path (str): Catalog artifact
+
+        Returns:
+            RoleCatalog: Catalog backed by a read-only mapping of the file
+        """
+        with open(path, 'rb') as catalog_file:
+            mapping = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapping)
+        except BaseException:
+            mapping.close()
+            raise
+
+    @property
+    def skill_keys(self) -> List[str]:
+        """Normalized skill keys, indexed by skill id."""
+        return [self.strings[string_id] for string_id in self._skill_key_ids]
+
+    def __len__(self) -> int:
+        return self.role_count
+
+    def __iter__(self) -> Iterator[RoleRequirements]:
+        """Iterate over the roles in catalog order."""
+        strings = self.strings
+        for role_index in range(self.role_count):
+            start, end = self._role_starts[role_index], self._role_starts[role_index + 1]
+            yield RoleRequirements(
+                name=strings[self._role_name_ids[role_index]],
+                skills=tuple([strings[string_id] for string_id in self._entry_label_ids[start:end]]),
+                skill_ids=tuple(self._entry_skill_ids[start:end]),
+                weights=tuple(self._entry_weights[start:end])
+            )
+
+    def close(self) -> None:
+        """Release the views and the mapping."""
+        for name in ('_skill_key_ids', '_role_name_ids', '_role_starts',
+                     '_entry_label_ids', '_entry_skill_ids', '_entry_weights'):
+            values = getattr(self, name, None)
+            if isinstance(values, memoryview):
+                values.release()
+        self._memory.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> 'RoleCatalog':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_role_catalog(path: Optional[str] = None, source_path: str = ROLE_REQUIREMENTS_SOURCE) -> RoleCatalog:
+    """
+    Open the compiled role catalog, compiling it first if it is missing or stale.
+
+    The artifact is stale when the requirements file is newer or it was built
+    with other normalization rules. If it cannot be written, e.g. on a
+    read-only file system, the catalog is compiled in memory instead.
+
+    Args:
+        path (str, optional): Catalog artifact, ROLE_CATALOG_PATH if None
+        source_path (str): JSON role requirements used to (re)compile it
+
+    Returns:
+        RoleCatalog: Open catalog; close it when done
+    """
+    path = path or ROLE_CATALOG_PATH
+    source_newer = (os.path.exists(source_path) and
+                    (not os.path.exists(path) or os.path.getmtime(source_path) > os.path.getmtime(path)))
+
+    if not source_newer:
+        try:
+            return RoleCatalog.open(path)
+        except (OSError, RoleCatalogError):
+            if not os.path.exists(source_path):
+                raise
+
+    try:
+        compile_role_catalog(source_path, path)
+        return RoleCatalog.open(path)
+    except OSError:
+        return RoleCatalog(build_role_catalog(load_role_requirements(source_path)))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Compile role requirements into a memory-mappable catalog.')
+    parser.add_argument('--source', default=ROLE_REQUIREMENTS_SOURCE, help='role requirements JSON file')
+    parser.add_argument('--output', default=ROLE_CATALOG_PATH, help='catalog artifact to replace')
+    args = parser.parse_args(argv)
+
+    try:
+        role_count = compile_role_catalog(args.source, args.output)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f'{parser.prog}: error: {e}\n')
+    print(f'Compiled {role_count} roles into {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,96 +6,252 @@ using predefined keyword lists and pattern matching.
 """
 
 import re
-from typing import List, Set, Dict, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Set, Dict, Tuple, Optional, Union
 from collections import defaultdict
 
 from skill_keywords import (
     TECHNICAL_SKILLS, SOFT_SKILLS, EDUCATION_KEYWORDS,
     EXPERIENCE_KEYWORDS, PROJECT_KEYWORDS, CERTIFICATION_KEYWORDS
 )
+from skill_matcher import SkillMatch, count_matches, get_default_matcher, get_matcher
+from resume_document import ResumeDocument, as_document
+from time_budget import TimeBudget, allows
 
 
-def extract_skills_from_text(text: str, skill_keywords: Set[str]) -> List[str]:
+# Skill categories used for distribution analysis
+SKILL_CATEGORIES = {
+    'programming_languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'ruby', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'lua', 'dart'],
+    'web_technologies': ['html', 'css', 'sass', 'less', 'react', 'angular', 'vue', 'jquery', 'bootstrap', 'tailwind', 'webpack', 'vite', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel', 'ruby on rails', 'asp.net'],
+    'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server', 'cassandra', 'elasticsearch', 'dynamodb', 'firebase', 'neo4j'],
+    'cloud_devops': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'bitbucket', 'terraform', 'ansible', 'puppet', 'chef', 'ci/cd', 'devops', 'linux', 'ubuntu', 'centos', 'redhat', 'nginx', 'apache', 'load balancing'],
+    'data_science': ['machine learning', 'deep learning', 'artificial intelligence', 'ai', 'ml', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter', 'data analysis', 'data visualization', 'statistics', 'big data', 'hadoop', 'spark', 'hive', 'kafka', 'tableau', 'power bi'],
+    'mobile': ['android', 'ios', 'flutter', 'react native', 'swift', 'kotlin', 'xamarin', 'ionic', 'cordova', 'mobile development', 'mobile app'],
+    'soft_skills': sorted(SOFT_SKILLS)
+}
+
+
+# Sections whose skills are reported separately
+SKILL_SECTIONS = ['skills', 'experience', 'projects']
+
+# Skill level indicators
+SKILL_LEVEL_INDICATORS = {
+    'expert': [
+        'expert', 'expertise', 'master', 'advanced', 'proficient',
+        'highly skilled', 'specialist', 'seasoned', 'veteran'
+    ],
+    'intermediate': [
+        'intermediate', 'moderate', 'working knowledge', 'familiar',
+        'knowledgeable', 'competent', 'capable', 'adequate'
+    ],
+    'beginner': [
+        'beginner', 'basic', 'fundamental', 'introductory', 'elementary',
+        'entry level', 'newbie', 'novice', 'trainee'
+    ]
+}
+
+# Maximum number of characters between a skill and a level indicator
+LEVEL_WINDOW_CHARS = 50
+
+_LEVEL_BY_INDICATOR = {
+    indicator: level
+    for level, indicators in SKILL_LEVEL_INDICATORS.items()
+    for indicator in indicators
+}
+
+_LEVEL_INDICATOR_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(indicator) for indicator in sorted(_LEVEL_BY_INDICATOR, key=len, reverse=True)) + r')\b'
+)
+
+
+@dataclass(frozen=True)
+class SkillScan:
+    """Result of a single matcher pass over a resume text."""
+    matches: Tuple[SkillMatch, ...]
+    counts: Dict[str, int]
+    # Inverted index: skill -> ids of the document sentences it occurs in
+    sentence_ids: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+
+    def skills_in(self, vocabulary: Set[str]) -> List[str]:
+        """
+        Get the skills found that belong to a vocabulary.
+
+        Args:
+            vocabulary (Set[str]): Skill keywords to keep
+
+        Returns:
+            List[str]: Sorted list of skills found
+        """
+        return sorted(skill for skill in self.counts if skill in vocabulary)
+
+
+def scan_skills(text: Union[str, ResumeDocument]) -> SkillScan:
+    """
+    Scan text once for every technical and soft skill.
+
+    Args:
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+
+    Returns:
+        SkillScan: Match spans (offsets into the lowercased text) and counts
+    """
+    document = as_document(text)
+    if not document.text:
+        return SkillScan(matches=(), counts={})
+
+    return _build_scan(document, get_default_matcher().find_all(document.lower))
+
+
+def _build_scan(document: ResumeDocument, matches: List[SkillMatch]) -> SkillScan:
+    """
+    Build a scan from sorted matches, indexing the sentence of every match.
+
+    Matches and sentences are both ordered by offset, so each match is
+    assigned the sentence containing its start in one forward merge.
+
+    Args:
+        document (ResumeDocument): Scanned document
+        matches (List[SkillMatch]): Matches sorted by start offset
+
+    Returns:
+        SkillScan: Matches, counts and sentence index
+    """
+    sentence_spans = document.sentence_spans
+    sentence_ids = defaultdict(list)
+    sentence_id = 0
+
+    for match in matches:
+        while sentence_id < len(sentence_spans) and sentence_spans[sentence_id][1] <= match.start:
+            sentence_id += 1
+        if sentence_id == len(sentence_spans):
+            break
+        if sentence_spans[sentence_id][0] <= match.start:
+            ids = sentence_ids[match.skill]
+            if not ids or ids[-1] != sentence_id:
+                ids.append(sentence_id)
+
+    return SkillScan(
+        matches=tuple(matches),
+        counts=count_matches(matches),
+        sentence_ids={skill: tuple(ids) for skill, ids in sentence_ids.items()}
+    )
+
+
+def extract_skills_from_text(text: Union[str, ResumeDocument], skill_keywords: Set[str], scan: Optional[SkillScan] = None) -> List[str]:
     """
     Extract skills from text using keyword matching.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
         skill_keywords (Set[str]): Set of skill keywords to search for
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         List[str]: List of skills found in the text
     """
-    if not text or not skill_keywords:
+    document = as_document(text)
+    if not document.text or not skill_keywords:
         return []
     
-    text_lower = text.lower()
-    found_skills = set()
+    keywords = frozenset(skill.lower() for skill in skill_keywords)
     
-    # Sort keywords by length (longer keywords first) to match multi-word skills first
-    sorted_keywords = sorted(skill_keywords, key=len, reverse=True)
+    # Keywords from the default vocabulary are served from the shared scan
+    if keywords <= get_default_matcher().keywords:
+        if scan is None:
+            scan = scan_skills(document)
+        return scan.skills_in(keywords)
     
-    for skill in sorted_keywords:
-        skill_lower = skill.lower()
-        
-        # Use word boundaries to avoid partial matches
-        # For multi-word skills, we need more flexible matching
-        if len(skill_lower.split()) > 1:
-            # For multi-word skills, check if the phrase exists
-            if skill_lower in text_lower:
-                found_skills.add(skill)
-        else:
-            # For single-word skills, use word boundaries
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
-    
-    return sorted(list(found_skills))
-
-
-def extract_technical_skills(text: str) -> List[str]:
+    matches = get_matcher(keywords).iter_matches(document.lower)
+    return sorted({match.skill for match in matches})
+
+
+def extract_technical_skills(text: Union[str, ResumeDocument], scan: Optional[SkillScan] = None) -> List[str]:
     """
     Extract technical skills from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         List[str]: List of technical skills found
     """
-    return extract_skills_from_text(text, TECHNICAL_SKILLS)
+    return extract_skills_from_text(text, TECHNICAL_SKILLS, scan)
 
 
-def extract_soft_skills(text: str) -> List[str]:
+def extract_soft_skills(text: Union[str, ResumeDocument], scan: Optional[SkillScan] = None) -> List[str]:
     """
     Extract soft skills from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         List[str]: List of soft skills found
     """
-    return extract_skills_from_text(text, SOFT_SKILLS)
+    return extract_skills_from_text(text, SOFT_SKILLS, scan)
 
 
-def extract_skills_by_section(text: str, sections: Dict[str, str]) -> Dict[str, List[str]]:
+def extract_skills_by_section(
+    text: Union[str, ResumeDocument],
+    sections: Dict[str, str],
+    scan: Optional[SkillScan] = None
+) -> Dict[str, List[str]]:
     """
     Extract skills from different sections of the resume.
     
+    Skills found in the full-text scan are attributed to a section by binary
+    search of their offset over the document's section spans, so sections
+    taken from the document are not scanned again. Sections that do not come
+    from the document are scanned on their own.
+    
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
         sections (Dict[str, str]): Dictionary of resume sections
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         Dict[str, List[str]]: Skills extracted from each section
     """
+    document = as_document(text)
+    
+    # First span of every section, the one extract_sections returns as content
+    section_bounds = {}
+    for section_name, start_pos, end_pos in document.section_spans:
+        section_bounds.setdefault(section_name, (start_pos, end_pos))
+    
+    attributed = sorted(
+        (section_bounds[section_name][0], section_bounds[section_name][1], section_name)
+        for section_name, section_content in sections.items()
+        if section_content and section_name in SKILL_SECTIONS
+        and section_name in section_bounds
+        and document.sections.get(section_name) == section_content
+    )
+    
+    section_skills = {section_name: set() for _, _, section_name in attributed}
+    if attributed:
+        if scan is None:
+            scan = scan_skills(document)
+        section_starts = [start_pos for start_pos, _, _ in attributed]
+        for match in scan.matches:
+            index = bisect_right(section_starts, match.start) - 1
+            if index >= 0 and match.end <= attributed[index][1]:
+                section_skills[attributed[index][2]].add(match.skill)
+    
     skills_by_section = {}
     
     for section_name, section_content in sections.items():
-        if section_content and section_name in ['skills', 'experience', 'projects']:
-            technical_skills = extract_technical_skills(section_content)
-            soft_skills = extract_soft_skills(section_content)
+        if section_content and section_name in SKILL_SECTIONS:
+            if section_name in section_skills:
+                found = section_skills[section_name]
+                technical_skills = sorted(found & TECHNICAL_SKILLS)
+                soft_skills = sorted(found & SOFT_SKILLS)
+            else:
+                section_scan = scan_skills(section_content)
+                technical_skills = extract_technical_skills(section_content, section_scan)
+                soft_skills = extract_soft_skills(section_content, section_scan)
             
             skills_by_section[section_name] = {
                 'technical': technical_skills,
@@ -105,20 +261,25 @@ def extract_skills_by_section(text: str, sections: Dict[str, str]) -> Dict[str,
     return skills_by_section
 
 
-def extract_all_skills(text: str, sections: Dict[str, str] = None) -> Dict[str, List[str]]:
+def extract_all_skills(text: Union[str, ResumeDocument], sections: Dict[str, str] = None, scan: Optional[SkillScan] = None) -> Dict[str, List[str]]:
     """
     Extract all skills from resume text.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
         sections (Dict[str, str], optional): Dictionary of resume sections
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         Dict[str, List[str]]: All skills categorized by type
     """
+    document = as_document(text)
+    if scan is None:
+        scan = scan_skills(document)
+    
     # Extract skills from the entire text
-    technical_skills = extract_technical_skills(text)
-    soft_skills = extract_soft_skills(text)
+    technical_skills = extract_technical_skills(document, scan)
+    soft_skills = extract_soft_skills(document, scan)
     
     result = {
         'technical': technical_skills,
@@ -128,171 +289,276 @@ def extract_all_skills(text: str, sections: Dict[str, str] = None) -> Dict[str,
     
     # If sections are provided, extract skills by section
     if sections:
-        skills_by_section = extract_skills_by_section(text, sections)
+        skills_by_section = extract_skills_by_section(document, sections, scan)
         result['by_section'] = skills_by_section
     
     return result
 
 
-def extract_skill_level_indicators(text: str) -> Dict[str, List[str]]:
+def _find_level_indicators(text_lower: str) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Find every proficiency indicator in the text with one regex pass.
+    
+    Args:
+        text_lower (str): Lowercased resume text
+        
+    Returns:
+        Dict[str, List[Tuple[int, int]]]: Sorted (start, end) spans per level
+    """
+    positions = {level: [] for level in SKILL_LEVEL_INDICATORS}
+    for match in _LEVEL_INDICATOR_PATTERN.finditer(text_lower):
+        positions[_LEVEL_BY_INDICATOR[match.group()]].append(match.span())
+    return positions
+
+
+def _near_indicator(text_lower: str, skill_spans: List[Tuple[int, int]], indicator_spans: List[Tuple[int, int]]) -> bool:
+    """
+    Check whether any skill occurrence is within the level window of an indicator.
+    
+    Both span lists are sorted by start offset and indicator spans never
+    overlap, so a single forward merge visits every occurrence once. The skill
+    and indicator must be on the same line, at most LEVEL_WINDOW_CHARS apart.
+    
+    Args:
+        text_lower (str): Lowercased resume text
+        skill_spans (List[Tuple[int, int]]): Sorted occurrences of one skill
+        indicator_spans (List[Tuple[int, int]]): Sorted occurrences of one level's indicators
+        
+    Returns:
+        bool: True if the skill appears near an indicator
+    """
+    preceding = -1  # last indicator ending at or before the skill start
+    following = 0   # first indicator starting at or after the skill start
+    indicator_count = len(indicator_spans)
+    
+    for skill_start, skill_end in skill_spans:
+        while preceding + 1 < indicator_count and indicator_spans[preceding + 1][1] <= skill_start:
+            preceding += 1
+        if preceding >= 0:
+            gap_start = indicator_spans[preceding][1]
+            if skill_start - gap_start <= LEVEL_WINDOW_CHARS and '\n' not in text_lower[gap_start:skill_start]:
+                return True
+        
+        while following < indicator_count and indicator_spans[following][0] < skill_start:
+            following += 1
+        candidate = following
+        while candidate < indicator_count and indicator_spans[candidate][0] < skill_end:
+            candidate += 1
+        if candidate < indicator_count:
+            gap_end = indicator_spans[candidate][0]
+            if gap_end - skill_end <= LEVEL_WINDOW_CHARS and '\n' not in text_lower[skill_end:gap_end]:
+                return True
+    
+    return False
+
+
+def extract_skill_level_indicators(text: Union[str, ResumeDocument], scan: Optional[SkillScan] = None) -> Dict[str, List[str]]:
     """
     Extract skill level indicators from resume text.
     
+    A skill is assigned a level when one of the level's indicator words
+    appears within LEVEL_WINDOW_CHARS characters before or after it on the
+    same line. Skill and indicator positions are each found in one pass and
+    merged per skill, instead of searching the text once per skill and indicator.
+    
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         Dict[str, List[str]]: Skills categorized by proficiency level
     """
-    if not text:
+    document = as_document(text)
+    if not document.text:
         return {}
     
-    text_lower = text.lower()
-    
-    # Skill level indicators
-    level_patterns = {
-        'expert': [
-            r'\bexpert\b', r'\bexpertise\b', r'\bmaster\b', r'\badvanced\b', r'\bproficient\b',
-            r'\bhighly skilled\b', r'\bspecialist\b', r'\bseasoned\b', r'\bveteran\b'
-        ],
-        'intermediate': [
-            r'\bintermediate\b', r'\bmoderate\b', r'\bworking knowledge\b', r'\bfamiliar\b',
-            r'\bknowledgeable\b', r'\bcompetent\b', r'\bcapable\b', r'\badequate\b'
-        ],
-        'beginner': [
-            r'\bbeginner\b', r'\bbasic\b', r'\bfundamental\b', r'\bintroductory\b', r'\belementary\b',
-            r'\bentry level\b', r'\bnewbie\b', r'\bnovice\b', r'\btrainee\b'
-        ]
-    }
+    if scan is None:
+        scan = scan_skills(document)
     
-    skills_by_level = {level: [] for level in level_patterns.keys()}
+    text_lower = document.lower
+    skills_by_level = {level: [] for level in SKILL_LEVEL_INDICATORS}
     
-    # Extract technical skills and check their context for level indicators
-    technical_skills = extract_technical_skills(text)
+    # Position index: indicator spans per level and occurrence spans per skill
+    indicator_positions = _find_level_indicators(text_lower)
+    skill_positions = defaultdict(list)
+    for match in scan.matches:
+        if match.skill in TECHNICAL_SKILLS:
+            skill_positions[match.skill].append((match.start, match.end))
     
-    for skill in technical_skills:
-        skill_lower = skill.lower()
-        
-        # Look for the skill in context with level indicators
-        for level, patterns in level_patterns.items():
-            for pattern in patterns:
-                # Look for skill near level indicator (within 5 words)
-                combined_pattern = r'(?:' + re.escape(skill_lower) + r'.{0,50}' + pattern + r'|' + pattern + r'.{0,50}' + re.escape(skill_lower) + r')'
-                if re.search(combined_pattern, text_lower, re.IGNORECASE):
-                    if skill not in skills_by_level[level]:
-                        skills_by_level[level].append(skill)
-                    break
+    for skill in sorted(skill_positions):
+        for level, indicator_spans in indicator_positions.items():
+            if indicator_spans and _near_indicator(text_lower, skill_positions[skill], indicator_spans):
+                skills_by_level[level].append(skill)
     
     return skills_by_level
 
 
-def extract_skill_context(text: str, skills: List[str]) -> Dict[str, str]:
+def get_skill_sentence_spans(text: Union[str, ResumeDocument], skills: List[str], scan: Optional[SkillScan] = None) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Get the offsets of the sentences each skill occurs in.
+    
+    Args:
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        skills (List[str]): List of skills to look up
+        scan (SkillScan, optional): Precomputed scan of the text
+        
+    Returns:
+        Dict[str, List[Tuple[int, int]]]: (start, end) offsets into the document
+            text of every sentence mentioning the skill
+    """
+    document = as_document(text)
+    if not document.text or not skills:
+        return {}
+    
+    sentence_ids = _get_sentence_ids(document, skills, scan)
+    sentence_spans = document.sentence_spans
+    
+    return {
+        skill: [sentence_spans[sentence_id] for sentence_id in sentence_ids[skill.lower()]]
+        for skill in skills
+        if skill.lower() in sentence_ids
+    }
+
+
+def _get_sentence_ids(document: ResumeDocument, skills: List[str], scan: Optional[SkillScan]) -> Dict[str, Tuple[int, ...]]:
+    """Get the sentence index for the skills, scanning only for skills outside the default vocabulary."""
+    if scan is None:
+        scan = scan_skills(document)
+    
+    extra_skills = frozenset(skill.lower() for skill in skills) - get_default_matcher().keywords
+    if not extra_skills:
+        return scan.sentence_ids
+    
+    extra_scan = _build_scan(document, get_matcher(extra_skills).find_all(document.lower))
+    return {**scan.sentence_ids, **extra_scan.sentence_ids}
+
+
+def extract_skill_context(
+    text: Union[str, ResumeDocument],
+    skills: List[str],
+    scan: Optional[SkillScan] = None,
+    budget: Optional[TimeBudget] = None
+) -> Dict[str, str]:
     """
     Extract context around skills in the resume text.
     
+    Sentences are looked up through the scan's sentence index rather than
+    searching every sentence for every skill.
+    
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
         skills (List[str]): List of skills to find context for
+        scan (SkillScan, optional): Precomputed scan of the text
+        budget (TimeBudget, optional): Stop with the skills done so far once it is spent
         
     Returns:
         Dict[str, str]: Context snippets for each skill
     """
-    if not text or not skills:
+    document = as_document(text)
+    if not document.text or not skills:
         return {}
     
     context_dict = {}
-    text_lower = text.lower()
-    
-    # Split text into sentences for context extraction
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentence_ids = _get_sentence_ids(document, skills, scan)
+    sentences = document.sentences
     
     for skill in skills:
-        skill_lower = skill.lower()
+        if budget is not None and budget.expired():
+            budget.truncated('skill_context')
+            break
+        
         context_snippets = []
         
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            if skill_lower in sentence_lower:
-                # Clean up the sentence
-                cleaned_sentence = re.sub(r'\s+', ' ', sentence.strip())
-                if cleaned_sentence and len(cleaned_sentence) > 10:  # Skip very short sentences
-                    context_snippets.append(cleaned_sentence)
+        for sentence_id in sentence_ids.get(skill.lower(), ()):
+            # Clean up the sentence
+            cleaned_sentence = re.sub(r'\s+', ' ', sentences[sentence_id])
+            if len(cleaned_sentence) > 10:  # Skip very short sentences
+                context_snippets.append(cleaned_sentence)
+                if len(context_snippets) == 3:
+                    break
         
         if context_snippets:
             # Take the first few relevant sentences as context
-            context_dict[skill] = ' '.join(context_snippets[:3])
+            context_dict[skill] = ' '.join(context_snippets)
     
     return context_dict
 
 
-def analyze_skill_distribution(text: str) -> Dict[str, int]:
+def analyze_skill_distribution(text: Union[str, ResumeDocument], scan: Optional[SkillScan] = None) -> Dict[str, int]:
     """
     Analyze the distribution of different types of skills.
     
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
+        scan (SkillScan, optional): Precomputed scan of the text
         
     Returns:
         Dict[str, int]: Count of skills by category
     """
-    if not text:
+    document = as_document(text)
+    if not document.text:
         return {}
     
-    # Define skill categories
-    skill_categories = {
-        'programming_languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'ruby', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'lua', 'dart'],
-        'web_technologies': ['html', 'css', 'sass', 'less', 'react', 'angular', 'vue', 'jquery', 'bootstrap', 'tailwind', 'webpack', 'vite', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel', 'ruby on rails', 'asp.net'],
-        'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle', 'sql server', 'cassandra', 'elasticsearch', 'dynamodb', 'firebase', 'neo4j'],
-        'cloud_devops': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'bitbucket', 'terraform', 'ansible', 'puppet', 'chef', 'ci/cd', 'devops', 'linux', 'ubuntu', 'centos', 'redhat', 'nginx', 'apache', 'load balancing'],
-        'data_science': ['machine learning', 'deep learning', 'artificial intelligence', 'ai', 'ml', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 'jupyter', 'data analysis', 'data visualization', 'statistics', 'big data', 'hadoop', 'spark', 'hive', 'kafka', 'tableau', 'power bi'],
-        'mobile': ['android', 'ios', 'flutter', 'react native', 'swift', 'kotlin', 'xamarin', 'ionic', 'cordova', 'mobile development', 'mobile app'],
-        'soft_skills': list(SOFT_SKILLS)
-    }
+    if scan is None:
+        scan = scan_skills(document)
     
-    text_lower = text.lower()
     distribution = {}
     
-    for category, keywords in skill_categories.items():
-        count = 0
-        for keyword in keywords:
-            if len(keyword.split()) > 1:
-                if keyword in text_lower:
-                    count += 1
-            else:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, text_lower):
-                    count += 1
+    for category, keywords in SKILL_CATEGORIES.items():
+        count = sum(1 for keyword in keywords if keyword in scan.counts)
         if count > 0:
             distribution[category] = count
     
     return distribution
 
 
-def extract_skills_comprehensive(text: str, sections: Dict[str, str] = None) -> Dict[str, any]:
+def extract_skills_comprehensive(
+    text: Union[str, ResumeDocument],
+    sections: Dict[str, str] = None,
+    include_context_spans: bool = False,
+    budget: Optional[TimeBudget] = None
+) -> Dict[str, any]:
     """
     Comprehensive skill extraction with context and analysis.
     
+    The skills themselves are always extracted. Level indicators, context
+    and distribution are optional: under a spent budget they are skipped
+    (returned empty) and context stops early.
+    
     Args:
-        text (str): Cleaned resume text
+        text (Union[str, ResumeDocument]): Cleaned resume text or document
         sections (Dict[str, str], optional): Dictionary of resume sections
+        include_context_spans (bool): Also return the sentence offsets of every
+            skill under 'context_spans', e.g. for highlighting in the UI
+        budget (TimeBudget, optional): Time budget of the current analysis
         
     Returns:
         Dict[str, any]: Comprehensive skill analysis
     """
+    document = as_document(text)
+    
+    # Single matcher pass shared by every stage below
+    scan = scan_skills(document)
+    
     # Basic skill extraction
-    all_skills = extract_all_skills(text, sections)
+    all_skills = extract_all_skills(document, sections, scan)
     
     # Skill level analysis
-    skill_levels = extract_skill_level_indicators(text)
+    skill_levels = {}
+    if allows(budget, 'skill_levels'):
+        skill_levels = extract_skill_level_indicators(document, scan)
     
     # Context extraction
-    context_info = extract_skill_context(text, all_skills['all'])
+    context_info = {}
+    if allows(budget, 'skill_context'):
+        context_info = extract_skill_context(document, all_skills['all'], scan, budget)
     
     # Distribution analysis
-    distribution = analyze_skill_distribution(text)
+    distribution = {}
+    if allows(budget, 'skill_distribution'):
+        distribution = analyze_skill_distribution(document, scan)
     
-    return {
+    result = {
         'skills': all_skills,
         'skill_levels': skill_levels,
         'context': context_info,
@@ -303,4 +569,9 @@ def extract_skills_comprehensive(text: str, sections: Dict[str, str] = None) ->
             'soft_skills': len(all_skills['soft']),
             'categories_with_skills': len(distribution)
         }
-    }
\ No newline at end of file
+    }
+    
+    if include_context_spans:
+        result['context_spans'] = get_skill_sentence_spans(document, all_skills['all'], scan)
+    
+    return result
\ No newline at end of file
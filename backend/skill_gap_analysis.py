@@ -5,16 +5,14 @@ This module provides functionality to compare a user's resume skills
 with required skills for a target role and generate skill gap analysis.
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+import heapq
+from typing import Dict, List, Sequence, Optional
 from dataclasses import dataclass
-from enum import Enum
 
-
-class RecommendationLevel(Enum):
-    """Recommendation levels based on skill match percentage."""
-    BEGINNER = "Beginner"
-    INTERMEDIATE = "Intermediate"
-    ADVANCED = "Advanced"
+from cohort_analysis import CohortAnalysis, analyze_cohort, build_weight_matrix
+from compiled_roles import DEFAULT_SKILL_CREDIT, CompiledRole, RecommendationLevel, has_skill_levels, skill_credits
+from role_catalog import load_role_catalog
+from skill_normalization import normalize_skill, skill_mask
 
 
 @dataclass
@@ -25,56 +23,58 @@ class SkillGapAnalysisResult:
     missing_skills: List[str]
     match_percentage: float
     recommendation_level: RecommendationLevel
+    weighted_score: float = 0.0
+    skill_levels_available: bool = False
 
 
 class SkillGapAnalyzer:
     """Main class for skill gap analysis."""
     
-    def __init__(self):
-        """Initialize the skill gap analyzer with role-to-skills mapping."""
-        self.role_skills_mapping = {
-            "Frontend Developer": [
-                "HTML", "CSS", "JavaScript", "React", "Vue", "Angular",
-                "TypeScript", "Git", "CSS Frameworks", "Responsive Design",
-                "APIs", "Webpack", "Node.js", "UI/UX Basics"
-            ],
-            "Backend Developer": [
-                "Python", "Java", "Node.js", "SQL", "REST APIs", "GraphQL",
-                "Database Design", "Authentication", "Security", "Docker",
-                "AWS", "Microservices", "Git", "Linux", "Testing"
-            ],
-            "Data Scientist": [
-                "Python", "Pandas", "NumPy", "Machine Learning", "SQL",
-                "Statistics", "Data Visualization", "R", "TensorFlow",
-                "PyTorch", "Data Cleaning", "Big Data", "Git", "Jupyter"
-            ],
-            "Full Stack Developer": [
-                "HTML", "CSS", "JavaScript", "React", "Node.js", "Python",
-                "SQL", "REST APIs", "Git", "Database Design", "Authentication",
-                "Docker", "AWS", "Testing", "Agile", "Problem Solving"
-            ],
-            "Mobile Developer": [
-                "Swift", "Kotlin", "Java", "React Native", "Flutter",
-                "iOS Development", "Android Development", "APIs",
-                "UI/UX Design", "Git", "Testing", "App Store Guidelines"
-            ],
-            "DevOps Engineer": [
-                "Docker", "Kubernetes", "AWS", "Linux", "Git", "CI/CD",
-                "Monitoring", "Scripting", "Infrastructure as Code",
-                "Security", "Networking", "Troubleshooting", "Automation"
-            ],
-            "UI/UX Designer": [
-                "Figma", "Adobe XD", "Sketch", "User Research", "Wireframing",
-                "Prototyping", "User Testing", "Design Systems", "HTML",
-                "CSS", "JavaScript Basics", "Communication", "Problem Solving"
-            ],
-            "Product Manager": [
-                "Product Strategy", "Market Research", "User Stories",
-                "Agile", "Scrum", "Kanban", "Analytics", "Communication",
-                "Leadership", "Project Management", "Data Analysis",
-                "Stakeholder Management"
-            ]
-        }
+    def __init__(self, catalog_path: Optional[str] = None, default_skill_credit: float = DEFAULT_SKILL_CREDIT):
+        """
+        Initialize the skill gap analyzer with role-to-skills mapping.
+        
+        Role requirements come from the compiled role catalog, which is
+        memory-mapped and compiled from data/role_requirements.json first if
+        missing or stale (see role_catalog).
+        
+        Args:
+            catalog_path (str, optional): Compiled role catalog, ROLE_CATALOG_PATH if None
+            default_skill_credit (float): Weighted-score credit of a resume skill with no
+                stated proficiency level, above 0 and at most 1
+        
+        Raises:
+            ValueError: If default_skill_credit is out of range
+        """
+        if not 0 < default_skill_credit <= 1:
+            raise ValueError(f"default_skill_credit must be above 0 and at most 1, got {default_skill_credit}")
+        self.default_skill_credit = default_skill_credit
+        
+        # Compiled roles by name and by lowercase name, updated by add_role_skills.
+        # Skill ids start as the catalog's and only grow, so masks stay valid.
+        with load_role_catalog(catalog_path) as catalog:
+            skill_keys = catalog.skill_keys
+            self._skill_ids: Dict[str, int] = {key: skill_id for skill_id, key in enumerate(skill_keys)}
+            self._compiled_roles: Dict[str, CompiledRole] = {
+                requirements.name: CompiledRole.from_ids(
+                    requirements.name, requirements.skills, requirements.skill_ids,
+                    requirements.weights, skill_keys
+                )
+                for requirements in catalog
+            }
+        
+        self.role_skills_mapping = {role: list(compiled.skills) for role, compiled in self._compiled_roles.items()}
+        self._index_roles()
+        
+        # Dense roles x skills weight matrix for cohort analysis, built on first use
+        self._weight_matrix = None
+        self._weight_rows: Dict[str, int] = {}
+    
+    def _index_roles(self) -> None:
+        """Rebuild the case-insensitive role index; the first role with a given lowercase name wins."""
+        self._compiled_roles_lower: Dict[str, CompiledRole] = {}
+        for role, compiled in self._compiled_roles.items():
+            self._compiled_roles_lower.setdefault(role.lower(), compiled)
     
     def normalize_skill(self, skill: str) -> str:
         """
@@ -86,42 +86,7 @@ class SkillGapAnalyzer:
         Returns:
             str: Normalized skill string
         """
-        if not skill or not isinstance(skill, str):
-            return ""
-        
-        # Convert to lowercase and remove extra whitespace
-        normalized = skill.lower().strip()
-        
-        # Remove common variations and aliases
-        # This helps with matching skills like "JS" vs "JavaScript"
-        skill_aliases = {
-            'js': 'javascript',
-            'reactjs': 'react',
-            'vuejs': 'vue',
-            'angularjs': 'angular',
-            'node': 'node.js',
-            'python3': 'python',
-            'py': 'python',
-            'sql db': 'sql',
-            'nosql': 'database',
-            'git scm': 'git',
-            'github': 'git',
-            'docker container': 'docker',
-            'k8s': 'kubernetes',
-            'aws cloud': 'aws',
-            'azure cloud': 'azure',
-            'gcp cloud': 'gcp',
-            'ml': 'machine learning',
-            'ai': 'artificial intelligence',
-            'ui': 'user interface',
-            'ux': 'user experience'
-        }
-        
-        # Check for aliases
-        if normalized in skill_aliases:
-            return skill_aliases[normalized]
-        
-        return normalized
+        return normalize_skill(skill)
     
     def get_required_skills(self, target_role: str) -> List[str]:
         """
@@ -133,32 +98,44 @@ class SkillGapAnalyzer:
         Returns:
             List[str]: List of required skills for the role
         """
-        # Normalize the role name for lookup
-        normalized_role = target_role.lower().strip()
-        
-        # Try exact match first
-        if target_role in self.role_skills_mapping:
-            return self.role_skills_mapping[target_role]
-        
-        # Try case-insensitive match
-        for role, skills in self.role_skills_mapping.items():
-            if role.lower() == normalized_role:
-                return skills
+        compiled = self.get_compiled_role(target_role)
+        return list(compiled.skills) if compiled else []
+    
+    def get_compiled_role(self, target_role: str) -> Optional[CompiledRole]:
+        """
+        Get the compiled requirements of a target role.
         
-        # If no match found, return empty list
-        return []
+        Args:
+            target_role (str): Target job role, matched exactly or case-insensitively
+            
+        Returns:
+            Optional[CompiledRole]: Compiled role, or None if the role is unknown
+        """
+        # Try exact match first, then case-insensitive match
+        compiled = self._compiled_roles.get(target_role)
+        if compiled is None:
+            compiled = self._compiled_roles_lower.get(target_role.lower().strip())
+        return compiled
     
     def analyze_skill_gap(
         self, 
         resume_skills: List[str], 
-        target_role: str
+        target_role: str,
+        skill_levels: Optional[Dict[str, List[str]]] = None
     ) -> SkillGapAnalysisResult:
         """
         Analyze skill gaps between resume skills and target role requirements.
         
+        match_percentage counts every required skill equally. weighted_score
+        weighs them by tier (core, important, nice to have) and gives partial
+        credit to skills the resume states a lower proficiency level for;
+        skills with no stated level get default_skill_credit.
+        
         Args:
             resume_skills (List[str]): Skills extracted from resume
             target_role (str): Target job role
+            skill_levels (Dict[str, List[str]], optional): Skills per proficiency level
+                from resume analysis, see skill_credits
             
         Returns:
             SkillGapAnalysisResult: Analysis result with matched/missing skills
@@ -170,54 +147,112 @@ class SkillGapAnalyzer:
         if not target_role:
             raise ValueError("Target role is required")
         
-        # Get required skills for the target role
-        required_skills = self.get_required_skills(target_role)
+        # Get the compiled requirements for the target role
+        role = self.get_compiled_role(target_role)
         
-        if not required_skills:
+        if not role or not role.skills:
             raise ValueError(f"Role '{target_role}' not found in skill mapping")
         
-        # Normalize resume skills
-        normalized_resume_skills = set()
-        for skill in resume_skills:
-            normalized_skill = self.normalize_skill(skill)
-            if normalized_skill:  # Only add non-empty skills
-                normalized_resume_skills.add(normalized_skill)
-        
-        # Normalize required skills
-        normalized_required_skills = set()
-        for skill in required_skills:
-            normalized_skill = self.normalize_skill(skill)
-            if normalized_skill:  # Only add non-empty skills
-                normalized_required_skills.add(normalized_skill)
-        
-        # Find matched skills (intersection)
-        matched_skills_normalized = normalized_resume_skills.intersection(normalized_required_skills)
-        
-        # Find missing skills (required but not in resume)
-        missing_skills_normalized = normalized_required_skills - normalized_resume_skills
-        
-        # Convert back to original format for matched skills
-        matched_skills = []
-        for required_skill in required_skills:
-            normalized_required = self.normalize_skill(required_skill)
-            if normalized_required in matched_skills_normalized:
-                matched_skills.append(required_skill)
-        
-        # Convert back to original format for missing skills
-        missing_skills = []
-        for required_skill in required_skills:
-            normalized_required = self.normalize_skill(required_skill)
-            if normalized_required in missing_skills_normalized:
-                missing_skills.append(required_skill)
+        # Normalize resume skills once; required skills were normalized at compile time
+        credits = skill_credits(resume_skills, skill_levels, self.default_skill_credit)
+        return self._build_result(role, target_role, credits, has_skill_levels(skill_levels))
+    
+    def rank_roles(self, resume_skills: List[str], top_k: int = 5,
+                   skill_levels: Optional[Dict[str, List[str]]] = None) -> List[SkillGapAnalysisResult]:
+        """
+        Rank every role by how well a resume matches it.
+        
+        The resume's skills are normalized once and encoded as a bitmask over
+        the skill ids shared by all compiled roles, so each role's match count
+        is a single popcount. Matched and missing lists are only built for the
+        returned roles.
         
-        # Calculate match percentage
-        total_required = len(required_skills)
-        matched_count = len(matched_skills)
+        Args:
+            resume_skills (List[str]): Skills extracted from resume
+            top_k (int): Number of roles to return
+            skill_levels (Dict[str, List[str]], optional): Skills per proficiency level,
+                used for the weighted scores of the returned roles
+            
+        Returns:
+            List[SkillGapAnalysisResult]: Best matching roles by match percentage,
+                ties kept in role order
+        """
+        credits = skill_credits(resume_skills or [], skill_levels, self.default_skill_credit)
+        levels_available = has_skill_levels(skill_levels)
+        resume_keys = frozenset(credits)
+        resume_mask = skill_mask(resume_keys, self._skill_ids)
+        
+        scored = (
+            (role.match_count(resume_mask, resume_keys) / len(role.skills), role)
+            for role in self._compiled_roles.values() if role.skills
+        )
+        top_roles = heapq.nlargest(top_k, scored, key=lambda item: item[0])
         
-        if total_required == 0:
-            match_percentage = 0.0
-        else:
-            match_percentage = (matched_count / total_required) * 100
+        return [self._build_result(role, role.name, credits, levels_available) for _, role in top_roles]
+    
+    def analyze_cohort(self, user_ids: Sequence[str], user_skills: Sequence[List[str]],
+                       target_roles: Optional[List[str]] = None,
+                       user_skill_levels: Optional[Sequence[Optional[Dict[str, List[str]]]]] = None) -> CohortAnalysis:
+        """
+        Analyze skill gaps of many users against many roles at once.
+        
+        Requires NumPy and SciPy; see cohort_analysis.analyze_cohort.
+        
+        Args:
+            user_ids (Sequence[str]): User identifiers
+            user_skills (Sequence[List[str]]): Resume skills of each user, aligned with user_ids
+            target_roles (List[str], optional): Roles to analyze, every available role if None
+            user_skill_levels (Sequence[Dict[str, List[str]]], optional): Skills per proficiency
+                level of each user, aligned with user_ids
+            
+        Returns:
+            CohortAnalysis: Match matrices, recommendation levels and missing-skill frequencies
+            
+        Raises:
+            ValueError: If the inputs are misaligned or a role is unknown
+        """
+        if len(user_ids) != len(user_skills):
+            raise ValueError("user_ids and user_skills must have the same length")
+        
+        if user_skill_levels is not None and len(user_skill_levels) != len(user_ids):
+            raise ValueError("user_skill_levels must have the same length as user_ids")
+        
+        if target_roles is None:
+            target_roles = self.get_available_roles()
+        
+        roles = []
+        for target_role in target_roles:
+            role = self.get_compiled_role(target_role) if isinstance(target_role, str) else None
+            if not role or not role.skills:
+                raise ValueError(f"Role '{target_role}' not found in skill mapping")
+            roles.append(role)
+        
+        if self._weight_matrix is None:
+            self._weight_rows = {name: row for row, name in enumerate(self._compiled_roles)}
+            self._weight_matrix = build_weight_matrix(list(self._compiled_roles.values()), self._skill_ids)
+        weights = self._weight_matrix[[self._weight_rows[role.name] for role in roles]]
+        
+        return analyze_cohort(user_ids, user_skills, roles, self._skill_ids, weights, user_skill_levels,
+                              self.default_skill_credit)
+    
+    def _build_result(self, role: CompiledRole, target_role: str,
+                      credits: Dict[str, float], levels_available: bool = False) -> SkillGapAnalysisResult:
+        """
+        Compare normalized resume skills with a compiled role.
+        
+        Args:
+            role (CompiledRole): Compiled role requirements
+            target_role (str): Role name reported in the result
+            credits (Dict[str, float]): Credit per normalized resume skill, from skill_credits
+            levels_available (bool): Whether the credits used stated proficiency levels
+            
+        Returns:
+            SkillGapAnalysisResult: Analysis result with matched/missing skills
+        """
+        matched_skills, missing_skills = role.split(frozenset(credits))
+        
+        # Calculate match percentage
+        match_percentage = (len(matched_skills) / len(role.skills)) * 100
         
         # Determine recommendation level
         recommendation_level = self._get_recommendation_level(match_percentage)
@@ -227,7 +262,9 @@ class SkillGapAnalyzer:
             matched_skills=matched_skills,
             missing_skills=missing_skills,
             match_percentage=round(match_percentage, 2),
-            recommendation_level=recommendation_level
+            recommendation_level=recommendation_level,
+            weighted_score=round(role.weighted_score(credits), 2),
+            skill_levels_available=levels_available
         )
     
     def _get_recommendation_level(self, match_percentage: float) -> RecommendationLevel:
@@ -256,18 +293,23 @@ class SkillGapAnalyzer:
         """
         return list(self.role_skills_mapping.keys())
     
-    def add_role_skills(self, role: str, skills: List[str]) -> None:
+    def add_role_skills(self, role: str, skills: List[str], weights: Optional[List[float]] = None) -> None:
         """
         Add or update skills for a role.
         
         Args:
             role (str): Role name
             skills (List[str]): List of skills for the role
+            weights (List[float], optional): Weight of each skill for weighted scoring, 1.0 each if None
         """
         if not role or not skills:
             raise ValueError("Role and skills are required")
         
+        compiled = CompiledRole.compile(role, skills, self._skill_ids, weights)
         self.role_skills_mapping[role] = skills
+        self._compiled_roles[role] = compiled
+        self._index_roles()
+        self._weight_matrix = None
     
     def to_dict(self, result: SkillGapAnalysisResult) -> Dict:
         """
@@ -284,6 +326,8 @@ class SkillGapAnalyzer:
             "matched_skills": result.matched_skills,
             "missing_skills": result.missing_skills,
             "match_percentage": result.match_percentage,
+            "weighted_score": result.weighted_score,
+            "skill_levels_available": result.skill_levels_available,
             "recommendation_level": result.recommendation_level.value
         }
 
@@ -295,8 +339,10 @@ def create_skill_gap_analysis_endpoint(app):
     Args:
         app: Flask application instance
     """
-    from flask import request
-    analyzer = SkillGapAnalyzer()
+    from flask import Response, request
+    analyzer = SkillGapAnalyzer(
+        default_skill_credit=app.config.get('SKILL_GAP_DEFAULT_CREDIT', DEFAULT_SKILL_CREDIT)
+    )
     
     @app.route('/skill-gap-analysis', methods=['POST'])
     def skill_gap_analysis():
@@ -305,7 +351,8 @@ def create_skill_gap_analysis_endpoint(app):
         
         Expects JSON with:
         - target_role: string
-        - extracted_resume_data: object with skills array
+        - extracted_resume_data: object with skills array and optional skill_levels
+          object mapping proficiency levels to skills
         
         Returns:
             JSON response with skill gap analysis results
@@ -342,6 +389,7 @@ def create_skill_gap_analysis_endpoint(app):
             
             # Extract skills from resume data
             resume_skills = resume_data.get('skills', [])
+            skill_levels = resume_data.get('skill_levels')
             
             if not isinstance(resume_skills, list):
                 return {
@@ -350,8 +398,15 @@ def create_skill_gap_analysis_endpoint(app):
                     'message': 'skills must be an array'
                 }, 400
             
+            if skill_levels is not None and not isinstance(skill_levels, dict):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'skill_levels must be an object'
+                }, 400
+            
             # Perform skill gap analysis
-            result = analyzer.analyze_skill_gap(resume_skills, target_role)
+            result = analyzer.analyze_skill_gap(resume_skills, target_role, skill_levels)
             
             # Convert result to dictionary
             result_dict = analyzer.to_dict(result)
@@ -375,6 +430,168 @@ def create_skill_gap_analysis_endpoint(app):
                 'message': f'An error occurred during analysis: {str(e)}'
             }, 500
     
+    @app.route('/skill-gap-analysis/rank', methods=['POST'])
+    def skill_gap_ranking():
+        """
+        API endpoint ranking every available role against a resume.
+        
+        Expects JSON with:
+        - extracted_resume_data: object with skills array and optional skill_levels
+        - top_k: optional number of roles to return (default 5)
+        
+        Returns:
+            JSON response with the best matching roles, each with its skill gap analysis
+        """
+        try:
+            data = request.get_json(silent=True)
+            
+            if not data:
+                return {
+                    'success': False,
+                    'error': 'Invalid request',
+                    'message': 'Request must contain JSON data'
+                }, 400
+            
+            resume_data = data.get('extracted_resume_data')
+            top_k = data.get('top_k', 5)
+            
+            if not resume_data:
+                return {
+                    'success': False,
+                    'error': 'Missing field',
+                    'message': 'extracted_resume_data is required'
+                }, 400
+            
+            resume_skills = resume_data.get('skills', [])
+            skill_levels = resume_data.get('skill_levels')
+            
+            if not isinstance(resume_skills, list):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'skills must be an array'
+                }, 400
+            
+            if skill_levels is not None and not isinstance(skill_levels, dict):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'skill_levels must be an object'
+                }, 400
+            
+            if not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1:
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'top_k must be a positive integer'
+                }, 400
+            
+            results = analyzer.rank_roles(resume_skills, top_k, skill_levels)
+            
+            return {
+                'success': True,
+                'data': {
+                    'rankings': [analyzer.to_dict(result) for result in results],
+                    'total_roles': len(analyzer.get_available_roles())
+                }
+            }, 200
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': 'Server error',
+                'message': f'An error occurred during ranking: {str(e)}'
+            }, 500
+    
+    @app.route('/skill-gap-analysis/cohort', methods=['POST'])
+    def skill_gap_cohort_analysis():
+        """
+        API endpoint for skill gap analysis of a whole cohort.
+        
+        Expects JSON with:
+        - users: array of objects with user_id, skills array and optional skill_levels
+        - target_roles: optional array of roles (default: every available role)
+        - format: optional "ndjson" (default) or "csv"
+        
+        Returns:
+            Streamed NDJSON with one line per user and role followed by per-role
+            summaries with missing-skill frequencies, or CSV with one row per
+            user and role
+        """
+        try:
+            data = request.get_json(silent=True)
+            
+            if not data:
+                return {
+                    'success': False,
+                    'error': 'Invalid request',
+                    'message': 'Request must contain JSON data'
+                }, 400
+            
+            users = data.get('users')
+            target_roles = data.get('target_roles')
+            output_format = data.get('format', 'ndjson')
+            
+            if not isinstance(users, list) or not users:
+                return {
+                    'success': False,
+                    'error': 'Missing field',
+                    'message': 'users must be a non-empty array'
+                }, 400
+            
+            if any(not isinstance(user, dict) or not isinstance(user.get('skills', []), list) for user in users):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'each user must be an object with a skills array'
+                }, 400
+            
+            if any(not isinstance(user.get('skill_levels', {}), dict) for user in users):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'skill_levels must be an object'
+                }, 400
+            
+            if target_roles is not None and not isinstance(target_roles, list):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'target_roles must be an array'
+                }, 400
+            
+            if output_format not in ('ndjson', 'csv'):
+                return {
+                    'success': False,
+                    'error': 'Invalid data',
+                    'message': 'format must be "ndjson" or "csv"'
+                }, 400
+            
+            cohort = analyzer.analyze_cohort(
+                [user.get('user_id', index) for index, user in enumerate(users)],
+                [user.get('skills', []) for user in users],
+                target_roles,
+                [user.get('skill_levels') for user in users]
+            )
+            
+            if output_format == 'csv':
+                return Response(cohort.iter_csv(), mimetype='text/csv')
+            return Response(cohort.iter_ndjson(), mimetype='application/x-ndjson')
+            
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': 'Validation error',
+                'message': str(e)
+            }, 400
+        
+        except Exception as e:
+            return {
+                'success': False,
+                'error': 'Server error',
+                'message': f'An error occurred during cohort analysis: {str(e)}'
+            }, 500
+    
     @app.route('/available-roles', methods=['GET'])
     def get_available_roles():
         """
@@ -414,5 +631,7 @@ def get_sample_skill_gap_analysis() -> Dict:
         "matched_skills": ["HTML", "CSS", "JavaScript", "React"],
         "missing_skills": ["Vue", "Angular", "TypeScript", "Git", "CSS Frameworks", "Responsive Design", "APIs", "Webpack", "Node.js", "UI/UX Basics"],
         "match_percentage": 40.0,
+        "weighted_score": 30.0,
+        "skill_levels_available": False,
         "recommendation_level": "Intermediate"
     }
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Skill Matcher for Resume Analysis
+
+This module provides a compiled multi-pattern matcher (Aho-Corasick automaton)
+that finds every skill keyword in a text in a single linear pass, with
+word-boundary semantics, returning match spans and counts.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple
+
+from skill_keywords import TECHNICAL_SKILLS, SOFT_SKILLS
+
+
+class SkillMatch(NamedTuple):
+    """A single skill occurrence in the lowercased text."""
+    skill: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character counts as a word character (like regex \\w)."""
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over a fixed set of lowercase skill keywords."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords (Iterable[str]): Skill keywords to match (matched case-insensitively)
+        """
+        self.keywords = frozenset(keyword.lower() for keyword in keywords if keyword)
+
+        # goto[state] maps a character to the next state, fail[state] is the
+        # failure link and output[state] lists the keywords ending at state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword in sorted(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword)
+
+        # Breadth-first construction of failure links
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text_lower: str) -> Iterator[SkillMatch]:
+        """
+        Yield every keyword occurrence bounded by non-word characters.
+
+        Overlapping occurrences of different keywords (e.g. "react" and
+        "react native") are all reported. Matches are yielded in order of
+        their end offset.
+
+        Args:
+            text_lower (str): Lowercased text to scan
+
+        Yields:
+            SkillMatch: Keyword with its start and end offsets
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        text_length = len(text_lower)
+        state = 0
+
+        for index, char in enumerate(text_lower):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            end = index + 1
+            if end < text_length and _is_word_char(text_lower[end]):
+                continue
+
+            for keyword in output[state]:
+                start = end - len(keyword)
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                yield SkillMatch(keyword, start, end)
+
+    def find_all(self, text_lower: str) -> List[SkillMatch]:
+        """
+        Find all keyword occurrences ordered by start offset.
+
+        Args:
+            text_lower (str): Lowercased text to scan
+
+        Returns:
+            List[SkillMatch]: Matches sorted by (start, end)
+        """
+        return sorted(self.iter_matches(text_lower), key=lambda match: (match.start, match.end))
+
+
+def count_matches(matches: Iterable[SkillMatch]) -> Dict[str, int]:
+    """
+    Count occurrences per skill.
+
+    Args:
+        matches (Iterable[SkillMatch]): Matches returned by a SkillMatcher
+
+    Returns:
+        Dict[str, int]: Number of occurrences of each skill found
+    """
+    counts: Dict[str, int] = {}
+    for match in matches:
+        counts[match.skill] = counts.get(match.skill, 0) + 1
+    return counts
+
+
+@lru_cache(maxsize=32)
+def get_matcher(keywords: FrozenSet[str]) -> SkillMatcher:
+    """
+    Get a compiled matcher for a keyword set, building it on first use.
+
+    Args:
+        keywords (FrozenSet[str]): Skill keywords
+
+    Returns:
+        SkillMatcher: Compiled matcher
+    """
+    return SkillMatcher(keywords)
+
+
+def get_default_matcher() -> SkillMatcher:
+    """
+    Get the matcher compiled from the technical and soft skill vocabularies.
+
+    Returns:
+        SkillMatcher: Compiled matcher over TECHNICAL_SKILLS and SOFT_SKILLS
+    """
+    return get_matcher(frozenset(TECHNICAL_SKILLS | SOFT_SKILLS))
@@ -0,0 +1,104 @@
+"""
+Skill Normalization
+
+This module holds the rules that turn a skill label into the key skills are
+compared by: lowercased, stripped, with common aliases resolved. Role
+catalogs, the skill gap analyzer and cohort analysis all build on these keys,
+so this module imports none of them.
+"""
+
+import hashlib
+import json
+from typing import Dict, FrozenSet, Iterable
+
+
+# Bump whenever normalize_skill changes in a way the alias table does not
+# show, so keys stored by compiled role catalogs are rebuilt
+NORMALIZATION_VERSION = 1
+
+# Common variations and aliases, e.g. "JS" vs "JavaScript"
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'reactjs': 'react',
+    'vuejs': 'vue',
+    'angularjs': 'angular',
+    'node': 'node.js',
+    'python3': 'python',
+    'py': 'python',
+    'sql db': 'sql',
+    'nosql': 'database',
+    'git scm': 'git',
+    'github': 'git',
+    'docker container': 'docker',
+    'k8s': 'kubernetes',
+    'aws cloud': 'aws',
+    'azure cloud': 'azure',
+    'gcp cloud': 'gcp',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'ui': 'user interface',
+    'ux': 'user experience'
+}
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill string for comparison.
+    
+    Args:
+        skill (str): Raw skill string
+        
+    Returns:
+        str: Lowercase, stripped skill with aliases resolved, or "" if not a string
+    """
+    if not skill or not isinstance(skill, str):
+        return ""
+    
+    normalized = skill.lower().strip()
+    return SKILL_ALIASES.get(normalized, normalized)
+
+
+def normalize_skill_set(skills: Iterable[str]) -> FrozenSet[str]:
+    """
+    Normalize a list of skills into a set of comparison keys.
+    
+    Args:
+        skills (Iterable[str]): Raw skill strings
+        
+    Returns:
+        FrozenSet[str]: Non-empty normalized skills
+    """
+    return frozenset(key for key in map(normalize_skill, skills) if key)
+
+
+def skill_mask(keys: Iterable[str], skill_ids: Dict[str, int]) -> int:
+    """
+    Encode normalized skills as a bitmask over a skill-id space.
+    
+    Args:
+        keys (Iterable[str]): Normalized skills
+        skill_ids (Dict[str, int]): Bit index of each known skill; unknown skills are ignored
+        
+    Returns:
+        int: Bitmask with the bit of each known skill set
+    """
+    mask = 0
+    for key in keys:
+        skill_id = skill_ids.get(key)
+        if skill_id is not None:
+            mask |= 1 << skill_id
+    return mask
+
+
+def get_normalization_fingerprint() -> bytes:
+    """
+    Fingerprint the skill normalization rules.
+    
+    Skill keys stored elsewhere, e.g. in a compiled role catalog, are only
+    valid for the rules they were normalized with.
+    
+    Returns:
+        bytes: SHA-256 digest of NORMALIZATION_VERSION and the alias table
+    """
+    rules = {'version': NORMALIZATION_VERSION, 'aliases': SKILL_ALIASES}
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).digest()
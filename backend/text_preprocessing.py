@@ -67,12 +67,14 @@ def load_spacy_model():
         )
 
 
-def clean_text(text: str) -> str:
+def clean_text(text: str, preserve_lines: bool = False) -> str:
     """
     Clean and normalize text by removing extra whitespace and special characters.
     
     Args:
         text (str): Raw text to clean
+        preserve_lines (bool): Clean each line separately and keep non-empty
+            lines separated by newlines instead of collapsing everything
         
     Returns:
         str: Cleaned text
@@ -80,6 +82,10 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
+    if preserve_lines:
+        cleaned_lines = (clean_text(line) for line in text.splitlines())
+        return '\n'.join(line for line in cleaned_lines if line)
+    
     # Remove extra whitespace
     text = re.sub(r'\s+', ' ', text)
     
@@ -90,6 +96,25 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 
+def lower_aligned(text: str) -> str:
+    """
+    Lowercase text so that every offset into the result is valid in the original.
+    
+    A few characters lowercase to more than one code point (e.g. 'İ' to 'i'
+    plus a combining dot); only the first is kept for those.
+    
+    Args:
+        text (str): Text to lowercase
+        
+    Returns:
+        str: Lowercased text of the same length
+    """
+    lower = text.lower()
+    if len(lower) == len(text):
+        return lower
+    return ''.join(char.lower()[0] for char in text)
+
+
 def extract_emails(text: str) -> List[str]:
     """
     Extract email addresses from text.
@@ -165,98 +190,127 @@ def extract_dates(text: str) -> List[str]:
     return dates
 
 
-def extract_sections(text: str) -> Dict[str, str]:
+# Common resume section headers
+SECTION_HEADERS = {
+    'contact': r'contact|email|phone|address',
+    'summary': r'summary|objective|profile',
+    'experience': r'experience|work experience|employment history',
+    'education': r'education|academic background|degrees',
+    'skills': r'skills|competencies|technical skills',
+    'projects': r'projects|portfolio|work samples',
+    'certifications': r'certifications|certificates|licenses',
+    'achievements': r'achievements|awards|honors',
+    'languages': r'languages',
+    'references': r'references'
+}
+
+# All header patterns combined into one alternation, one named group per section
+_SECTION_HEADER_PATTERN = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_HEADERS.items())
+)
+
+
+def find_section_spans(text: str, text_lower: Optional[str] = None) -> List[Tuple[str, int, int]]:
+    """
+    Scan text once for section headers and split it into section spans.
+    
+    Consecutive header hits for the same section are merged, so each span
+    runs from a header to the next header of a different section.
+    
+    Args:
+        text (str): Full resume text
+        text_lower (str, optional): Already lowercased text
+        
+    Returns:
+        List[Tuple[str, int, int]]: Ordered (section, start, end) spans
+    """
+    if text_lower is None:
+        text_lower = lower_aligned(text)
+    
+    spans = []
+    
+    for match in _SECTION_HEADER_PATTERN.finditer(text_lower):
+        section_name = match.lastgroup
+        if spans:
+            previous_name, previous_start, _ = spans[-1]
+            if previous_name == section_name:
+                continue
+            spans[-1] = (previous_name, previous_start, match.start())
+        spans.append((section_name, match.start(), len(text)))
+    
+    return spans
+
+
+def extract_sections(text: str, spans: Optional[List[Tuple[str, int, int]]] = None) -> Dict[str, str]:
     """
     Extract different sections from resume text.
     
+    Each section starts at the first occurrence of one of its headers and ends
+    at the next header of another section.
+    
     Args:
         text (str): Full resume text
+        spans (List[Tuple[str, int, int]], optional): Precomputed section spans
         
     Returns:
         Dict[str, str]: Dictionary of section names and their content
     """
-    # Common resume section headers
-    section_headers = {
-        'contact': r'contact|email|phone|address',
-        'summary': r'summary|objective|profile',
-        'experience': r'experience|work experience|employment history',
-        'education': r'education|academic background|degrees',
-        'skills': r'skills|competencies|technical skills',
-        'projects': r'projects|portfolio|work samples',
-        'certifications': r'certifications|certificates|licenses',
-        'achievements': r'achievements|awards|honors',
-        'languages': r'languages',
-        'references': r'references'
-    }
+    if spans is None:
+        spans = find_section_spans(text)
+    
+    first_spans = {}
+    for section_name, start_pos, end_pos in spans:
+        first_spans.setdefault(section_name, (start_pos, end_pos))
     
     sections = {}
-    text_lower = text.lower()
-    
-    for section_name, pattern in section_headers.items():
-        # Find section start
-        match = re.search(pattern, text_lower)
-        if match:
-            start_pos = match.start()
-            
-            # Find next section or end of text
-            next_sections = []
-            for other_pattern in section_headers.values():
-                if other_pattern != pattern:
-                    other_matches = re.finditer(other_pattern, text_lower[start_pos + len(match.group()):])
-                    for m in other_matches:
-                        next_sections.append(start_pos + len(match.group()) + m.start())
-            
-            if next_sections:
-                end_pos = min(next_sections)
-            else:
-                end_pos = len(text)
-            
-            # Extract section content
-            section_content = text[start_pos:end_pos].strip()
-            sections[section_name] = section_content
+    for section_name in SECTION_HEADERS:
+        if section_name in first_spans:
+            start_pos, end_pos = first_spans[section_name]
+            sections[section_name] = text[start_pos:end_pos].strip()
     
     return sections
 
 
+def extract_contact_info(cleaned_text: str) -> Dict[str, List[str]]:
+    """
+    Extract emails, phone numbers, URLs and dates from cleaned text.
+    
+    Args:
+        cleaned_text (str): Cleaned resume text
+        
+    Returns:
+        Dict[str, List[str]]: Matches under 'emails', 'phone_numbers', 'urls' and 'dates'
+    """
+    return {
+        'emails': extract_emails(cleaned_text),
+        'phone_numbers': extract_phone_numbers(cleaned_text),
+        'urls': extract_urls(cleaned_text),
+        'dates': extract_dates(cleaned_text)
+    }
+
+
 def preprocess_resume_text(text: str) -> Dict[str, any]:
     """
     Main preprocessing function that combines all preprocessing steps.
     
+    Works on plain strings; resume_document.preprocess_resume does the same
+    while also building the shared ResumeDocument, and accepts text chunks.
+    
     Args:
         text (str): Raw resume text
         
     Returns:
         Dict[str, any]: Preprocessed data including cleaned text, sections, and extracted info
     """
-    if not text:
-        return {
-            'cleaned_text': '',
-            'sections': {},
-            'emails': [],
-            'phone_numbers': [],
-            'urls': [],
-            'dates': []
-        }
-    
-    # Clean the text
-    cleaned_text = clean_text(text)
-    
-    # Extract basic information
-    emails = extract_emails(cleaned_text)
-    phone_numbers = extract_phone_numbers(cleaned_text)
-    urls = extract_urls(cleaned_text)
-    dates = extract_dates(cleaned_text)
-    
-    # Extract sections
-    sections = extract_sections(cleaned_text)
+    # Clean the text once, keeping line structure for line-oriented extractors
+    cleaned_text = clean_text(text, preserve_lines=True)
+    spans = find_section_spans(cleaned_text)
     
     return {
         'cleaned_text': cleaned_text,
-        'sections': sections,
-        'emails': emails,
-        'phone_numbers': phone_numbers,
-        'urls': urls,
-        'dates': dates
+        'sections': extract_sections(cleaned_text, spans),
+        'section_spans': spans,
+        **extract_contact_info(cleaned_text)
     }
 
 
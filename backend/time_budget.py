@@ -0,0 +1,77 @@
+"""
+Analysis Time Budget
+
+This module provides the deadline shared by the stages of one resume
+analysis. Core stages always run; optional stages ask the budget before
+starting and are skipped, or stop early, once it is spent. The budget
+records which stages were degraded so the response can say so.
+"""
+
+import time
+from typing import Dict, Optional
+
+
+SKIPPED = 'skipped'
+TRUNCATED = 'truncated'
+
+
+class TimeBudget:
+    """Monotonic-clock deadline for one analysis, with a record of degraded stages."""
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Start the budget.
+
+        Args:
+            seconds (float, optional): Total time allowed, unlimited if None
+        """
+        self.seconds = seconds
+        self.deadline = time.perf_counter() + seconds if seconds is not None else None
+        self.degraded: Dict[str, str] = {}
+
+    def expired(self) -> bool:
+        """
+        Check whether the budget is spent.
+
+        Returns:
+            bool: True once the deadline has passed
+        """
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def allow(self, stage: str) -> bool:
+        """
+        Decide whether an optional stage may run, recording it as skipped if not.
+
+        Args:
+            stage (str): Name of the optional stage
+
+        Returns:
+            bool: True if the stage should run
+        """
+        if self.expired():
+            self.degraded[stage] = SKIPPED
+            return False
+        return True
+
+    def truncated(self, stage: str) -> None:
+        """
+        Record that an optional stage stopped before finishing.
+
+        Args:
+            stage (str): Name of the optional stage
+        """
+        self.degraded[stage] = TRUNCATED
+
+
+def allows(budget: Optional[TimeBudget], stage: str) -> bool:
+    """
+    Decide whether an optional stage may run under an optional budget.
+
+    Args:
+        budget (TimeBudget, optional): Budget of the current analysis, unlimited if None
+        stage (str): Name of the optional stage
+
+    Returns:
+        bool: True if the stage should run
+    """
+    return budget is None or budget.allow(stage)